@@ -0,0 +1,448 @@
+import csv
+import os
+import pickle
+import random
+import subprocess
+import sys
+
+from App import logic
+from DataStructures.Graph import union_find as uf
+from DataStructures.List import array_list as lt
+from DataStructures.Map import map_linear_probing as m
+from DataStructures.Priority_queue import priority_queue as pq
+
+HEADER = "ServiceNo,Operator,Direction,StopSequence,BusStopCode,Distance\n"
+
+SERVICES = [
+    ("10", 1, ["A", "B", "C"], [0.0, 1.5, 2.5]),
+    ("10", 2, ["C", "B", "A"], [0.0, 1.0, 2.5]),
+    ("20", 1, ["B", "D"], [0.0, 3.0]),
+    ("30", 1, ["E", "F"], [0.0, 2.0]),
+]
+
+
+def write_services(path, services=SERVICES):
+    with open(path, "w", encoding="utf-8") as output:
+        output.write(HEADER)
+        for service, direction, stops, distances in services:
+            for sequence, (stop, distance) in enumerate(zip(stops, distances), 1):
+                output.write(f"{service},SBST,{direction},{sequence},{stop},{distance}\n")
+    return str(path)
+
+
+def load(path, **load_args):
+    return logic.load_services(logic.init(), path, **load_args)
+
+
+def loaded_from_snapshot(capsys):
+    return "instantánea en disco" in capsys.readouterr().out
+
+
+def test_snapshot_round_trip(tmp_path, capsys):
+    path = write_services(tmp_path / "services.csv")
+    parsed = load(path)
+    assert not loaded_from_snapshot(capsys)
+    assert os.path.exists(logic.snapshot_path(path))
+
+    restored = load(path)
+    assert loaded_from_snapshot(capsys)
+    assert restored["connections"].num_edges == parsed["connections"].num_edges
+    assert m.size(restored["stops"]) == m.size(parsed["stops"]) == 6
+    assert logic.stop_id(restored, "D") == logic.stop_id(parsed, "D")
+    assert logic.weak_component_count(restored) == 2
+    assert logic.shortest_path_to(restored, "D", "A")[0] == 4.5
+
+
+def test_snapshot_source_changed(tmp_path, capsys):
+    path = write_services(tmp_path / "services.csv")
+    load(path)
+    capsys.readouterr()
+
+    write_services(path, SERVICES + [("40", 1, ["F", "G"], [0.0, 1.0])])
+    analyzer = load(path)
+    assert not loaded_from_snapshot(capsys)
+    assert logic.stop_id(analyzer, "G") is not None
+
+    load(path)
+    assert loaded_from_snapshot(capsys)
+
+
+def test_snapshot_version_changed(tmp_path, capsys, monkeypatch):
+    path = write_services(tmp_path / "services.csv")
+    load(path)
+    capsys.readouterr()
+
+    monkeypatch.setattr(logic, "SNAPSHOT_VERSION", logic.SNAPSHOT_VERSION + 1)
+    assert load(path) is not None
+    assert not loaded_from_snapshot(capsys)
+    load(path)
+    assert loaded_from_snapshot(capsys)
+
+
+def test_snapshot_truncated(tmp_path, capsys):
+    path = write_services(tmp_path / "services.csv")
+    load(path)
+    snapshot = logic.snapshot_path(path)
+    with open(snapshot, "r+b") as content:
+        content.truncate(os.path.getsize(snapshot) // 2)
+    capsys.readouterr()
+
+    analyzer = load(path)
+    assert analyzer is not None
+    assert not loaded_from_snapshot(capsys)
+    assert logic.weak_component_count(analyzer) == 2
+
+
+def test_snapshot_stale_code(tmp_path, capsys):
+    path = write_services(tmp_path / "services.csv")
+    snapshot = logic.snapshot_path(path)
+    for stale in (b"cApp.logic\nno_such_function\n.", b"cno_such_module\nno_such_class\n."):
+        with open(snapshot, "wb") as content:
+            content.write(logic.SNAPSHOT_HEADER.pack(logic.SNAPSHOT_MAGIC, logic.SNAPSHOT_VERSION))
+            pickle.dump(logic.source_fingerprint(path), content)
+            content.write(stale)
+        capsys.readouterr()
+
+        analyzer = load(path)
+        assert analyzer is not None
+        assert not loaded_from_snapshot(capsys)
+        assert m.size(analyzer["stops"]) == 6
+
+
+RELOAD_SCRIPT = """
+import sys
+from App import logic
+from DataStructures.List import array_list as lt
+from DataStructures.Map import map_linear_probing as m
+
+analyzer = logic.load_services(logic.init(), sys.argv[1])
+summary = {}
+for code in "ABCDEFZ":
+    routes = logic.stop_routes(analyzer, code)
+    summary[code] = (None if routes is None else
+                     [lt.get_element(routes, i)["id"] for i in range(lt.size(routes))],
+                     logic.stop_has_route(analyzer, code, "10-1"))
+sequence = m.get(analyzer["route_sequences"], "20-1")
+summary["20-1"] = list(sequence["stops"])
+
+stats = {"stops": 0, "routes": 0, "rows": 0}
+records = logic.parse_chunk([["20", "1", "3", "A", "4.0"]], (0, 1, 2, 3, 4), {"20-1": "D"})
+logic.ingest_chunk(analyzer, records, stats)
+summary["ingest"] = (stats, m.size(analyzer["stops"]), m.size(analyzer["route_sequences"]),
+                     list(m.get(analyzer["route_sequences"], "20-1")["stops"]))
+print("SUMMARY", summary)
+"""
+
+
+def run_with_hash_seed(path, seed):
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    env = dict(os.environ, PYTHONHASHSEED=str(seed))
+    result = subprocess.run([sys.executable, "-c", RELOAD_SCRIPT, path], cwd=root, env=env,
+                            capture_output=True, text=True, check=True)
+    summary = [line for line in result.stdout.splitlines() if line.startswith("SUMMARY")]
+    return "instantánea en disco" in result.stdout, summary
+
+
+def test_snapshot_other_process(tmp_path):
+    path = write_services(tmp_path / "services.csv")
+    from_snapshot, parsed = run_with_hash_seed(path, 1)
+    assert not from_snapshot
+    assert os.path.exists(logic.snapshot_path(path))
+
+    from_snapshot, restored = run_with_hash_seed(path, 2)
+    assert from_snapshot
+    assert restored == parsed
+    assert "'B': (['10-1', '10-2', '20-1'], True)" in parsed[0]
+    assert "'ingest': ({'stops': 0, 'routes': 1, 'rows': 1}, 6, 4, [1, 3, 0])" in parsed[0]
+
+
+def interleaved_services(path, num_services=12, seed=3):
+    """
+    Escribe un archivo de servicios en el que las filas de las rutas se
+    intercalan, varias rutas comparten tramos con distancias distintas y
+    una ruta empieza con StopSequence > 1
+    """
+    rnd = random.Random(seed)
+    stops = [f"S{i:02d}" for i in range(25)]
+    routes = []
+    for service in range(1, num_services + 1):
+        sequence = rnd.sample(stops, rnd.randint(3, 9))
+        for direction, ordered in ((1, sequence), (2, sequence[::-1])):
+            distances = [0.0]
+            for _ in ordered[1:]:
+                distances.append(round(distances[-1] + rnd.choice((0.5, 1.0, 1.5)), 1))
+            first = 3 if service == 1 and direction == 1 else 1
+            routes.append([(service, direction, first + position, stop, distance)
+                           for position, (stop, distance) in enumerate(zip(ordered, distances))])
+    with open(path, "w", encoding="utf-8") as output:
+        output.write(HEADER)
+        while routes:
+            route = rnd.choice(routes)
+            for _ in range(rnd.randint(1, 3)):
+                if route:
+                    service, direction, sequence, stop, distance = route.pop(0)
+                    distance = "" if sequence == 1 else distance
+                    output.write(f"{service},SBST,{direction},{sequence},{stop},{distance}\n")
+            routes = [pending for pending in routes if pending]
+    return str(path)
+
+
+def analyzer_content(analyzer):
+    graph = analyzer["connections"]
+    adjacency = [(vertex, list(graph.iter_adjacent_edges(vertex)),
+                  list(graph.iter_predecessor_edges(vertex)))
+                 for vertex in graph.all_vertices()]
+
+    stops = {}
+    for code in analyzer["stop_ids"]["codes"]:
+        stop_info = m.get(analyzer["stops"], code)
+        stops[code] = (stop_info["id"],
+                       [lt.get_element(stop_info["routes"], i)
+                        for i in range(lt.size(stop_info["routes"]))],
+                       stop_info["route_index"] is not None)
+
+    sequences = {}
+    values = m.value_set(analyzer["route_sequences"])
+    for i in range(lt.size(values)):
+        sequence = lt.get_element(values, i)
+        sequences[sequence["id"]] = (list(sequence["stops"]), list(sequence["weights"]))
+
+    queue = pq.copy(analyzer["priority_queue"])
+    drained = []
+    while not pq.is_empty(queue):
+        drained.append((pq.get_first_priority(queue), pq.remove_value(queue)))
+
+    return {
+        "codes": list(analyzer["stop_ids"]["codes"]),
+        "adjacency": adjacency,
+        "edges": graph.num_edges,
+        "labels": list(uf.labels(analyzer["connectivity"])),
+        "weak": logic.weak_component_count(analyzer),
+        "stops": stops,
+        "sequences": sequences,
+        "queue": drained,
+    }
+
+
+def test_parallel_load_matches_sequential(tmp_path):
+    path = interleaved_services(tmp_path / "services.csv")
+    sequential = logic.init()
+    sequential_stats = logic.read_services(sequential, path, chunk_size=7)
+    expected = analyzer_content(sequential)
+    assert len(expected["queue"]) > expected["edges"]
+
+    for workers in (2, 3):
+        parallel = logic.init()
+        stats = logic.read_services_parallel(parallel, path, workers)
+        assert stats == sequential_stats
+        assert analyzer_content(parallel) == expected
+
+
+def test_merge_fragments_many_ranges(tmp_path):
+    path = interleaved_services(tmp_path / "services.csv", num_services=20, seed=8)
+    sequential = logic.init()
+    sequential_stats = logic.read_services(sequential, path)
+
+    columns, ranges = logic.service_ranges(path, 40)
+    assert len(ranges) > 20
+    assert ranges[0][1] == ranges[1][0] and ranges[-1][1] == os.path.getsize(path)
+    scans = [logic.scan_fragment(path, start, end, columns) for start, end in ranges]
+    assert sum(scan["rows"] for scan in scans) == sequential_stats["rows"]
+
+    merged = logic.init()
+    tasks = logic.fragment_tasks(merged, scans)
+    assert [task["sequence"] for task in tasks[:2]] == [0, scans[0]["rows"]]
+    assert any(task["carry"] for task in tasks)
+    fragments = (logic.load_fragment(path, start, end, columns, task)
+                 for (start, end), task in zip(ranges, tasks))
+    stats = {"stops": 0, "routes": 0, "rows": 0}
+    logic.merge_fragments(merged, fragments, stats)
+    assert stats == sequential_stats
+    assert analyzer_content(merged) == analyzer_content(sequential)
+
+
+def test_stop_routes(tmp_path):
+    path = write_services(tmp_path / "services.csv", SERVICES + [
+        ("50", 1, ["B", "G", "B", "G"], [0.0, 1.0, 2.0, 3.0]),
+        ("10", 1, ["C", "B"], [0.0, 1.0]),
+    ])
+    analyzer = load(path, use_snapshot=False)
+
+    routes = logic.stop_routes(analyzer, "B")
+    assert [lt.get_element(routes, i)["id"] for i in range(lt.size(routes))] == \
+        ["10-1", "10-2", "20-1", "50-1"]
+    assert lt.get_element(routes, 3) == {"id": "50-1", "service": "50", "direction": "1"}
+    assert m.get(analyzer["stops"], "B")["route_index"] is None
+    assert logic.stop_has_route(analyzer, "B", "50-1")
+    assert not logic.stop_has_route(analyzer, "B", "30-1")
+    assert not logic.stop_has_route(analyzer, "Z", "10-1")
+    assert logic.stop_routes(analyzer, "Z") is None
+
+
+def test_stop_route_index_threshold(tmp_path, monkeypatch):
+    monkeypatch.setattr(logic, "ROUTE_INDEX_THRESHOLD", 3)
+    services = [(str(service), 1, ["H", f"S{service}"], [0.0, 1.0]) for service in range(6)]
+    path = write_services(tmp_path / "services.csv", services + services[:2])
+    analyzer = load(path, use_snapshot=False)
+
+    hub = m.get(analyzer["stops"], "H")
+    assert lt.size(hub["routes"]) == 6
+    assert m.size(hub["route_index"]) == 6
+    assert m.get(analyzer["stops"], "S0")["route_index"] is None
+    assert logic.stop_has_route(analyzer, "H", "5-1")
+    assert not logic.stop_has_route(analyzer, "H", "6-1")
+
+    parallel = logic.init()
+    logic.read_services_parallel(parallel, path, 2)
+    assert m.size(m.get(parallel["stops"], "H")["route_index"]) == 6
+    assert analyzer_content(parallel) == analyzer_content(analyzer)
+
+
+def test_stop_ids(tmp_path):
+    path = write_services(tmp_path / "services.csv")
+    analyzer = logic.init()
+    logic.read_services(analyzer, path, chunk_size=2)
+
+    assert [logic.stop_id(analyzer, code) for code in "ABCDEF"] == [0, 1, 2, 3, 4, 5]
+    assert logic.stop_id(analyzer, "Z") is None
+    for code in "ABCDEF":
+        assert logic.stop_code(analyzer, logic.stop_id(analyzer, code)) == code
+    assert m.get(analyzer["stops"], "D")["id"] == 3
+    assert analyzer["connections"].num_vertices == 6
+    assert analyzer["connections"].get_edge_weight(logic.stop_id(analyzer, "B"),
+                                                   logic.stop_id(analyzer, "D")) == 3.0
+
+
+def test_weak_components_during_load(tmp_path):
+    path = write_services(tmp_path / "services.csv", SERVICES + [("40", 1, ["F", "D"], [0.0, 1.0])])
+    with open(path, encoding="utf-8") as input_file:
+        rows = list(csv.reader(input_file))
+    columns = logic.service_columns(rows[0])
+
+    analyzer = logic.init()
+    stats = {"stops": 0, "routes": 0, "rows": 0}
+    route_prev_stops = {}
+    counts = []
+    for row in rows[1:]:
+        logic.ingest_chunk(analyzer, logic.parse_chunk([row], columns, route_prev_stops), stats)
+        counts.append(logic.weak_component_count(analyzer))
+        if row[4] == "F" and row[0] == "30":
+            assert logic.stop_component(analyzer, "E") == logic.stop_component(analyzer, "F")
+            assert logic.stop_component(analyzer, "E") != logic.stop_component(analyzer, "A")
+            assert logic.stop_component(analyzer, "C") == logic.stop_component(analyzer, "D")
+            logic.connected_components(analyzer)
+            assert list(analyzer["components"]["weak"]["id"]) == [0, 0, 0, 0, 1, 1]
+            assert logic.same_component(analyzer, "B", "D")
+            assert not logic.same_component(analyzer, "A", "E")
+
+    assert counts == [1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 1]
+    assert len({logic.stop_component(analyzer, code) for code in "ABCDEF"}) == 1
+    assert logic.stop_component(analyzer, "Z") is None
+    logic.connected_components(analyzer)
+    assert list(analyzer["components"]["weak"]["id"]) == [0] * 6
+    assert analyzer["components"]["weak"]["count"] == 1
+
+
+def test_minimum_spanning_tree_methods_agree(tmp_path):
+    path = write_services(tmp_path / "services.csv", [
+        ("5", 1, ["A", "B"], [0.0, 1.0]),
+        ("10", 1, ["A", "B", "C", "D"], [0.0, 4.0, 5.0, 9.0]),
+        ("10", 2, ["D", "C", "B", "A"], [0.0, 2.0, 3.0, 7.0]),
+        ("20", 1, ["A", "C", "A"], [0.0, 5.0, 7.5]),
+        ("30", 1, ["B", "D", "D"], [0.0, 6.0, 6.0]),
+        ("40", 1, ["E", "F"], [0.0, 1.0]),
+        ("40", 2, ["F", "E"], [0.0, 2.0]),
+    ])
+    analyzer = load(path, use_snapshot=False)
+    a, b, c, d = (logic.stop_id(analyzer, code) for code in "ABCD")
+    assert analyzer["connections"].get_edge_weight(a, b) == 4.0
+
+    graph = logic.undirected_connections(analyzer)
+    assert graph.get_edge_weight(a, b) == graph.get_edge_weight(b, a) == 1.0
+    assert graph.get_edge_weight(b, c) == 3.0
+    assert graph.get_edge_weight(a, c) == 5.0
+    assert graph.get_edge_weight(d, d) is None
+    assert graph.num_edges == 6
+
+    kruskal = logic.minimum_spanning_tree(analyzer, "kruskal")
+    prim = logic.minimum_spanning_tree(analyzer, "prim")
+    assert kruskal["weight"] == prim["weight"] == 1.0 + 3.0 + 2.0 + 1.0
+    for result in (kruskal, prim):
+        assert lt.size(result["edges"]) == 4
+        pairs = {frozenset(lt.get_element(result["edges"], i)[:2]) for i in range(4)}
+        assert pairs == {frozenset("AB"), frozenset("BC"), frozenset("CD"), frozenset("EF")}
+
+
+def test_shortest_path_to_after_mutation(tmp_path):
+    path = write_services(tmp_path / "services.csv")
+    analyzer = load(path, use_snapshot=False)
+    assert logic.shortest_path_to(analyzer, "D", "A")[0] == 4.5
+    distance, codes = logic.shortest_path_to(analyzer, "C")
+    assert (distance, codes["elements"]) == (4.0, ["A", "B", "C"])
+
+    columns = logic.service_columns(HEADER.strip().split(","))
+    rows = [["50", "SBST", "1", "1", "A", ""], ["50", "SBST", "1", "2", "G", "0.5"]]
+    logic.ingest_chunk(analyzer, logic.parse_chunk(rows, columns, {}),
+                       {"stops": 0, "routes": 0, "rows": 0})
+    assert logic.shortest_path_to(analyzer, "G") is None
+    assert logic.paths_cache_stats(analyzer)["invalidations"] == 1
+    assert logic.shortest_path_to(analyzer, "G", "A")[0] == 0.5
+    assert logic.shortest_path_to(analyzer, "D")[0] == 4.5
+
+
+def test_queries_use_frozen_graph(tmp_path):
+    path = write_services(tmp_path / "services.csv")
+    analyzer = load(path, use_snapshot=False)
+    frozen = analyzer["frozen"]
+    assert logic.is_derived_current(analyzer, "frozen")
+    assert frozen.num_edges == analyzer["connections"].num_edges
+    assert logic.stop_to_stop(analyzer, "A", "D")[0] == 4.5
+    assert logic.query_graph(analyzer) is frozen
+
+    analyzer["connections"].add_edge(logic.stop_id(analyzer, "A"), logic.stop_id(analyzer, "D"), 1.0)
+    assert not logic.is_derived_current(analyzer, "frozen")
+    assert logic.stop_to_stop(analyzer, "A", "D")[0] == 1.0
+    assert analyzer["frozen"] is not frozen
+    assert logic.is_derived_current(analyzer, "frozen")
+
+
+def test_planner_rebuilt_when_route_extended(tmp_path):
+    columns = logic.service_columns(HEADER.strip().split(","))
+    analyzer = logic.init()
+    stats = {"stops": 0, "routes": 0, "rows": 0}
+    route_prev_stops = {}
+    rows = [["1", "SBST", "1", "1", "A", ""], ["1", "SBST", "1", "2", "B", "1.0"]]
+    logic.ingest_chunk(analyzer, logic.parse_chunk(rows, columns, route_prev_stops), stats)
+    assert lt.size(logic.plan_journeys(analyzer, "A", "B")) == 1
+    assert logic.is_derived_current(analyzer, "planner")
+
+    rows = [["1", "SBST", "1", "3", "E", "2.0"]]
+    logic.ingest_chunk(analyzer, logic.parse_chunk(rows, columns, route_prev_stops), stats)
+    assert not logic.is_derived_current(analyzer, "planner")
+    journeys = logic.plan_journeys(analyzer, "A", "E")
+    assert lt.size(journeys) == 1
+    assert lt.get_element(journeys, 0)["distance"] == 3.0
+    assert logic.is_derived_current(analyzer, "planner")
+
+
+def test_components_after_direct_graph_mutation(tmp_path):
+    path = write_services(tmp_path / "services.csv")
+    analyzer = load(path, use_snapshot=False)
+    assert not logic.same_component(analyzer, "A", "F")
+    assert logic.is_derived_current(analyzer, "connectivity")
+
+    analyzer["connections"].add_edge(logic.stop_id(analyzer, "D"), logic.stop_id(analyzer, "E"), 1.0)
+    assert not logic.is_derived_current(analyzer, "components")
+    assert logic.same_component(analyzer, "A", "F")
+    assert analyzer["components"]["weak"]["count"] == 1
+    assert logic.weak_component_count(analyzer) == 1
+    assert logic.stop_component(analyzer, "E") == logic.stop_component(analyzer, "A")
+
+    analyzer = load(path, use_snapshot=False)
+    analyzer["connections"].add_edge(logic.stop_id(analyzer, "D"), logic.stop_id(analyzer, "E"), 1.0)
+    columns = logic.service_columns(HEADER.strip().split(","))
+    rows = [["60", "SBST", "1", "1", "H", ""], ["60", "SBST", "1", "2", "A", "1.0"]]
+    logic.ingest_chunk(analyzer, logic.parse_chunk(rows, columns, {}),
+                       {"stops": 0, "routes": 0, "rows": 0})
+    assert logic.weak_component_count(analyzer) == 1
+    assert logic.same_component(analyzer, "H", "F")
@@ -1,14 +1,89 @@
+import contextlib
 import csv
+import gc
+import hashlib
+import io
+import itertools
+import math
+import operator
+import pickle
+import struct
 import time
 import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
 
 data_dir = os.path.dirname(os.path.realpath('__file__')) + '/Data/'
 
 from DataStructures.Graph import adj_list_graph as gr
+from DataStructures.Graph import dijkstra as dk
+from DataStructures.Graph import landmarks as alt
+from DataStructures.Graph import contraction_hierarchy as ch
+from DataStructures.Graph import components as cc
+from DataStructures.Graph import union_find as uf
+from DataStructures.Graph import bfs
+from DataStructures.Graph import raptor
+from DataStructures.Graph import yen
+from DataStructures.Graph import mst
+from DataStructures.Graph import path_cache as spc
+from DataStructures.Graph import derived as dr
 from DataStructures.Map import map_linear_probing as m
+from DataStructures.Map import interner as it
 from DataStructures.List import array_list as lt
 from DataStructures.Priority_queue import priority_queue as pq
 
+# Número de filas del archivo de servicios que se procesan por bloque
+CHUNK_SIZE = 4096
+
+# Rangos del archivo de servicios por proceso en la carga en paralelo. Con
+# varios rangos por proceso el proceso principal junta los primeros
+# mientras los demás procesos siguen con los siguientes
+RANGES_PER_WORKER = 4
+
+# Columnas del archivo de servicios usadas por el cargador, en el orden
+# en que parse_chunk las desempaqueta
+SERVICE_COLUMNS = ('ServiceNo', 'Direction', 'StopSequence', 'BusStopCode', 'Distance')
+
+# Número de rutas a partir del cual una parada indexa sus rutas en un mapa
+# hash (stop_info['route_index']). Con menos rutas recorrer la lista es más
+# rápido que calcular el hash, y la mayoría de paradas tiene pocas rutas
+ROUTE_INDEX_THRESHOLD = 32
+
+# Formato de la instantánea binaria del analizador. SNAPSHOT_VERSION debe
+# incrementarse cada vez que cambie la estructura del analizador
+SNAPSHOT_SUFFIX = '.snapshot'
+SNAPSHOT_MAGIC = b'EDASNAP\0'
+SNAPSHOT_VERSION = 18
+SNAPSHOT_HEADER = struct.Struct('<8sH')
+
+# Errores con los que una instantánea se descarta y se vuelve a leer el CSV:
+# archivo truncado o dañado, o contenido que ya no corresponde al código
+# (módulos, funciones o clases que cambiaron de nombre o desaparecieron)
+SNAPSHOT_ERRORS = (OSError, EOFError, pickle.UnpicklingError, AttributeError,
+                   ImportError, IndexError, KeyError, TypeError, ValueError)
+
+# Prioridad de una conexión en analyzer['priority_queue'] (la cola se
+# ordena por distancia comparando números, sin compare_distances)
+CONNECTION_PRIORITY = operator.itemgetter('distance')
+
+# Estructuras derivadas del analizador que se reconstruyen solas cuando
+# cambian sus fuentes: nombre -> (versión actual de las fuentes, función
+# que reconstruye la estructura). Ver refresh_derived
+DERIVED = {
+    'frozen': (lambda analyzer: (analyzer['connections'].epoch,),
+               lambda analyzer: freeze_connections(analyzer)),
+    'connectivity': (lambda analyzer: (analyzer['connections'].epoch,),
+                     lambda analyzer: rebuild_connectivity(analyzer)),
+    'components': (lambda analyzer: (analyzer['connections'].epoch,),
+                   lambda analyzer: connected_components(analyzer)),
+    'landmarks': (lambda analyzer: (analyzer['connections'].epoch,),
+                  lambda analyzer: compute_landmarks(analyzer, num_landmarks_of(analyzer))),
+    'hierarchy': (lambda analyzer: (analyzer['connections'].epoch,),
+                  lambda analyzer: compute_hierarchy(analyzer)),
+    'planner': (lambda analyzer: (m.epoch(analyzer['route_sequences']),),
+                lambda analyzer: build_planner(analyzer))
+}
+
 def init():
     return new_analyzer()
 
@@ -31,95 +106,62 @@ def compare_distances(connection1, connection2):
 def new_analyzer():
     analyzer = {
         'stops': m.new_map(1000, 0.7),
-        'connections': gr.adj_list_graph(directed=True),
-        'components': lt.new_list(),
-        'paths': None,
-        'priority_queue': pq.new_heap(compare_distances)
+        'stop_ids': it.new_interner(),
+        'route_sequences': m.new_map(500, 0.7),
+        'connections': gr.adj_list_graph(directed=True, reverse_index=True),
+        'frozen': None,
+        'components': None,
+        'connectivity': uf.new_union_find(),
+        'paths': spc.new_path_cache(),
+        'landmarks': None,
+        'hierarchy': None,
+        'bfs': None,
+        'planner': None,
+        'derived': dr.new_registry(),
+        'priority_queue': pq.new_key_heap(CONNECTION_PRIORITY)
     }
     return analyzer
-def load_services(analyzer, services_file):
+def load_services(analyzer, services_file, chunk_size=None, use_snapshot=True,
+                  workers=None, num_landmarks=0, contract=False):
     start_time = get_time()
     
     try:
         services_file = os.path.join(data_dir, services_file)
-        
-        input_file = csv.DictReader(open(services_file, encoding="utf-8"), delimiter=",")
-        
-        total_routes = 0
-        total_stops = 0
-        route_prev_stops = {}
-        for service in input_file:
-            contador += 1
-            service_id = service['ServiceNo']
-            direction = service['Direction']
-            stop_sequence = int(service['StopSequence'])
-            bus_stop_code = service['BusStopCode']
-            if service['Distance'] != '':
-                distance = float(service['Distance'])
+
+        stats = None
+        changed = False
+        if use_snapshot:
+            stats = load_snapshot(analyzer, services_file)
+            if stats is not None:
+                print("Analizador recuperado desde la instantánea en disco")
+
+        if stats is None:
+            if workers is not None and workers > 1:
+                stats = read_services_parallel(analyzer, services_file, workers)
             else:
-                distance = 0.0
+                stats = read_services(analyzer, services_file, chunk_size)
+            freeze_connections(analyzer)
+            stats['components'], stats['strong_components'] = connected_components(analyzer)
+            changed = True
 
-            route_id = f"{service_id}-{direction}"
-            
-            stop_info = m.get(analyzer['stops'], bus_stop_code)
-            
-            
-            if stop_info is None:
-                stop_info = {
-                    'code': bus_stop_code,
-                    'routes': lt.new_list()
-                    }
-                m.put(analyzer['stops'], bus_stop_code, stop_info)
-                total_stops += 1
-                analyzer['connections'].insert_vertex(bus_stop_code)
-            
-            route_list = stop_info['routes']
-            
-            found = False
-            i = 0
-            while i < lt.size(route_list):
-                route = lt.get_element(route_list, i)
-                if route is not None and route['id'] == route_id:
-                    found = True
-                    break
-                i += 1
-            
-            if not found:
-                route_info = {
-                    'id': route_id,
-                    'service': service_id,
-                    'direction': direction
-                }
-                lt.add_last(route_list, route_info)
-                total_routes += 1
-            
-            if stop_sequence > 1:
-                prev_stop_code = route_prev_stops.get(route_id)
-                
-                if prev_stop_code:
-                    analyzer['connections'].add_edge(prev_stop_code, bus_stop_code, distance)
-
-                    connection_info = {
-                        'distance': distance
-                    }
+        if num_landmarks > 0 and num_landmarks_of(analyzer) != num_landmarks:
+            compute_landmarks(analyzer, num_landmarks)
+            changed = True
 
-                    pq.insert(analyzer['priority_queue'], connection_info, {
-                        'from': prev_stop_code,
-                        'to': bus_stop_code,
-                        'distance': distance,
-                        'route_id': route_id
-                    })
-            
-            route_prev_stops[route_id] = bus_stop_code
+        if contract and analyzer.get('hierarchy') is None:
+            compute_hierarchy(analyzer)
+            changed = True
 
+        if use_snapshot and changed:
+            save_snapshot(analyzer, services_file, stats)
 
-        connected = connected_components(analyzer)
         end_time = get_time()
         
         print(f"Tiempo de procesamiento: {delta_time(end_time, start_time)} ms")
-        print(f"Total de paradas: {total_stops}")
-        print(f"Total de rutas: {total_routes}")
-        print(f"Número de componentes conectados: {connected}")
+        print(f"Total de paradas: {stats['stops']}")
+        print(f"Total de rutas: {stats['routes']}")
+        print(f"Número de componentes conectados: {stats['components']}")
+        print(f"Número de componentes fuertemente conectados: {stats['strong_components']}")
         
         return analyzer
 
@@ -130,39 +172,1150 @@ def load_services(analyzer, services_file):
         return None
 
 
+def read_services(analyzer, services_file, chunk_size=None):
+    """
+    Lee el archivo de servicios por bloques y lo incorpora al analizador.
+    Retorna las estadísticas de la carga
+    """
+    if chunk_size is None:
+        chunk_size = CHUNK_SIZE
+
+    stats = {'stops': 0, 'routes': 0, 'rows': 0}
+    route_prev_stops = {}
+    connections = []
+    with paused_gc(), open(services_file, encoding="utf-8", newline="") as input_file:
+        reader = csv.reader(input_file, delimiter=",")
+        columns = service_columns(next(reader))
+
+        chunk_num = 0
+        while True:
+            chunk = list(itertools.islice(reader, chunk_size))
+            if not chunk:
+                break
+            chunk_num += 1
+            chunk_start = get_time()
+
+            records = parse_chunk(chunk, columns, route_prev_stops)
+            ingest_chunk(analyzer, records, stats, connections)
+
+            elapsed = delta_time(get_time(), chunk_start)
+            rate = len(chunk) / (elapsed / 1000) if elapsed > 0 else 0.0
+            print(f"Bloque {chunk_num}: {len(chunk)} filas en {elapsed:.2f} ms ({rate:.0f} filas/s, "
+                  f"{weak_component_count(analyzer)} componentes)")
+
+        add_connections(analyzer, connections)
+    return stats
+
+
+@contextlib.contextmanager
+def paused_gc():
+    """
+    Suspende el recolector de basura cíclico mientras dura el bloque. La
+    carga crea cientos de miles de objetos sin ciclos (nodos del grafo,
+    diccionarios, tuplas) y cada recolección los volvería a recorrer todos
+    sin liberar ninguno
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def read_services_parallel(analyzer, services_file, workers):
+    """
+    Lee el archivo de servicios repartiéndolo entre varios procesos, sobre
+    RANGES_PER_WORKER rangos de bytes por proceso (ver service_ranges), en
+    dos pasadas:
+
+    1. Cada proceso recorre su rango y retorna sus paradas en orden de
+       aparición y la última parada de cada ruta (ver scan_fragment). El
+       proceso principal asigna los ids de las paradas en orden de rango y
+       calcula, para cada rango, la última parada de cada ruta en los
+       rangos anteriores (ver fragment_tasks).
+    2. Con esos ids, cada proceso construye la carga parcial de su rango
+       con las estructuras finales: paradas con su lista de rutas,
+       secuencias de las rutas, arcos y conexiones (ver load_fragment).
+
+    El proceso principal solo junta las cargas parciales, a medida que
+    llegan y en orden de rango (ver merge_fragments), de modo que el
+    analizador resultante es idéntico al de la carga secuencial.
+    Retorna las estadísticas de la carga
+    """
+    columns, ranges = service_ranges(services_file, workers * RANGES_PER_WORKER)
+    starts = [start for start, _ in ranges]
+    ends = [end for _, end in ranges]
+    paths = [services_file] * len(ranges)
+    column_list = [columns] * len(ranges)
+
+    stats = {'stops': 0, 'routes': 0, 'rows': 0}
+    load_start = get_time()
+    with paused_gc(), ProcessPoolExecutor(max_workers=workers) as executor:
+        scans = list(executor.map(scan_fragment, paths, starts, ends, column_list))
+        tasks = fragment_tasks(analyzer, scans)
+        merge_fragments(analyzer, executor.map(load_fragment, paths, starts, ends,
+                                               column_list, tasks), stats)
+    print(f"Carga en paralelo con {workers} procesos y {len(ranges)} rangos: "
+          f"{delta_time(get_time(), load_start):.2f} ms ({weak_component_count(analyzer)} componentes)")
+    return stats
+
+
+def service_ranges(services_file, parts):
+    """
+    Divide el archivo de servicios, después del encabezado, en a lo más
+    parts rangos de bytes [inicio, fin) de tamaño parecido. Cada rango
+    empieza al inicio de una fila (el archivo no tiene saltos de línea
+    dentro de los campos).
+    Retorna (posición de las columnas usadas, lista de rangos)
+    """
+    with open(services_file, 'rb') as input_file:
+        header = input_file.readline().decode("utf-8")
+        first = input_file.tell()
+        size = os.fstat(input_file.fileno()).st_size
+        bounds = [first]
+        for part in range(1, parts):
+            input_file.seek(first + (size - first) * part // parts)
+            input_file.readline()
+            position = input_file.tell()
+            if bounds[-1] < position < size:
+                bounds.append(position)
+        bounds.append(size)
+    columns = service_columns(next(csv.reader([header])))
+    return columns, [(start, end) for start, end in zip(bounds, bounds[1:]) if start < end]
+
+
+def read_range(services_file, start, end):
+    """
+    Retorna un lector CSV de las filas del rango de bytes [start, end)
+    del archivo de servicios
+    """
+    with open(services_file, 'rb') as input_file:
+        input_file.seek(start)
+        text = input_file.read(end - start).decode("utf-8")
+    return csv.reader(io.StringIO(text, newline=""), delimiter=",")
+
+
+def scan_fragment(services_file, start, end, columns):
+    """
+    Primera pasada de la carga en paralelo sobre el rango de bytes
+    [start, end) del archivo de servicios. Se ejecuta en un proceso aparte.
+
+    Returns:
+        Un diccionario con los campos:
+            - rows: número de filas del rango
+            - stops: códigos de las paradas del rango, en orden de primera
+              aparición
+            - routes: ruta -> código de su última parada en el rango
+    """
+    service_col, direction_col, _, stop_col, _ = columns
+    stops = {}
+    routes = {}
+    row_num = -1
+    for row_num, row in enumerate(read_range(services_file, start, end)):
+        stops[row[stop_col]] = None
+        routes[f"{row[service_col]}-{row[direction_col]}"] = row[stop_col]
+    return {'rows': row_num + 1, 'stops': list(stops), 'routes': routes}
+
+
+def fragment_tasks(analyzer, scans):
+    """
+    Asigna los ids de las paradas de las primeras pasadas (ver
+    scan_fragment), en orden de rango, y prepara la tarea de la segunda
+    pasada de cada rango. El trabajo es proporcional a las paradas y rutas
+    distintas de cada rango, no a sus filas.
+
+    Returns:
+        Una lista con un diccionario por rango, con los campos:
+            - ids: código -> id de las paradas del rango
+            - carry: ruta -> id de su última parada en los rangos
+              anteriores, para las rutas que siguen en el rango
+            - num_stops: número de ids asignados hasta el rango (todos
+              los ids de ids y carry son menores)
+            - sequence: primer número de secuencia de las conexiones del
+              rango en analyzer['priority_queue'] (ver pq.build_heap)
+    """
+    stop_ids = analyzer['stop_ids']
+    route_last = {}
+    sequence = 0
+    tasks = []
+    for scan in scans:
+        ids = {bus_stop_code: it.intern(stop_ids, bus_stop_code) for bus_stop_code in scan['stops']}
+        carry = {route_id: route_last[route_id] for route_id in scan['routes'] if route_id in route_last}
+        tasks.append({'ids': ids, 'carry': carry, 'num_stops': it.size(stop_ids),
+                      'sequence': sequence})
+        route_last.update((route_id, ids[bus_stop_code])
+                          for route_id, bus_stop_code in scan['routes'].items())
+        sequence += scan['rows']
+    return tasks
+
+
+def load_fragment(services_file, start, end, columns, task):
+    """
+    Segunda pasada de la carga en paralelo: construye la carga parcial de
+    las filas del rango de bytes [start, end) del archivo de servicios con
+    los ids de task (ver fragment_tasks). Se ejecuta en un proceso aparte
+    y hace todo el trabajo por fila: las paradas, rutas, arcos y
+    conexiones quedan en la forma en que las guarda el analizador. Las
+    rutas que siguen de un rango anterior se enlazan con su última parada
+    en ese rango (task['carry']).
+
+    Las paradas se retornan como diccionarios y no como mapas: la posición
+    de cada llave en un mapa depende de hash(), que puede cambiar de un
+    proceso a otro, así que los mapas se crean en el proceso principal.
+
+    Returns:
+        Un diccionario con los campos:
+            - rows: número de filas del rango
+            - stops: código -> {ruta: información de la ruta} de las
+              paradas del rango, en orden de primera aparición de cada
+              parada y de cada ruta en la parada. Las paradas de una misma
+              ruta comparten su diccionario de información
+            - routes: ruta -> secuencia de la ruta en el rango (como en
+              analyzer['route_sequences'])
+            - edges: (id anterior, id) -> peso de la última aparición del
+              arco, en orden de primera aparición
+            - forest: arcos del rango que unen componentes distintos, en
+              orden (los demás no cambian los componentes débiles)
+            - connections: cola de prioridad de las conexiones del rango,
+              numeradas desde task['sequence']
+    """
+    service_col, direction_col, sequence_col, stop_col, distance_col = columns
+    ids = task['ids']
+    carry = task['carry']
+    stops = {}
+    routes = {}
+    route_infos = {}
+    edges = {}
+    connections = []
+    with paused_gc():
+        row_num = -1
+        for row_num, row in enumerate(read_range(services_file, start, end)):
+            service_id = row[service_col]
+            direction = row[direction_col]
+            bus_stop_code = row[stop_col]
+            distance = float(row[distance_col]) if row[distance_col] != '' else 0.0
+            bus_stop_id = ids[bus_stop_code]
+
+            route_id = f"{service_id}-{direction}"
+            sequence = routes.get(route_id)
+            if sequence is None:
+                sequence = {
+                    'id': route_id,
+                    'stops': array('q'),
+                    'weights': array('d')
+                }
+                routes[route_id] = sequence
+                route_infos[route_id] = {'id': route_id, 'service': service_id, 'direction': direction}
+                prev_stop_id = carry.get(route_id)
+            else:
+                route_id = sequence['id']
+                prev_stop_id = sequence['stops'][-1]
+            if int(row[sequence_col]) == 1:
+                prev_stop_id = None
+
+            stop_routes = stops.get(bus_stop_code)
+            if stop_routes is None:
+                stop_routes = {}
+                stops[bus_stop_code] = stop_routes
+            if route_id not in stop_routes:
+                stop_routes[route_id] = route_infos[route_id]
+
+            sequence['stops'].append(bus_stop_id)
+            if prev_stop_id is None:
+                sequence['weights'].append(math.inf)
+                continue
+            sequence['weights'].append(distance)
+            edges[(prev_stop_id, bus_stop_id)] = distance
+            connections.append(({'distance': distance}, {
+                'from': prev_stop_id,
+                'to': bus_stop_id,
+                'distance': distance,
+                'route_id': route_id
+            }))
+
+        components = uf.new_union_find(task['num_stops'])
+        forest = [edge for edge in edges if uf.union(components, *edge)]
+
+    return {
+        'rows': row_num + 1,
+        'stops': stops,
+        'routes': routes,
+        'edges': edges,
+        'forest': forest,
+        'connections': pq.build_heap(connections, key_function=CONNECTION_PRIORITY,
+                                     first_sequence=task['sequence'])
+    }
+
+
+def merge_fragments(analyzer, fragments, stats):
+    """
+    Junta en el analizador las cargas parciales de load_fragment, en el
+    orden de sus rangos. fragments puede ser un iterador: cada carga se
+    incorpora en cuanto llega. No hay trabajo por fila: es proporcional a
+    las paradas y rutas de cada rango y a los arcos distintos.
+
+    - las rutas de una parada en varios rangos se juntan con dict.update,
+      que conserva el orden de primera aparición; la lista de rutas de
+      cada parada nueva se arma al final (las paradas que ya estaban en el
+      analizador reciben las rutas que les faltan con add_stop_route);
+    - una ruta que aparece por primera vez se toma tal cual; si ya estaba,
+      se extiende su secuencia;
+    - los vértices y arcos de cada rango se agregan al grafo en cuanto
+      llega (add_edge conserva la posición de la primera aparición de un
+      arco y deja el peso de la última), y union-find solo recibe los
+      arcos que unen componentes en su rango;
+    - las colas de conexiones se juntan al final con pq.merge, sin volver
+      a calcular prioridades.
+
+    El resultado es el mismo que el de ingest_chunk sobre todas las filas,
+    en orden. El grafo y los mapas del analizador se construyen aquí,
+    porque viven en este proceso
+    """
+    refresh_derived(analyzer, 'connectivity')
+    merged_stops = {}
+    new_stops = []
+    merged_routes = {}
+    new_routes = []
+    extended_routes = []
+    queues = []
+    stop_ids = analyzer['stop_ids']
+    graph = analyzer['connections']
+    connectivity = analyzer['connectivity']
+    uf.grow(connectivity, it.size(stop_ids))
+
+    for fragment in fragments:
+        fragment_stops = []
+        for bus_stop_code, routes in fragment['stops'].items():
+            known = merged_stops.get(bus_stop_code)
+            if known is None:
+                stop_info = m.get(analyzer['stops'], bus_stop_code)
+                if stop_info is None:
+                    merged_stops[bus_stop_code] = routes
+                    fragment_stops.append(it.id_of(stop_ids, bus_stop_code))
+                    continue
+                for route_info in routes.values():
+                    if add_stop_route(stop_info, route_info['id'], route_info['service'],
+                                      route_info['direction']):
+                        stats['routes'] += 1
+            else:
+                known.update(routes)
+
+        for route_id, sequence in fragment['routes'].items():
+            known = merged_routes.get(route_id)
+            if known is None:
+                known = m.get(analyzer['route_sequences'], route_id)
+                if known is None:
+                    merged_routes[route_id] = sequence
+                    new_routes.append((route_id, sequence))
+                    continue
+                merged_routes[route_id] = known
+                extended_routes.append((route_id, known))
+            known['stops'].extend(sequence['stops'])
+            known['weights'].extend(sequence['weights'])
+
+        graph.insert_vertices(fragment_stops)
+        graph.add_edges((source, destination, distance)
+                        for (source, destination), distance in fragment['edges'].items())
+        for source, destination in fragment['forest']:
+            uf.union(connectivity, source, destination)
+        queues.append(fragment['connections'])
+        stats['rows'] += fragment['rows']
+
+    for bus_stop_code, routes in merged_stops.items():
+        stop_info = {
+            'code': bus_stop_code,
+            'id': it.id_of(stop_ids, bus_stop_code),
+            'routes': lt.new_list(),
+            'route_index': None
+            }
+        for route_info in routes.values():
+            lt.add_last(stop_info['routes'], route_info)
+        index_stop_routes(stop_info)
+        stats['routes'] += len(routes)
+        new_stops.append((bus_stop_code, stop_info))
+
+    analyzer['stops'] = m.put_all(analyzer['stops'], new_stops)
+    put_route_sequences(analyzer, new_routes, extended_routes)
+    pq.merge(analyzer['priority_queue'], queues)
+    record_derived(analyzer, 'connectivity')
+
+    stats['stops'] += len(new_stops)
+
+
+def service_columns(header):
+    """
+    Retorna la posición de cada columna usada por el cargador
+    a partir del encabezado del archivo de servicios
+    """
+    position = {name.strip(): i for i, name in enumerate(header)}
+    return tuple(position[name] for name in SERVICE_COLUMNS)
+
+
+def parse_chunk(rows, columns, route_prev_stops):
+    """
+    Convierte un bloque de filas del CSV en registros
+    (parada, ruta, servicio, dirección, parada anterior, distancia).
+    La parada anterior es None cuando la fila no genera arista.
+    route_prev_stops se actualiza con la última parada de cada ruta
+    """
+    service_col, direction_col, sequence_col, stop_col, distance_col = columns
+    records = []
+    for row in rows:
+        service_id = row[service_col]
+        direction = row[direction_col]
+        bus_stop_code = row[stop_col]
+        distance = float(row[distance_col]) if row[distance_col] != '' else 0.0
+
+        route_id = f"{service_id}-{direction}"
+        prev_stop_code = None
+        if int(row[sequence_col]) > 1:
+            prev_stop_code = route_prev_stops.get(route_id)
+        route_prev_stops[route_id] = bus_stop_code
+
+        records.append((bus_stop_code, route_id, service_id, direction,
+                        prev_stop_code, distance))
+    return records
+
+
+def ingest_chunk(analyzer, records, stats, connections=None):
+    """
+    Incorpora un bloque de registros al analizador usando las
+    operaciones de carga en bloque del mapa, el grafo y la cola de prioridad.
+    Si se indica la lista connections, las conexiones del bloque se agregan
+    a ella en lugar de a la cola, para construir la cola una sola vez al
+    final de la carga (ver add_connections).
+    Cada parada nueva recibe un id entero denso; el grafo y la cola de
+    prioridad trabajan sobre esos ids. analyzer['route_sequences'] guarda,
+    por ruta, la secuencia de ids de parada y el peso del arco que llega a
+    cada una (math.inf si no hay arco, como en la primera parada). La estructura union-find de
+    analyzer['connectivity'] se actualiza con cada arista, de modo que los
+    componentes débiles se conocen en todo momento de la carga, y queda
+    registrada como al día con el grafo (ver DERIVED)
+    """
+    # Si el grafo cambió por fuera de la carga, union-find se pone al día
+    # antes de registrar los arcos del bloque
+    refresh_derived(analyzer, 'connectivity')
+    stop_ids = analyzer['stop_ids']
+    chunk_stops = {}
+    new_stops = []
+    chunk_routes = {}
+    new_routes = []
+    extended_routes = []
+    edges = []
+    chunk_connections = []
+
+    for bus_stop_code, route_id, service_id, direction, prev_stop_code, distance in records:
+        stop_info = chunk_stops.get(bus_stop_code)
+        if stop_info is None:
+            stop_info = m.get(analyzer['stops'], bus_stop_code)
+            if stop_info is None:
+                stop_info = {
+                    'code': bus_stop_code,
+                    'id': it.intern(stop_ids, bus_stop_code),
+                    'routes': lt.new_list(),
+                    'route_index': None
+                    }
+                new_stops.append((bus_stop_code, stop_info))
+            chunk_stops[bus_stop_code] = stop_info
+
+        if add_stop_route(stop_info, route_id, service_id, direction):
+            stats['routes'] += 1
+
+        sequence = chunk_routes.get(route_id)
+        if sequence is None:
+            sequence = m.get(analyzer['route_sequences'], route_id)
+            if sequence is None:
+                sequence = {
+                    'id': route_id,
+                    'stops': array('q'),
+                    'weights': array('d')
+                }
+                new_routes.append((route_id, sequence))
+            else:
+                extended_routes.append((route_id, sequence))
+            chunk_routes[route_id] = sequence
+        sequence['stops'].append(stop_info['id'])
+        sequence['weights'].append(distance if prev_stop_code else math.inf)
+
+        if prev_stop_code:
+            prev_stop_id = it.id_of(stop_ids, prev_stop_code)
+            bus_stop_id = stop_info['id']
+            edges.append((prev_stop_id, bus_stop_id, distance))
+            chunk_connections.append(({'distance': distance}, {
+                'from': prev_stop_id,
+                'to': bus_stop_id,
+                'distance': distance,
+                'route_id': route_id
+            }))
+
+    analyzer['stops'] = m.put_all(analyzer['stops'], new_stops)
+    put_route_sequences(analyzer, new_routes, extended_routes)
+    analyzer['connections'].insert_vertices(stop_info['id'] for _, stop_info in new_stops)
+    analyzer['connections'].add_edges(edges)
+    if connections is None:
+        pq.insert_all(analyzer['priority_queue'], chunk_connections)
+    else:
+        connections.extend(chunk_connections)
+
+    connectivity = analyzer['connectivity']
+    uf.grow(connectivity, it.size(stop_ids))
+    for prev_stop_id, bus_stop_id, _ in edges:
+        uf.union(connectivity, prev_stop_id, bus_stop_id)
+    record_derived(analyzer, 'connectivity')
+
+    stats['stops'] += len(new_stops)
+    stats['rows'] += len(records)
+
+
+def put_route_sequences(analyzer, new_routes, extended_routes):
+    """
+    Guarda en analyzer['route_sequences'] las secuencias nuevas y vuelve a
+    guardar las que se extendieron en su lugar, para que la época del mapa
+    cambie y las estructuras derivadas de las secuencias (el planificador)
+    se reconstruyan
+    """
+    sequences = m.put_all(analyzer['route_sequences'], new_routes)
+    for route_id, sequence in extended_routes:
+        sequences = m.put(sequences, route_id, sequence)
+    analyzer['route_sequences'] = sequences
+
+
+def add_stop_route(stop_info, route_id, service_id, direction):
+    """
+    Agrega la ruta route_id a la lista de rutas de una parada si aún no
+    está (misma búsqueda que has_stop_route, escrita aquí para no pagar
+    una llamada más por fila). Cuando la parada pasa de
+    ROUTE_INDEX_THRESHOLD rutas se crea su índice hash.
+    Retorna True si la agregó
+    """
+    route_index = stop_info['route_index']
+    routes = stop_info['routes']
+    if route_index is None:
+        for i in range(lt.size(routes)):
+            if lt.get_element(routes, i)['id'] == route_id:
+                return False
+    elif m.contains(route_index, route_id):
+        return False
+    route_info = {
+        'id': route_id,
+        'service': service_id,
+        'direction': direction
+    }
+    lt.add_last(routes, route_info)
+    if route_index is not None:
+        stop_info['route_index'] = m.put(route_index, route_id, route_info)
+    elif lt.size(routes) > ROUTE_INDEX_THRESHOLD:
+        index_stop_routes(stop_info)
+    return True
+
+
+def has_stop_route(stop_info, route_id):
+    """
+    Indica si la ruta route_id está en la lista de rutas de una parada.
+    Se consulta el índice hash de la parada si lo tiene; si no, se
+    recorre la lista, que tiene a lo más ROUTE_INDEX_THRESHOLD rutas
+    """
+    if stop_info['route_index'] is not None:
+        return m.contains(stop_info['route_index'], route_id)
+    routes = stop_info['routes']
+    for i in range(lt.size(routes)):
+        if lt.get_element(routes, i)['id'] == route_id:
+            return True
+    return False
+
+
+def index_stop_routes(stop_info):
+    """
+    Crea el índice hash de rutas (stop_info['route_index']) de una parada
+    con más de ROUTE_INDEX_THRESHOLD rutas. Con menos el índice queda en
+    None
+    """
+    routes = stop_info['routes']
+    if lt.size(routes) <= ROUTE_INDEX_THRESHOLD:
+        stop_info['route_index'] = None
+        return
+    route_infos = [lt.get_element(routes, i) for i in range(lt.size(routes))]
+    stop_info['route_index'] = m.from_entries(
+        [(route_info['id'], route_info) for route_info in route_infos], 0.5)
+
+
+def add_connections(analyzer, connections):
+    """
+    Agrega a analyzer['priority_queue'] las conexiones acumuladas durante
+    la carga. Si la cola está vacía se construye de una vez, de abajo
+    hacia arriba, en O(n)
+    """
+    if pq.is_empty(analyzer['priority_queue']):
+        analyzer['priority_queue'] = pq.build_heap(connections, key_function=CONNECTION_PRIORITY)
+    else:
+        pq.insert_all(analyzer['priority_queue'], connections)
+
+
+def stop_id(analyzer, stop_code):
+    """
+    Retorna el id entero de una parada, o None si no existe
+    """
+    return it.id_of(analyzer['stop_ids'], stop_code)
+
+
+def stop_code(analyzer, stop_id):
+    """
+    Retorna el código (BusStopCode) de la parada con el id dado
+    """
+    return it.code_of(analyzer['stop_ids'], stop_id)
+
+
+def stop_routes(analyzer, stop_code):
+    """
+    Retorna la lista de rutas de una parada, en el orden en que
+    aparecieron en el archivo, o None si la parada no existe
+    """
+    stop_info = m.get(analyzer['stops'], stop_code)
+    if stop_info is None:
+        return None
+    return stop_info['routes']
+
+
+def stop_has_route(analyzer, stop_code, route_id):
+    """
+    Indica si la ruta route_id pasa por la parada stop_code
+    """
+    stop_info = m.get(analyzer['stops'], stop_code)
+    return stop_info is not None and has_stop_route(stop_info, route_id)
+
+
+def snapshot_path(services_file):
+    """
+    Retorna la ruta de la instantánea asociada a un archivo de servicios
+    """
+    return services_file + SNAPSHOT_SUFFIX
+
+
+def source_fingerprint(services_file):
+    """
+    Retorna (tamaño, mtime en ns, sha256) del archivo de servicios.
+    Cualquier cambio en alguno de los tres invalida la instantánea
+    """
+    info = os.stat(services_file)
+    digest = hashlib.sha256()
+    with open(services_file, 'rb') as source:
+        for block in iter(lambda: source.read(1 << 20), b''):
+            digest.update(block)
+    return (info.st_size, info.st_mtime_ns, digest.hexdigest())
+
+
+def pack_map(my_map):
+    """
+    Retorna un mapa como sus parejas llave-valor, su factor de carga y su
+    época, sin la tabla. La posición de cada llave en la tabla depende de
+    hash(), que para las cadenas cambia en cada proceso, así que la tabla
+    no se puede guardar tal cual
+    """
+    return {'entries': m.entries(my_map),
+            'load_factor': my_map['limit_factor'],
+            'epoch': m.epoch(my_map)}
+
+
+def unpack_map(packed):
+    """
+    Reconstruye un mapa guardado con pack_map
+    """
+    return m.from_entries(packed['entries'], packed['load_factor'], packed['epoch'])
+
+
+def snapshot_content(analyzer):
+    """
+    Retorna una copia superficial del analizador lista para la instantánea:
+    los mapas de paradas y de secuencias quedan como parejas llave-valor
+    (ver pack_map) y las paradas se guardan sin su índice de rutas, que se
+    reconstruye desde la lista de rutas (ver index_stop_routes)
+    """
+    content = dict(analyzer)
+    stops = pack_map(analyzer['stops'])
+    stops['entries'] = [(bus_stop_code, {key: value for key, value in stop_info.items()
+                                         if key != 'route_index'})
+                        for bus_stop_code, stop_info in stops['entries']]
+    content['stops'] = stops
+    content['route_sequences'] = pack_map(analyzer['route_sequences'])
+    return content
+
+
+def restore_content(content):
+    """
+    Reconstruye el analizador guardado con snapshot_content, con las
+    tablas hash calculadas en el proceso actual
+    """
+    analyzer = dict(content)
+    for _, stop_info in content['stops']['entries']:
+        index_stop_routes(stop_info)
+    analyzer['stops'] = unpack_map(content['stops'])
+    analyzer['route_sequences'] = unpack_map(content['route_sequences'])
+    return analyzer
+
+
+def save_snapshot(analyzer, services_file, stats):
+    """
+    Guarda el analizador cargado en una instantánea binaria junto al
+    archivo de servicios. El archivo tiene un encabezado fijo
+    (firma y versión del formato), seguido de la huella del CSV y
+    del contenido del analizador
+    """
+    path = snapshot_path(services_file)
+    tmp_path = path + '.tmp'
+    try:
+        with open(tmp_path, 'wb') as snapshot:
+            snapshot.write(SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION))
+            pickle.dump(source_fingerprint(services_file), snapshot,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump({'analyzer': snapshot_content(analyzer), 'stats': stats}, snapshot,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+        return True
+    except OSError as exp:
+        print(f"No fue posible guardar la instantánea: {exp}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        return False
+
+
+def load_snapshot(analyzer, services_file):
+    """
+    Recupera el analizador desde la instantánea del archivo de servicios.
+    Retorna las estadísticas de la carga, o None si la instantánea no
+    existe, es de otra versión, no corresponde al CSV actual o no se
+    puede leer (ver SNAPSHOT_ERRORS)
+    """
+    path = snapshot_path(services_file)
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, 'rb') as snapshot:
+            header = snapshot.read(SNAPSHOT_HEADER.size)
+            if len(header) != SNAPSHOT_HEADER.size:
+                return None
+            magic, version = SNAPSHOT_HEADER.unpack(header)
+            if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+                return None
+            if pickle.load(snapshot) != source_fingerprint(services_file):
+                return None
+            content = pickle.load(snapshot)
+        loaded, stats = restore_content(content['analyzer']), content['stats']
+    except SNAPSHOT_ERRORS as exp:
+        print(f"Instantánea inválida, se ignora: {exp!r}")
+        return None
+
+    analyzer.update(loaded)
+    return stats
+
 
 def connected_components(analyzer):
-    visited = {}
-    for stop_code in analyzer['connections'].all_vertices():
-        visited[stop_code] = False
+    """
+    Guarda en analyzer['components'] los componentes débil y fuertemente
+    conectados de la red de conexiones como arreglos de etiquetas por id
+    de parada. Los débiles se toman de la estructura union-find mantenida
+    durante la carga (reconstruida si el grafo cambió por fuera de la
+    carga); los fuertes requieren un recorrido (Tarjan)
 
-    cc_count = 0
+    Returns:
+        (número de componentes débiles, número de componentes fuertes)
+    """
+    refresh_derived(analyzer, 'connectivity')
+    connectivity = analyzer['connectivity']
+    analyzer['components'] = {
+        'weak': {'id': uf.labels(connectivity), 'count': uf.count(connectivity)},
+        'strong': cc.strongly_connected(query_graph(analyzer))
+    }
+    record_derived(analyzer, 'components')
+    return (cc.count(analyzer['components']['weak']),
+            cc.count(analyzer['components']['strong']))
 
-    for stop_code in analyzer['connections'].all_vertices():
-        if not visited[stop_code]:
-            cc_count += 1
-            component = lt.new_list()
-            dfs(analyzer['connections'], stop_code, visited, component)
-            lt.add_last(analyzer['components'], component)
+def freeze_connections(analyzer):
+    """
+    Guarda en analyzer['frozen'] la vista inmutable (FrozenGraph) de la red
+    de conexiones, que es la que recorren las consultas (ver query_graph).
+    Se construye al terminar la carga y de nuevo solo si el grafo cambia
+    """
+    with paused_gc():
+        analyzer['frozen'] = analyzer['connections'].freeze()
+    record_derived(analyzer, 'frozen')
+    return analyzer['frozen']
 
-    return cc_count
+def query_graph(analyzer):
+    """
+    Retorna la vista congelada de la red de conexiones, al día con el
+    grafo. Los algoritmos de las consultas (Dijkstra, BFS, Tarjan, A*,
+    Yen, la jerarquía de contracción) la recorren en lugar del Graph: sus
+    adyacencias son tuplas y no listas encadenadas
+    """
+    refresh_derived(analyzer, 'frozen')
+    return analyzer['frozen']
 
-def dfs(graph, start_vertex, visited, component):
-  
-    stack = []
-    stack.append(start_vertex)
-    
-    while len(stack) > 0:
-        vertex = stack.pop()
-        
-        if not visited.get(vertex, False):
- 
-            visited[vertex] = True
-            lt.add_last(component, vertex)
-
-            for adj_vertex in graph.get_adjacent_vertices(vertex):
-                if not visited.get(adj_vertex, False):
-                    stack.append(adj_vertex)
+def weak_component_count(analyzer):
+    """
+    Retorna el número actual de componentes débilmente conectados. Es
+    válido durante la carga, después de cada bloque
+    """
+    refresh_derived(analyzer, 'connectivity')
+    return uf.count(analyzer['connectivity'])
+
+def stop_component(analyzer, stop_code):
+    """
+    Retorna el representante del componente débil de una parada (la
+    parada raíz de su conjunto en union-find), o None si no existe.
+    El representante puede cambiar cuando se agregan nuevas conexiones
+    """
+    stop = stop_id(analyzer, stop_code)
+    if stop is None:
+        return None
+    refresh_derived(analyzer, 'connectivity')
+    return it.code_of(analyzer['stop_ids'], uf.find(analyzer['connectivity'], stop))
+
+def rebuild_connectivity(analyzer):
+    """
+    Reconstruye la estructura union-find de analyzer['connectivity'] a
+    partir de los arcos del grafo de conexiones. La carga la mantiene al
+    día arco por arco; esto solo se necesita si el grafo se modificó
+    directamente (por ejemplo con add_edge)
+    """
+    graph = analyzer['connections']
+    connectivity = uf.new_union_find(graph.num_vertices)
+    for vertex in range(graph.num_vertices):
+        for adjacent, _ in graph.iter_adjacent_edges(vertex):
+            uf.union(connectivity, vertex, adjacent)
+    analyzer['connectivity'] = connectivity
+    record_derived(analyzer, 'connectivity')
+    return connectivity
+
+def same_component(analyzer, stop_code1, stop_code2, strong=False):
+    """
+    Indica si dos paradas están en el mismo componente débil (o fuerte,
+    si strong es True). Retorna None si alguna parada no existe
+    """
+    id1 = stop_id(analyzer, stop_code1)
+    id2 = stop_id(analyzer, stop_code2)
+    if id1 is None or id2 is None:
+        return None
+    refresh_derived(analyzer, 'components')
+    components = analyzer['components']['strong' if strong else 'weak']
+    return cc.same_component(components, id1, id2)
+
+def record_derived(analyzer, name):
+    """
+    Registra que la estructura derivada name del analizador se acaba de
+    construir con la versión actual de sus fuentes
+    """
+    version, _ = DERIVED[name]
+    dr.record(analyzer['derived'], name, version(analyzer))
+
+
+def refresh_derived(analyzer, name):
+    """
+    Reconstruye la estructura derivada name del analizador (ver DERIVED)
+    si sus fuentes cambiaron desde que se construyó, o si nunca se
+    construyó. Retorna True si la reconstruyó
+    """
+    version, build = DERIVED[name]
+    return dr.ensure(analyzer['derived'], name, version(analyzer),
+                     lambda: build(analyzer))
+
+
+def is_derived_current(analyzer, name):
+    """
+    Indica si la estructura derivada name está al día con sus fuentes
+    """
+    version, _ = DERIVED[name]
+    return dr.is_current(analyzer['derived'], name, version(analyzer))
+
+def path_codes(analyzer, path):
+    """
+    Traduce un camino de ids de parada a una lista con sus códigos
+    """
+    codes = lt.new_list()
+    for i in range(lt.size(path)):
+        lt.add_last(codes, stop_code(analyzer, lt.get_element(path, i)))
+    return codes
+
+
+def shortest_paths(analyzer, origin_code):
+    """
+    Retorna el árbol de caminos más cortos (por distancia) desde la parada
+    origin_code hacia todas las demás. Los árboles se guardan en el caché
+    LRU analyzer['paths'], que se invalida solo si el grafo cambia.
+    Retorna None si la parada no existe
+    """
+    origin = stop_id(analyzer, origin_code)
+    if origin is None:
+        return None
+    return spc.shortest_path_tree(analyzer['paths'], query_graph(analyzer), origin)
+
+
+def shortest_path_to(analyzer, destination_code, origin_code=None):
+    """
+    Retorna (distancia, lista de códigos de parada) del camino más corto
+    desde origin_code hasta destination_code, o None si no hay camino.
+    Sin origin_code se usa el árbol consultado más recientemente; si el
+    grafo cambió desde esa consulta el caché se invalida y se retorna None
+    """
+    if origin_code is None:
+        search = spc.most_recent(analyzer['paths'], query_graph(analyzer))
+    else:
+        search = shortest_paths(analyzer, origin_code)
+    destination = stop_id(analyzer, destination_code)
+    if search is None or destination is None:
+        return None
+    path = dk.path_to(search, destination)
+    if path is None:
+        return None
+    return dk.dist_to(search, destination), path_codes(analyzer, path)
+
+
+def paths_cache_stats(analyzer):
+    """
+    Retorna los contadores del caché de árboles de caminos más cortos
+    (aciertos, fallos, desalojos, invalidaciones y tamaño en bytes)
+    """
+    return spc.stats(analyzer['paths'])
+
+def stop_to_stop(analyzer, origin_code, destination_code):
+    """
+    Retorna (distancia, lista de códigos de parada) del camino más corto
+    entre dos paradas usando Dijkstra bidireccional, o None si alguna
+    parada no existe o no hay camino
+    """
+    origin = stop_id(analyzer, origin_code)
+    destination = stop_id(analyzer, destination_code)
+    if origin is None or destination is None:
+        return None
+    result = dk.bidirectional_dijkstra(query_graph(analyzer), origin, destination)
+    if result['path'] is None:
+        return None
+    return result['distance'], path_codes(analyzer, result['path'])
+
+def compute_landmarks(analyzer, num_landmarks=8):
+    """
+    Escoge num_landmarks landmarks de la red de conexiones, calcula sus
+    distancias y las guarda en analyzer['landmarks'] (se incluyen en la
+    instantánea del analizador)
+    """
+    start_time = get_time()
+    analyzer['landmarks'] = alt.preprocess(query_graph(analyzer), num_landmarks)
+    record_derived(analyzer, 'landmarks')
+    print(f"Landmarks calculados: {len(analyzer['landmarks']['landmarks'])} "
+          f"en {delta_time(get_time(), start_time):.2f} ms")
+    return analyzer['landmarks']
+
+
+def num_landmarks_of(analyzer):
+    """
+    Retorna el número de landmarks precalculados en el analizador
+    """
+    if analyzer.get('landmarks') is None:
+        return 0
+    return len(analyzer['landmarks']['landmarks'])
+
+
+def landmark_path(analyzer, origin_code, destination_code):
+    """
+    Retorna (distancia, lista de códigos de parada) del camino más corto
+    entre dos paradas usando A* con landmarks, o None si alguna parada no
+    existe o no hay camino. Requiere compute_landmarks
+    """
+    origin = stop_id(analyzer, origin_code)
+    destination = stop_id(analyzer, destination_code)
+    if origin is None or destination is None or analyzer['landmarks'] is None:
+        return None
+    refresh_derived(analyzer, 'landmarks')
+    result = alt.alt_search(query_graph(analyzer), analyzer['landmarks'],
+                            origin, destination)
+    if result['path'] is None:
+        return None
+    return result['distance'], path_codes(analyzer, result['path'])
+
+def hop_search(analyzer, source_codes, target_codes=None, max_depth=None):
+    """
+    Ejecuta una BFS en número de paradas desde varias paradas a la vez
+    con el motor reutilizable de analyzer['bfs']. Los códigos que no
+    existen se ignoran. Retorna el motor con el resultado
+    """
+    if analyzer.get('bfs') is None:
+        analyzer['bfs'] = bfs.new_bfs(analyzer['connections'].num_vertices)
+    sources = known_stop_ids(analyzer, source_codes)
+    targets = None
+    if target_codes is not None:
+        targets = known_stop_ids(analyzer, target_codes)
+    return bfs.search(analyzer['bfs'], query_graph(analyzer), sources, max_depth, targets)
+
+def known_stop_ids(analyzer, stop_codes):
+    """
+    Retorna los ids de las paradas de stop_codes que existen
+    """
+    ids = (stop_id(analyzer, code) for code in stop_codes)
+    return [stop for stop in ids if stop is not None]
+
+def stop_hops(analyzer, source_codes, target_codes, max_depth=None):
+    """
+    Retorna una lista con el número de paradas (saltos) desde la más
+    cercana de source_codes hasta cada parada de target_codes, en el mismo
+    orden; -1 si no es alcanzable (o está a más de max_depth saltos).
+    La búsqueda termina en cuanto se alcanzan todos los destinos
+    """
+    engine = hop_search(analyzer, source_codes, target_codes, max_depth)
+    hops = lt.new_list()
+    for code in target_codes:
+        stop = stop_id(analyzer, code)
+        lt.add_last(hops, -1 if stop is None else bfs.hops_to(engine, stop))
+    return hops
+
+def stops_within(analyzer, source_codes, max_depth):
+    """
+    Retorna una lista con los códigos de las paradas alcanzables a lo más
+    max_depth saltos desde alguna de source_codes (incluidas ellas)
+    """
+    engine = hop_search(analyzer, source_codes, max_depth=max_depth)
+    codes = lt.new_list()
+    for stop in range(analyzer['connections'].num_vertices):
+        if bfs.visited(engine, stop):
+            lt.add_last(codes, stop_code(analyzer, stop))
+    return codes
+
+def alternative_paths(analyzer, origin_code, destination_code, k=3):
+    """
+    Retorna una lista con los k caminos más cortos sin ciclos entre dos
+    paradas, cada uno como (distancia, lista de códigos de parada), o None
+    si alguna parada no existe
+    """
+    origin = stop_id(analyzer, origin_code)
+    destination = stop_id(analyzer, destination_code)
+    if origin is None or destination is None:
+        return None
+    result = yen.k_shortest_paths(query_graph(analyzer), origin, destination, k)
+    paths = lt.new_list()
+    for i in range(lt.size(result['paths'])):
+        entry = lt.get_element(result['paths'], i)
+        lt.add_last(paths, (entry['distance'], path_codes(analyzer, entry['path'])))
+    return paths
+
+def minimum_spanning_tree(analyzer, method='kruskal'):
+    """
+    Calcula el bosque de expansión mínima de la red de conexiones vista
+    como no dirigida: una arista por cada par de paradas consecutivas en
+    alguna ruta, con la menor distancia entre todas las conexiones del par
+    (en cualquier sentido). Con method='kruskal' consume una copia de
+    analyzer['priority_queue'], que tiene todas las conexiones y por eso
+    acepta primero la más corta de cada par; con method='prim' recorre el
+    grafo de undirected_connections. Ambos métodos resuelven la misma
+    instancia y dan el mismo peso total (con empates, las aristas pueden
+    ser distintas).
+    Retorna un diccionario con el peso total (weight) y la lista de
+    aristas (edges) como (código origen, código destino, distancia)
+    """
+    if method == 'kruskal':
+        result = mst.kruskal(it.size(analyzer['stop_ids']),
+                             pq.copy(analyzer['priority_queue']),
+                             weak_component_count(analyzer))
+    elif method == 'prim':
+        result = mst.prim(undirected_connections(analyzer))
+    else:
+        raise ValueError(f"Método desconocido: {method}")
+    edges = lt.new_list()
+    for i in range(lt.size(result['edges'])):
+        source, destination, distance = lt.get_element(result['edges'], i)
+        lt.add_last(edges, (stop_code(analyzer, source), stop_code(analyzer, destination), distance))
+    return {'weight': result['weight'], 'edges': edges}
+
+def undirected_connections(analyzer):
+    """
+    Retorna un grafo no dirigido sobre los ids de parada con una arista
+    por cada par de paradas consecutivas en alguna ruta, con la menor
+    distancia entre todas las conexiones del par. Se arma a partir de
+    analyzer['route_sequences'], que guarda cada conexión (no solo el
+    último peso de cada arco, como el grafo de conexiones). Los lazos de
+    una parada consigo misma se omiten
+    """
+    shortest = {}
+    sequences = m.value_set(analyzer['route_sequences'])
+    for i in range(lt.size(sequences)):
+        sequence = lt.get_element(sequences, i)
+        stops, weights = sequence['stops'], sequence['weights']
+        for j in range(1, len(stops)):
+            source, destination = stops[j - 1], stops[j]
+            if weights[j] == math.inf or source == destination:
+                continue
+            pair = (source, destination) if source < destination else (destination, source)
+            distance = shortest.get(pair)
+            if distance is None or weights[j] < distance:
+                shortest[pair] = weights[j]
+    graph = gr.adj_list_graph(directed=False)
+    graph.insert_vertices(range(it.size(analyzer['stop_ids'])))
+    graph.add_edges((source, destination, distance)
+                    for (source, destination), distance in shortest.items())
+    return graph
+
+def build_planner(analyzer):
+    """
+    Construye la red del planificador de viajes (RAPTOR) a partir de las
+    secuencias de paradas de cada ruta y la guarda en analyzer['planner']
+    """
+    network = raptor.new_network(it.size(analyzer['stop_ids']))
+    sequences = m.value_set(analyzer['route_sequences'])
+    for i in range(lt.size(sequences)):
+        sequence = lt.get_element(sequences, i)
+        raptor.add_route(network, sequence['id'], sequence['stops'], sequence['weights'])
+    analyzer['planner'] = network
+    record_derived(analyzer, 'planner')
+    return network
+
+def plan_journeys(analyzer, origin_code, destination_code, max_transfers=4):
+    """
+    Retorna el frente de Pareto de los viajes entre dos paradas sobre
+    (transbordos, distancia), o None si alguna parada no existe. Cada viaje
+    tiene los campos transfers, distance y legs; cada tramo indica la ruta
+    y los códigos de las paradas donde se sube (board) y se baja (alight)
+    """
+    origin = stop_id(analyzer, origin_code)
+    destination = stop_id(analyzer, destination_code)
+    if origin is None or destination is None:
+        return None
+    refresh_derived(analyzer, 'planner')
+    result = raptor.journeys(analyzer['planner'], origin, destination, max_transfers)
+    for i in range(lt.size(result)):
+        legs = lt.get_element(result, i)['legs']
+        for j in range(lt.size(legs)):
+            leg = lt.get_element(legs, j)
+            leg['board'] = stop_code(analyzer, leg['board'])
+            leg['alight'] = stop_code(analyzer, leg['alight'])
+    return result
+
+def compute_hierarchy(analyzer):
+    """
+    Construye la jerarquía de contracción de la red de conexiones y la
+    guarda en analyzer['hierarchy'] (se incluye en la instantánea del
+    analizador)
+    """
+    analyzer['hierarchy'] = ch.build(query_graph(analyzer))
+    record_derived(analyzer, 'hierarchy')
+    print(f"Jerarquía de contracción: {analyzer['hierarchy']['shortcuts']} atajos "
+          f"en {analyzer['hierarchy']['preprocess_ms']:.2f} ms")
+    return analyzer['hierarchy']
+
+
+def hierarchy_path(analyzer, origin_code, destination_code):
+    """
+    Retorna (distancia, lista de códigos de parada) del camino más corto
+    entre dos paradas usando la jerarquía de contracción, o None si alguna
+    parada no existe o no hay camino. Requiere compute_hierarchy
+    """
+    origin = stop_id(analyzer, origin_code)
+    destination = stop_id(analyzer, destination_code)
+    if origin is None or destination is None or analyzer['hierarchy'] is None:
+        return None
+    refresh_derived(analyzer, 'hierarchy')
+    result = ch.query(analyzer['hierarchy'], origin, destination)
+    if result['path'] is None:
+        return None
+    return result['distance'], path_codes(analyzer, result['path'])
 
 def get_time():
     return float(time.perf_counter() * 1000)
@@ -0,0 +1,115 @@
+"""
+Micro-benchmark de la iteración de adyacencias.
+
+Recorre todo el grafo de conexiones (DFS completo) usando
+get_adjacent_vertices, que construye una lista por vértice visitado, y
+usando iter_adjacent, que solo crea un iterador de tamaño constante. Para cada variante reporta el tiempo del
+recorrido y los bytes de los objetos que crea la API de adyacencia
+(medidos con sys.getsizeof), en total y para el vértice de mayor grado.
+
+Luego compara los algoritmos de las consultas sobre el Graph y sobre su
+vista congelada (FrozenGraph, la que recorren las consultas del
+analizador, ver logic.query_graph): Dijkstra desde varias fuentes y
+Tarjan (componentes fuertes), y reporta lo que cuesta congelar el grafo.
+
+Uso:
+    python -m Benchmarks.bench_adjacency [número de fuentes de Dijkstra]
+"""
+import os
+import random
+import sys
+
+from App import logic
+from Benchmarks import bench_utils as bu
+from DataStructures.Graph import components as cc
+from DataStructures.Graph import dijkstra as dk
+
+
+def traverse(graph, num_vertices, adjacency):
+    visited = [False] * num_vertices
+    for start in range(num_vertices):
+        if visited[start]:
+            continue
+        stack = [start]
+        while stack:
+            vertex = stack.pop()
+            if not visited[vertex]:
+                visited[vertex] = True
+                for adj_vertex in adjacency(vertex):
+                    if not visited[adj_vertex]:
+                        stack.append(adj_vertex)
+
+
+def traverse_lists(graph, num_vertices):
+    traverse(graph, num_vertices, graph.get_adjacent_vertices)
+
+
+def traverse_iterators(graph, num_vertices):
+    traverse(graph, num_vertices, graph.iter_adjacent)
+
+
+def materialized_bytes(graph, num_vertices, method):
+    """
+    Retorna (objetos creados, bytes totales) por la API de adyacencia
+    durante un recorrido completo
+    """
+    created = 0
+    total = 0
+
+    def measuring(vertex_id):
+        nonlocal created, total
+        result = method(vertex_id)
+        created += 1
+        total += sys.getsizeof(result)
+        return result
+
+    traverse(graph, num_vertices, measuring)
+    return created, total
+
+
+def dijkstra_all(graph, sources):
+    return [dk.dijkstra(graph, source)['dist_to'] for source in sources]
+
+
+def main(num_sources=10):
+    path, temporary = bu.services_file()
+    try:
+        analyzer = bu.load_analyzer(path)
+    finally:
+        if temporary:
+            os.remove(path)
+    graph = analyzer['connections']
+    frozen = graph.freeze()
+    n = graph.num_vertices
+    hub = max(graph.all_vertices(), key=graph.degree)
+    print(f"Grafo: {n} vértices, {graph.num_edges} arcos; "
+          f"vértice de mayor grado: {hub} ({graph.degree(hub)} arcos)")
+
+    rows = []
+    for name, target in (("Graph", graph), ("FrozenGraph", frozen)):
+        for label, function, method in (
+                ("listas", traverse_lists, target.get_adjacent_vertices),
+                ("iterador", traverse_iterators, target.iter_adjacent)):
+            elapsed, _ = bu.best_time(function, target, n, repeat=5)
+            created, total = materialized_bytes(target, n, method)
+            rows.append((name, label, f"{elapsed:.2f}", created,
+                         f"{total / 1024:.1f}", sys.getsizeof(method(hub))))
+    bu.print_table(("grafo", "adyacencias", "ms", "objetos", "KiB creados",
+                    "bytes en hub"), rows)
+
+    sources = random.Random(3).sample(range(n), num_sources)
+    rows = []
+    for label, function, args in ((f"Dijkstra ({num_sources} fuentes)", dijkstra_all, (sources,)),
+                                  ("Tarjan (componentes fuertes)", cc.strongly_connected, ())):
+        graph_ms, expected = bu.best_time(function, graph, *args)
+        frozen_ms, result = bu.best_time(function, frozen, *args)
+        assert result == expected
+        rows.append((label, f"{graph_ms:.2f}", f"{frozen_ms:.2f}",
+                     f"{graph_ms / frozen_ms:.2f}x"))
+    freeze_ms, _ = bu.best_time(logic.freeze_connections, analyzer)
+    rows.append(("congelar el grafo (una vez)", "-", f"{freeze_ms:.2f}", "-"))
+    bu.print_table(("consulta", "Graph ms", "FrozenGraph ms", "speedup"), rows)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
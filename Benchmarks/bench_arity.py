@@ -0,0 +1,165 @@
+"""
+Benchmark de la aridad (2, 4 y 8) de priority_queue y heap.
+
+Cargas de trabajo:
+
+- carga de conexiones: las conexiones del archivo de servicios se
+  insertan una a una en la cola (como el cargador antes de build_heap)
+  o se construye la cola con build_heap, y luego se extraen todas.
+- Dijkstra perezoso sobre priority_queue: caminos más cortos desde
+  varias fuentes sobre la red de conexiones con una priority_queue, que
+  no tiene decrease_key, así que cada mejora de distancia inserta una
+  entrada nueva y las obsoletas se descartan al extraerlas: la cola
+  recibe muchas inserciones, el caso en el que un heap más ancho (menos
+  profundo) debería ayudar. No es el Dijkstra de las consultas
+  (dijkstra.dijkstra), que usa la cola indexada indexminpq con
+  decrease_key y no depende de la aridad de priority_queue; ese se mide
+  aparte, desde las mismas fuentes, como referencia.
+- heap.py: inserción y extracción de las distancias de las conexiones.
+
+Cada carga se mide en modo comparador (compare_distances) y en modo
+llave (CONNECTION_PRIORITY), salvo heap.py que solo tiene comparador.
+Se reporta el mejor tiempo de varias ejecuciones y se verifica que todas
+las aridades den el mismo resultado. En modo llave la aridad 2 usa heapq
+(en C) y las demás se ordenan en Python, así que ahí la aridad 2 gana.
+
+Uso:
+    python -m Benchmarks.bench_arity [número de fuentes de Dijkstra]
+"""
+import math
+import os
+import random
+import sys
+
+from App import logic
+from Benchmarks import bench_utils as bu
+from DataStructures.Graph import dijkstra as dk
+from DataStructures.Priority_queue import heap as h
+from DataStructures.Priority_queue import priority_queue as pq
+
+ARITIES = (2, 4, 8)
+
+
+def new_queue(mode, arity):
+    if mode == "comparador":
+        return pq.new_heap(logic.compare_distances, arity)
+    return pq.new_key_heap(logic.CONNECTION_PRIORITY, arity)
+
+
+def build_queue(mode, arity, entries):
+    if mode == "comparador":
+        return pq.build_heap(entries, logic.compare_distances, arity=arity)
+    return pq.build_heap(entries, key_function=logic.CONNECTION_PRIORITY, arity=arity)
+
+
+def drain(queue):
+    return [pq.remove(queue)['distance'] for _ in range(pq.size(queue))]
+
+
+def lazy_dijkstra(graph, source, mode, arity):
+    """
+    Dijkstra con una priority_queue sin decrease_key. Retorna
+    (suma de distancias alcanzables, inserciones, extracciones)
+    """
+    dist = [math.inf] * graph.num_vertices
+    dist[source] = 0.0
+    queue = new_queue(mode, arity)
+    pq.insert(queue, {'distance': 0.0}, source)
+    inserts, removals = 1, 0
+    while not pq.is_empty(queue):
+        base = pq.get_first_priority(queue)['distance']
+        vertex = pq.remove_value(queue)
+        removals += 1
+        if base > dist[vertex]:
+            continue
+        for adjacent, weight in graph.iter_adjacent_edges(vertex):
+            distance = base + weight
+            if distance < dist[adjacent]:
+                dist[adjacent] = distance
+                pq.insert(queue, {'distance': distance}, adjacent)
+                inserts += 1
+    return sum(d for d in dist if d < math.inf), inserts, removals
+
+
+def indexed_dijkstra(graph, sources):
+    """
+    Suma de distancias alcanzables de dijkstra.dijkstra desde cada fuente
+    """
+    return [round(sum(d for d in dk.dijkstra(graph, source)['dist_to'] if d < math.inf), 6)
+            for source in sources]
+
+
+def main(num_sources=10):
+    path, temporary = bu.services_file()
+    try:
+        analyzer = bu.load_analyzer(path)
+    finally:
+        if temporary:
+            os.remove(path)
+    graph = analyzer['connections']
+    queue = pq.copy(analyzer['priority_queue'])
+    feed = []
+    while not pq.is_empty(queue):
+        key = pq.get_first_priority(queue)
+        feed.append((key, pq.remove_value(queue)))
+    random.Random(5).shuffle(feed)
+    sources = random.Random(3).sample(range(graph.num_vertices), num_sources)
+    print(f"Grafo: {graph.num_vertices} vértices, {graph.num_edges} arcos, "
+          f"{len(feed)} conexiones, {num_sources} fuentes")
+
+    rows = []
+    for mode in ("comparador", "llave"):
+        def insert_drain(arity):
+            queue = new_queue(mode, arity)
+            for key, value in feed:
+                pq.insert(queue, key, value)
+            return drain(queue)
+
+        def build_drain(arity):
+            return drain(build_queue(mode, arity, feed))
+
+        def shortest_paths(arity):
+            totals = [lazy_dijkstra(graph, source, mode, arity) for source in sources]
+            return [round(total, 6) for total, _, _ in totals], totals
+
+        for workload, function in (("conexiones: insert + remove", insert_drain),
+                                   ("conexiones: build_heap + remove", build_drain),
+                                   ("Dijkstra perezoso (priority_queue)", shortest_paths)):
+            times = []
+            reference = None
+            for arity in ARITIES:
+                ms, result = bu.best_time(function, arity)
+                check = result[0] if isinstance(result, tuple) else result
+                assert reference is None or check == reference
+                reference = check
+                times.append(f"{ms:.1f}")
+            rows.append((workload, mode, *times))
+        if mode == "llave":
+            _, totals = shortest_paths(2)
+            inserts = sum(t[1] for t in totals)
+            removals = sum(t[2] for t in totals)
+            lazy_totals = [round(total, 6) for total, _, _ in totals]
+
+    def heap_insert_delete(arity):
+        heap = h.new_heap(logic.compare_distances, arity)
+        for key, _ in feed:
+            h.insert(heap, key)
+        return [h.del_min(heap)['distance'] for _ in range(len(feed))]
+
+    times = []
+    for arity in ARITIES:
+        ms, _ = bu.best_time(heap_insert_delete, arity)
+        times.append(f"{ms:.1f}")
+    rows.append(("heap.py: insert + del_min", "comparador", *times))
+
+    ms, indexed_totals = bu.best_time(indexed_dijkstra, graph, sources)
+    assert indexed_totals == lazy_totals
+    rows.append(("dijkstra.dijkstra (indexminpq)", "-", f"{ms:.1f}",
+                 *("-" for _ in ARITIES[1:])))
+
+    bu.print_table(("carga", "modo", *(f"d={arity} ms" for arity in ARITIES)), rows)
+    print(f"Dijkstra perezoso: {inserts} inserciones, {removals} extracciones")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,82 @@
+"""
+Benchmark de Dijkstra bidireccional contra Dijkstra en una dirección.
+
+Toma parejas de paradas al azar de las filas del archivo de servicios y
+resuelve cada consulta origen-destino con Dijkstra desde el origen
+(terminando al extraer el destino) y con la búsqueda bidireccional.
+Verifica que ambas den la misma distancia y reporta latencia y vértices
+extraídos de la cola.
+
+Uso:
+    python -m Benchmarks.bench_bidirectional [número de parejas]
+"""
+import csv
+import math
+import os
+import random
+import statistics
+import sys
+import time
+
+from App import logic
+from Benchmarks import bench_utils as bu
+from DataStructures.Graph import dijkstra as dk
+
+
+def stop_pairs(path, analyzer, num_pairs, seed):
+    """
+    Parejas (origen, destino) de ids tomadas de filas al azar del archivo
+    """
+    with open(path, encoding="utf-8", newline="") as input_file:
+        codes = [row['BusStopCode'] for row in csv.DictReader(input_file)]
+    rnd = random.Random(seed)
+    return [(logic.stop_id(analyzer, rnd.choice(codes)), logic.stop_id(analyzer, rnd.choice(codes)))
+            for _ in range(num_pairs)]
+
+
+def one_directional(graph, source, target):
+    search = dk.dijkstra(graph, source, target)
+    return dk.dist_to(search, target), search['settled']
+
+
+def bidirectional(graph, source, target):
+    result = dk.bidirectional_dijkstra(graph, source, target)
+    return result['distance'], result['settled']
+
+
+def main(num_pairs=50, seed=2):
+    path, temporary = bu.services_file()
+    try:
+        analyzer = bu.load_analyzer(path)
+        pairs = stop_pairs(path, analyzer, num_pairs, seed)
+    finally:
+        if temporary:
+            os.remove(path)
+    graph = analyzer['connections']
+    print(f"Grafo: {graph.num_vertices} vértices, {graph.num_edges} arcos; {num_pairs} parejas")
+
+    results = {}
+    for name, function in (("una dirección", one_directional), ("bidireccional", bidirectional)):
+        latencies, settled, distances = [], [], []
+        for source, target in pairs:
+            start = time.perf_counter()
+            distance, count = function(graph, source, target)
+            latencies.append((time.perf_counter() - start) * 1000)
+            settled.append(count)
+            distances.append(distance)
+        results[name] = (latencies, settled, distances)
+
+    base = results["una dirección"][2]
+    for distance, expected in zip(results["bidireccional"][2], base):
+        assert distance == expected or math.isclose(distance, expected), (distance, expected)
+
+    rows = []
+    for name, (latencies, settled, _) in results.items():
+        rows.append((name, f"{statistics.mean(latencies):.2f}", f"{statistics.median(latencies):.2f}",
+                     f"{statistics.mean(settled):.0f}", f"{statistics.median(settled):.0f}"))
+    bu.print_table(("búsqueda", "ms promedio", "ms mediana", "extraídos prom.",
+                    "extraídos mediana"), rows)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,75 @@
+"""
+Benchmark de jerarquías de contracción contra Dijkstra y Dijkstra
+bidireccional.
+
+Reporta el tiempo de preprocesamiento y el número de atajos agregados,
+y resuelve las mismas parejas origen-destino con cada búsqueda,
+verificando que las distancias coincidan. Para la jerarquía se mide la
+consulta de solo distancia y la consulta con el camino expandido.
+
+Uso:
+    python -m Benchmarks.bench_contraction [número de parejas]
+"""
+import math
+import os
+import statistics
+import sys
+
+from Benchmarks import bench_utils as bu
+from Benchmarks.bench_bidirectional import stop_pairs
+from Benchmarks.bench_landmarks import run
+from DataStructures.Graph import contraction_hierarchy as ch
+from DataStructures.Graph import dijkstra as dk
+
+
+def main(num_pairs=200, seed=3):
+    path, temporary = bu.services_file()
+    try:
+        analyzer = bu.load_analyzer(path)
+        pairs = stop_pairs(path, analyzer, num_pairs, seed)
+    finally:
+        if temporary:
+            os.remove(path)
+    graph = analyzer['connections']
+    print(f"Grafo: {graph.num_vertices} vértices, {graph.num_edges} arcos; {num_pairs} parejas")
+
+    hierarchy = ch.build(graph)
+    print(f"Preprocesamiento: {hierarchy['preprocess_ms']:.0f} ms, "
+          f"{hierarchy['shortcuts']} atajos "
+          f"({100 * hierarchy['shortcuts'] / max(graph.num_edges, 1):.1f}% de los arcos)")
+
+    def plain(source, target):
+        search = dk.dijkstra(graph, source, target)
+        return dk.dist_to(search, target), search['settled']
+
+    def bidirectional(source, target):
+        result = dk.bidirectional_dijkstra(graph, source, target)
+        return result['distance'], result['settled']
+
+    def contracted(source, target):
+        result = ch.query(hierarchy, source, target)
+        return result['distance'], result['settled']
+
+    def contracted_distance(source, target):
+        return ch.distance(hierarchy, source, target), 0
+
+    base_latencies, base_settled, base_distances = run(plain, pairs)
+    base_ms = statistics.mean(base_latencies)
+    rows = [("Dijkstra", f"{base_ms:.3f}", f"{statistics.median(base_latencies):.3f}",
+             f"{statistics.mean(base_settled):.0f}", "1.0x")]
+    for name, function in (("bidireccional", bidirectional),
+                           ("CH (camino)", contracted),
+                           ("CH (distancia)", contracted_distance)):
+        latencies, settled, distances = run(function, pairs)
+        for distance, expected in zip(distances, base_distances):
+            assert distance == expected or math.isclose(distance, expected), (distance, expected)
+        ms = statistics.mean(latencies)
+        rows.append((name, f"{ms:.3f}", f"{statistics.median(latencies):.3f}",
+                     f"{statistics.mean(settled):.0f}" if any(settled) else "-",
+                     f"{base_ms / ms:.1f}x"))
+
+    bu.print_table(("búsqueda", "ms promedio", "ms mediana", "extraídos prom.", "speedup"), rows)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
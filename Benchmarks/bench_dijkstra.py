@@ -0,0 +1,56 @@
+"""
+Benchmark de Dijkstra sobre la red completa de conexiones.
+
+Ejecuta consultas de una sola fuente desde paradas tomadas al azar del
+archivo de servicios y reporta la latencia (promedio, mediana y máximo),
+los vértices extraídos de la cola y el costo de reconstruir los caminos.
+
+Uso:
+    python -m Benchmarks.bench_dijkstra [número de consultas]
+"""
+import os
+import random
+import statistics
+import sys
+import time
+
+from Benchmarks import bench_utils as bu
+from DataStructures.Graph import dijkstra as dk
+
+
+def main(num_queries=20, seed=1):
+    path, temporary = bu.services_file()
+    try:
+        analyzer = bu.load_analyzer(path)
+    finally:
+        if temporary:
+            os.remove(path)
+    graph = analyzer['connections']
+    print(f"Grafo: {graph.num_vertices} vértices, {graph.num_edges} arcos")
+
+    rnd = random.Random(seed)
+    sources = [rnd.randrange(graph.num_vertices) for _ in range(num_queries)]
+    latencies = []
+    settled = []
+    path_times = []
+    for source in sources:
+        start = time.perf_counter()
+        search = dk.dijkstra(graph, source)
+        latencies.append((time.perf_counter() - start) * 1000)
+        settled.append(search['settled'])
+
+        reachable = [v for v in range(graph.num_vertices) if dk.has_path_to(search, v)]
+        start = time.perf_counter()
+        for vertex in reachable:
+            dk.path_to(search, vertex)
+        path_times.append((time.perf_counter() - start) * 1e6 / max(len(reachable), 1))
+
+    bu.print_table(("consultas", "ms promedio", "ms mediana", "ms máx",
+                    "extraídos prom.", "µs por camino"),
+                   [(num_queries, f"{statistics.mean(latencies):.2f}",
+                     f"{statistics.median(latencies):.2f}", f"{max(latencies):.2f}",
+                     f"{statistics.mean(settled):.0f}", f"{statistics.mean(path_times):.2f}")])
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,97 @@
+"""
+Benchmark de la construcción de la cola de prioridad de conexiones.
+
+Compara dos formas de llenar un priority_queue con las mismas conexiones
+({'distance': d}, conexión), ordenadas con logic.compare_distances:
+
+- insert uno a uno: cada conexión sube (swim) desde la última posición,
+  O(n log n) comparaciones.
+- build_heap: se guardan todas y se restaura el heap de abajo hacia
+  arriba, O(n) comparaciones.
+
+Se prueba con las conexiones del archivo de servicios (~14k) y con un
+millón de conexiones sintéticas. Se reporta el tiempo, el número de
+llamadas a la función de comparación y se verifica que ambas colas
+entreguen las distancias en el mismo orden.
+
+Uso:
+    python -m Benchmarks.bench_heapify [número de conexiones sintéticas]
+"""
+import os
+import random
+import sys
+
+from App import logic
+from Benchmarks import bench_utils as bu
+from DataStructures.Priority_queue import priority_queue as pq
+
+
+def counting(cmp_function):
+    """
+    Retorna (función de comparación que cuenta sus llamadas, contador)
+    """
+    counter = [0]
+
+    def cmp(key1, key2):
+        counter[0] += 1
+        return cmp_function(key1, key2)
+    return cmp, counter
+
+
+def one_by_one(entries):
+    cmp, counter = counting(logic.compare_distances)
+    heap = pq.new_heap(cmp)
+    for key, value in entries:
+        pq.insert(heap, key, value)
+    return heap, counter[0]
+
+
+def bottom_up(entries):
+    cmp, counter = counting(logic.compare_distances)
+    return pq.build_heap(entries, cmp), counter[0]
+
+
+def first_distances(heap, count=1000):
+    return [pq.remove(heap)['distance'] for _ in range(min(count, pq.size(heap)))]
+
+
+def measure(name, entries, repeat):
+    rows = []
+    order = None
+    for method, function in (("insert uno a uno", one_by_one), ("build_heap", bottom_up)):
+        ms, (heap, comparisons) = bu.best_time(function, entries, repeat=repeat)
+        distances = first_distances(heap)
+        assert order is None or distances == order
+        order = distances
+        rows.append((name, method, len(entries), f"{ms:.1f}", comparisons))
+    return rows
+
+
+def main(num_synthetic=1_000_000):
+    path, temporary = bu.services_file()
+    try:
+        analyzer = bu.load_analyzer(path)
+    finally:
+        if temporary:
+            os.remove(path)
+    heap = pq.copy(analyzer['priority_queue'])
+    feed = []
+    while not pq.is_empty(heap):
+        key = pq.get_first_priority(heap)
+        feed.append((key, pq.remove_value(heap)))
+    random.Random(5).shuffle(feed)
+
+    rnd = random.Random(9)
+    synthetic = []
+    for i in range(num_synthetic):
+        distance = round(rnd.uniform(0.1, 5.0), 1)
+        synthetic.append(({'distance': distance},
+                          {'from': i, 'to': i + 1, 'distance': distance, 'route_id': 'S-1'}))
+
+    rows = measure("archivo de servicios", feed, repeat=3)
+    rows += measure("sintético", synthetic, repeat=1)
+    bu.print_table(("conexiones", "método", "n", "ms", "comparaciones"), rows)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,105 @@
+"""
+Benchmark de priority_queue en modo comparador contra modo llave.
+
+- comparador: pq.new_heap(logic.compare_distances); cada comparación
+  llama a la función sobre las llaves {'distance': d}.
+- llave: pq.new_key_heap(logic.CONNECTION_PRIORITY); la distancia se
+  extrae una vez por inserción y heapq compara tuplas de números.
+
+Para cada modo se mide, con las mismas conexiones:
+
+- insert + remove: n inserciones seguidas de n extracciones.
+- build_heap + remove: construcción de abajo hacia arriba y n
+  extracciones.
+- Kruskal sobre la cola del analizador (consume una copia).
+
+Se reporta el tiempo (mejor de varias ejecuciones) y el rendimiento en
+operaciones por segundo, y se verifica que ambos modos extraigan las
+distancias en el mismo orden.
+
+Uso:
+    python -m Benchmarks.bench_key_heap [número de conexiones sintéticas]
+"""
+import os
+import random
+import sys
+
+from App import logic
+from Benchmarks import bench_utils as bu
+from DataStructures.Graph import mst
+from DataStructures.Priority_queue import priority_queue as pq
+
+MODES = (
+    ("comparador", lambda: pq.new_heap(logic.compare_distances),
+     lambda entries: pq.build_heap(entries, logic.compare_distances)),
+    ("llave", lambda: pq.new_key_heap(logic.CONNECTION_PRIORITY),
+     lambda entries: pq.build_heap(entries, key_function=logic.CONNECTION_PRIORITY)),
+)
+
+
+def drain(heap):
+    return [pq.remove(heap)['distance'] for _ in range(pq.size(heap))]
+
+
+def workloads(name, entries, repeat):
+    rows = []
+    orders = []
+    for mode, new, build in MODES:
+        def insert_remove():
+            heap = new()
+            for key, value in entries:
+                pq.insert(heap, key, value)
+            return drain(heap)
+
+        def build_remove():
+            return drain(build(entries))
+
+        for workload, function in (("insert + remove", insert_remove),
+                                   ("build_heap + remove", build_remove)):
+            ms, order = bu.best_time(function, repeat=repeat)
+            orders.append(order)
+            ops = 2 * len(entries) / (ms / 1000)
+            rows.append((name, workload, mode, f"{ms:.1f}", f"{ops:,.0f}"))
+    assert all(order == orders[0] for order in orders)
+    return rows
+
+
+def main(num_synthetic=200_000):
+    path, temporary = bu.services_file()
+    try:
+        analyzer = bu.load_analyzer(path)
+    finally:
+        if temporary:
+            os.remove(path)
+    heap = pq.copy(analyzer['priority_queue'])
+    feed = []
+    while not pq.is_empty(heap):
+        key = pq.get_first_priority(heap)
+        feed.append((key, pq.remove_value(heap)))
+    random.Random(5).shuffle(feed)
+
+    rnd = random.Random(9)
+    synthetic = []
+    for i in range(num_synthetic):
+        distance = round(rnd.uniform(0.1, 5.0), 1)
+        synthetic.append(({'distance': distance},
+                          {'from': i, 'to': i + 1, 'distance': distance, 'route_id': 'S-1'}))
+
+    rows = workloads("archivo de servicios", feed, repeat=3)
+    rows += workloads("sintético", synthetic, repeat=1)
+
+    n = analyzer['connections'].num_vertices
+    components = logic.weak_component_count(analyzer)
+    weights = []
+    for mode, _, build in MODES:
+        queue = build(feed)
+        ms, result = bu.best_time(lambda: mst.kruskal(n, pq.copy(queue), components))
+        weights.append(round(result['weight'], 6))
+        ops = result['examined'] / (ms / 1000)
+        rows.append(("archivo de servicios", "Kruskal", mode, f"{ms:.1f}", f"{ops:,.0f}"))
+    assert weights[0] == weights[1]
+    bu.print_table(("conexiones", "carga", "modo", "ms", "operaciones/s"), rows)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
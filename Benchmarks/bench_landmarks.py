@@ -0,0 +1,75 @@
+"""
+Benchmark de A* con landmarks (ALT) contra Dijkstra.
+
+Mide el preprocesamiento para varios valores de k y, para cada uno,
+resuelve las mismas parejas origen-destino con Dijkstra (terminando al
+extraer el destino) y con ALT. Verifica que las distancias coincidan y
+reporta latencia, vértices extraídos y speedup.
+
+Uso:
+    python -m Benchmarks.bench_landmarks [número de parejas]
+"""
+import math
+import os
+import statistics
+import sys
+import time
+
+from Benchmarks import bench_utils as bu
+from Benchmarks.bench_bidirectional import stop_pairs
+from DataStructures.Graph import dijkstra as dk
+from DataStructures.Graph import landmarks as alt
+
+
+def run(function, pairs):
+    latencies, settled, distances = [], [], []
+    for source, target in pairs:
+        start = time.perf_counter()
+        distance, count = function(source, target)
+        latencies.append((time.perf_counter() - start) * 1000)
+        settled.append(count)
+        distances.append(distance)
+    return latencies, settled, distances
+
+
+def main(num_pairs=40, seed=3):
+    path, temporary = bu.services_file()
+    try:
+        analyzer = bu.load_analyzer(path)
+        pairs = stop_pairs(path, analyzer, num_pairs, seed)
+    finally:
+        if temporary:
+            os.remove(path)
+    graph = analyzer['connections']
+    print(f"Grafo: {graph.num_vertices} vértices, {graph.num_edges} arcos; {num_pairs} parejas")
+
+    def plain(source, target):
+        search = dk.dijkstra(graph, source, target)
+        return dk.dist_to(search, target), search['settled']
+
+    base_latencies, base_settled, base_distances = run(plain, pairs)
+    base_ms = statistics.mean(base_latencies)
+    rows = [("Dijkstra", "-", "-", f"{base_ms:.2f}", f"{statistics.mean(base_settled):.0f}", "1.0x")]
+
+    for k in (2, 4, 8, 16):
+        start = time.perf_counter()
+        lm = alt.preprocess(graph, k)
+        preprocess_ms = (time.perf_counter() - start) * 1000
+
+        def goal_directed(source, target):
+            result = alt.alt_search(graph, lm, source, target)
+            return result['distance'], result['settled']
+
+        latencies, settled, distances = run(goal_directed, pairs)
+        for distance, expected in zip(distances, base_distances):
+            assert distance == expected or math.isclose(distance, expected), (distance, expected)
+        ms = statistics.mean(latencies)
+        rows.append((f"ALT k={k}", f"{preprocess_ms:.0f}", len(lm['landmarks']), f"{ms:.2f}",
+                     f"{statistics.mean(settled):.0f}", f"{base_ms / ms:.1f}x"))
+
+    bu.print_table(("búsqueda", "preproc. ms", "landmarks", "ms promedio",
+                    "extraídos prom.", "speedup"), rows)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,72 @@
+"""
+Benchmark de Kruskal contra Prim (eager) sobre la red de conexiones.
+
+- Kruskal (cola del analizador): consume una copia de
+  analyzer['priority_queue'], que tiene una conexión por cada par de
+  paradas consecutivas de cada ruta (con aristas paralelas).
+- Kruskal (grafo no dirigido): construye la cola con las aristas de
+  logic.undirected_connections, una por par de paradas con la menor
+  distancia.
+- Prim: recorre el grafo de logic.undirected_connections con una cola
+  indexada.
+
+Los tres resuelven la misma instancia y deben dar el mismo peso total
+(igual que logic.minimum_spanning_tree con ambos métodos). Se reporta el
+tiempo (mejor de varias ejecuciones), el peso, el número de aristas y las
+conexiones examinadas, y aparte el tiempo de construir el grafo no
+dirigido.
+
+Uso:
+    python -m Benchmarks.bench_mst
+"""
+import math
+import os
+
+from App import logic
+from Benchmarks import bench_utils as bu
+from DataStructures.Graph import mst
+from DataStructures.Priority_queue import priority_queue as pq
+
+
+def main():
+    path, temporary = bu.services_file()
+    try:
+        analyzer = bu.load_analyzer(path)
+    finally:
+        if temporary:
+            os.remove(path)
+    graph = analyzer['connections']
+    n = graph.num_vertices
+    components = logic.weak_component_count(analyzer)
+    print(f"Grafo: {n} vértices, {graph.num_edges} arcos, "
+          f"{pq.size(analyzer['priority_queue'])} conexiones, {components} componentes")
+
+    def kruskal_connections():
+        return mst.kruskal(n, pq.copy(analyzer['priority_queue']), components)
+
+    undirected_ms, undirected = bu.best_time(logic.undirected_connections, analyzer)
+
+    def kruskal_graph():
+        return mst.kruskal(n, mst.edge_heap(undirected, logic.compare_distances), components)
+
+    def prim():
+        return mst.prim(undirected)
+
+    rows = []
+    results = {}
+    for name, function in (("Kruskal (cola del analizador)", kruskal_connections),
+                           ("Kruskal (grafo no dirigido)", kruskal_graph),
+                           ("Prim eager", prim)):
+        ms, result = bu.best_time(function)
+        results[name] = result
+        rows.append((name, f"{ms:.1f}", f"{result['weight']:.1f}", result['edges']['size'],
+                     result.get('examined', '-')))
+
+    weights = [result['weight'] for result in results.values()]
+    assert all(math.isclose(weight, weights[0]) for weight in weights)
+    bu.print_table(("algoritmo", "ms", "peso total", "aristas", "examinadas"), rows)
+    print(f"Grafo no dirigido: {undirected.num_edges} aristas en {undirected_ms:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Benchmark de la carga en paralelo del archivo de servicios.
+
+Compara la carga secuencial (read_services) con la carga en paralelo
+(read_services_parallel) con 2 y 4 procesos, y separa el trabajo que se
+reparte entre procesos (scan_fragment y load_fragment, sumados sobre
+todos los rangos) del que se hace en el proceso principal
+(fragment_tasks, la lectura de las cargas parciales que llegan de los
+procesos y merge_fragments). Con N núcleos libres la carga en paralelo
+tarda cerca de ms principal + ms procesos / N. Se verifica que todas las
+cargas produzcan el mismo grafo y la misma cola de conexiones.
+
+Uso:
+    python -m Benchmarks.bench_parallel_load [número de servicios sintéticos]
+"""
+import contextlib
+import gc
+import io
+import os
+import pickle
+import sys
+import time
+
+from App import logic
+from Benchmarks import bench_utils as bu
+from DataStructures.Priority_queue import priority_queue as pq
+
+WORKERS = (2, 4)
+
+
+def summary(analyzer):
+    graph = analyzer['connections']
+    return (graph.num_vertices, graph.num_edges, logic.weak_component_count(analyzer),
+            pq.size(analyzer['priority_queue']))
+
+
+def timed_load(function, *args):
+    gc.collect()
+    analyzer = logic.init()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        function(analyzer, *args)
+    return (time.perf_counter() - start) * 1000, analyzer
+
+
+def split_times(path, workers):
+    """
+    Retorna (ms de los procesos, ms del proceso principal) de la carga en
+    paralelo de path con workers procesos, ejecutada en un solo proceso
+    """
+    def elapsed(start):
+        return (time.perf_counter() - start) * 1000
+
+    columns, ranges = logic.service_ranges(path, workers * logic.RANGES_PER_WORKER)
+    gc.collect()
+    start = time.perf_counter()
+    scans = [logic.scan_fragment(path, begin, end, columns) for begin, end in ranges]
+    worker_ms = elapsed(start)
+    analyzer = logic.init()
+    start = time.perf_counter()
+    tasks = logic.fragment_tasks(analyzer, scans)
+    parent_ms = elapsed(start)
+    start = time.perf_counter()
+    fragments = [pickle.dumps(logic.load_fragment(path, begin, end, columns, task))
+                 for (begin, end), task in zip(ranges, tasks)]
+    worker_ms += elapsed(start)
+    gc.collect()
+    start = time.perf_counter()
+    with logic.paused_gc():
+        logic.merge_fragments(analyzer, map(pickle.loads, fragments),
+                              {'stops': 0, 'routes': 0, 'rows': 0})
+    parent_ms += elapsed(start)
+    return worker_ms, parent_ms
+
+
+def main(num_services=3000):
+    if os.path.exists(bu.SERVICES_FILE):
+        path, temporary = bu.SERVICES_FILE, False
+    else:
+        path, _ = bu.synthetic_feed(num_services=num_services, num_stops=10 * num_services,
+                                    num_hubs=num_services // 8)
+        temporary = True
+    try:
+        ms, analyzer = timed_load(logic.read_services, path)
+        reference = summary(analyzer)
+        del analyzer
+        rows = [("secuencial", f"{ms:.1f}", "-", "-")]
+        for workers in WORKERS:
+            ms, analyzer = timed_load(logic.read_services_parallel, path, workers)
+            assert summary(analyzer) == reference
+            del analyzer
+            worker_ms, parent_ms = split_times(path, workers)
+            rows.append((f"{workers} procesos", f"{ms:.1f}", f"{parent_ms:.1f}",
+                         f"{worker_ms:.1f}"))
+    finally:
+        if temporary:
+            os.remove(path)
+    print(f"Grafo: {reference[0]} vértices, {reference[1]} arcos, {reference[3]} conexiones, "
+          f"{os.cpu_count()} núcleos")
+    bu.print_table(("carga", "ms total", "ms principal", "ms procesos"), rows)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,81 @@
+"""
+Benchmark del caché de árboles de caminos más cortos (analyzer['paths']).
+
+La carga de consultas imita a los planificadores: muchas consultas desde
+unas pocas paradas de origen (las de mayor grado de salida) hacia
+destinos al azar. Se compara:
+
+- Dijkstra por consulta, con parada temprana en el destino.
+- Dijkstra bidireccional por consulta.
+- Caché LRU: cada origen se busca una vez y las consultas siguientes
+  solo recorren el arreglo de padres. Se prueba con un límite holgado y
+  con uno que solo admite la mitad de los orígenes (hay desalojos).
+
+Se reporta el tiempo total (mejor de varias ejecuciones), el tiempo por
+consulta y los contadores del caché.
+
+Uso:
+    python -m Benchmarks.bench_path_cache
+"""
+import math
+import os
+import random
+
+from Benchmarks import bench_utils as bu
+from DataStructures.Graph import dijkstra as dk
+from DataStructures.Graph import path_cache as spc
+
+NUM_ORIGINS = 8
+NUM_QUERIES = 300
+
+
+def main():
+    path, temporary = bu.services_file()
+    try:
+        analyzer = bu.load_analyzer(path)
+    finally:
+        if temporary:
+            os.remove(path)
+    graph = analyzer['connections']
+    n = graph.num_vertices
+    print(f"Grafo: {n} vértices, {graph.num_edges} arcos")
+
+    rnd = random.Random(11)
+    origins = sorted(range(n), key=graph.outdegree_of, reverse=True)[:NUM_ORIGINS]
+    queries = [(rnd.choice(origins), rnd.randrange(n)) for _ in range(NUM_QUERIES)]
+
+    def per_query():
+        return [dk.dijkstra(graph, s, t)['dist_to'][t] for s, t in queries]
+
+    def bidirectional():
+        return [dk.bidirectional_dijkstra(graph, s, t)['distance'] for s, t in queries]
+
+    def cached(max_bytes):
+        def run():
+            cache = spc.new_path_cache(max_bytes)
+            distances = [spc.shortest_path_tree(cache, graph, s)['dist_to'][t]
+                         for s, t in queries]
+            return distances, spc.stats(cache)
+        return run
+
+    tree_size = spc.tree_bytes(spc.shortest_path_tree(spc.new_path_cache(), graph, 0))
+    rows = []
+    reference = None
+    for name, function in (("Dijkstra por consulta", per_query),
+                           ("Dijkstra bidireccional", bidirectional),
+                           ("caché (holgado)", cached(spc.DEFAULT_MAX_BYTES)),
+                           ("caché (mitad de orígenes)", cached(tree_size * NUM_ORIGINS // 2))):
+        ms, result = bu.best_time(function)
+        distances, stats = result if isinstance(result, tuple) else (result, None)
+        if reference is None:
+            reference = distances
+        assert all(math.isclose(a, b) or a == b for a, b in zip(reference, distances))
+        counters = "-" if stats is None else \
+            f"{stats['hits']}/{stats['misses']}/{stats['evictions']}"
+        rows.append((name, f"{ms:.1f}", f"{ms * 1000 / NUM_QUERIES:.1f}", counters))
+    bu.print_table(("estrategia", "ms total", "µs/consulta", "hits/misses/evictions"), rows)
+    print(f"Tamaño de un árbol: {tree_size / 1024:.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+Benchmark del planificador RAPTOR contra Dijkstra con penalización por
+transbordo.
+
+La red de conexiones guarda un solo arco por pareja de paradas y no
+distingue rutas, así que la línea base usa la red de arcos expandida por
+ruta: un vértice por parada y uno por (ruta, posición); subir al bus
+desde la parada cuesta la penalización, avanzar por la ruta cuesta el
+peso del tramo y bajar a la parada no cuesta nada. Dijkstra minimiza
+distancia + penalización * tramos y retorna un solo viaje.
+
+Para cada pareja origen-destino se calcula el frente de Pareto con
+RAPTOR y el viaje de Dijkstra con varias penalizaciones. Se verifica que
+ningún viaje de Dijkstra domine al frente y se reporta la latencia y la
+fracción de puntos del frente que encuentra cada penalización.
+
+Uso:
+    python -m Benchmarks.bench_raptor [número de parejas]
+"""
+import math
+import os
+import statistics
+import sys
+import time
+
+from App import logic
+from Benchmarks import bench_utils as bu
+from Benchmarks.bench_bidirectional import stop_pairs
+from DataStructures.Graph import adj_list_graph as gr
+from DataStructures.Graph import dijkstra as dk
+from DataStructures.Graph import raptor
+
+PENALTIES = (0.0, 1.0, 5.0, 20.0)
+
+
+def expanded_graph(network, penalty):
+    """
+    Grafo expandido por ruta. Los vértices 0..n-1 son las paradas
+    """
+    graph = gr.adj_list_graph(directed=True)
+    next_vertex = network['num_stops']
+    graph.insert_vertices(range(next_vertex))
+    edges = []
+    for stops, weights in zip(network['stops'], network['weights']):
+        first = next_vertex
+        next_vertex += len(stops)
+        graph.insert_vertices(range(first, next_vertex))
+        for position, stop in enumerate(stops):
+            vertex = first + position
+            edges.append((stop, vertex, penalty))
+            edges.append((vertex, stop, 0.0))
+            if position > 0 and weights[position] < math.inf:
+                edges.append((vertex - 1, vertex, weights[position]))
+    graph.add_edges(edges)
+    return graph
+
+
+def penalised(graph, num_stops, penalty, source, target):
+    """
+    Retorna (transbordos, distancia) del viaje de Dijkstra, o None si no
+    hay camino
+    """
+    search = dk.dijkstra(graph, source, target)
+    path = dk.path_to(search, target)
+    if path is None:
+        return None
+    vertices = path['elements']
+    trips = sum(1 for tail, head in zip(vertices, vertices[1:])
+                if tail < num_stops <= head)
+    return trips - 1, dk.dist_to(search, target) - penalty * trips
+
+
+def main(num_pairs=30, seed=4, max_transfers=4):
+    path, temporary = bu.services_file()
+    try:
+        analyzer = bu.load_analyzer(path)
+        pairs = [(source, target) for source, target in stop_pairs(path, analyzer, num_pairs, seed)
+                 if source != target]
+    finally:
+        if temporary:
+            os.remove(path)
+    network = logic.build_planner(analyzer)
+    n = network['num_stops']
+    print(f"Red: {n} paradas, {len(network['route_ids'])} rutas; {len(pairs)} parejas")
+
+    latencies, fronts = [], []
+    for source, target in pairs:
+        start = time.perf_counter()
+        result = raptor.journeys(network, source, target, max_transfers)
+        latencies.append((time.perf_counter() - start) * 1000)
+        fronts.append([(journey['transfers'], journey['distance']) for journey in result['elements']])
+    rows = [("RAPTOR", f"{statistics.mean(latencies):.2f}", f"{statistics.median(latencies):.2f}",
+             f"{statistics.mean(len(front) for front in fronts):.2f}", "100%")]
+
+    for penalty in PENALTIES:
+        graph = expanded_graph(network, penalty)
+        latencies, found, total = [], 0, 0
+        for (source, target), front in zip(pairs, fronts):
+            start = time.perf_counter()
+            journey = penalised(graph, n, penalty, source, target)
+            latencies.append((time.perf_counter() - start) * 1000)
+            total += len(front)
+            if journey is None:
+                assert not front
+                continue
+            transfers, distance = journey
+            # Ningún viaje puede dominar al frente de Pareto
+            assert any(t <= transfers and d <= distance + 1e-9 for t, d in front
+                       if t <= max_transfers) or transfers > max_transfers, (journey, front)
+            if any(t == transfers and math.isclose(d, distance) for t, d in front):
+                found += 1
+        rows.append((f"Dijkstra p={penalty:g}", f"{statistics.mean(latencies):.2f}",
+                     f"{statistics.median(latencies):.2f}", "1",
+                     f"{100 * found / max(total, 1):.0f}%"))
+
+    bu.print_table(("planificador", "ms promedio", "ms mediana", "viajes/consulta",
+                    "frente cubierto"), rows)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,149 @@
+"""
+Benchmark del índice de rutas por parada.
+
+Compara el registro de las rutas de una parada del cargador actual
+(logic.add_stop_route: recorre la lista hasta ROUTE_INDEX_THRESHOLD rutas
+y desde ahí usa el índice hash) con el recorrido lineal de la lista de
+rutas del cargador anterior (scan_stop_route, que reproduce ese código).
+Se mide:
+
+- el registro de rutas en una sola parada intercambiadora, con 10 a 800
+  rutas;
+- el cargador completo (logic.load_services) con add_stop_route y con el
+  recorrido lineal en su lugar, primero sobre el archivo de servicios (o
+  uno sintético con la distribución por defecto de bench_utils, donde la
+  parada más concurrida tiene decenas de rutas) y luego sobre archivos
+  con intercambiadores cada vez más concurridos. Se verifica que ambas
+  cargas den las mismas listas de rutas.
+
+Uso:
+    python -m Benchmarks.bench_route_index
+"""
+import gc
+import math
+import os
+import random
+import time
+
+from App import logic
+from Benchmarks import bench_utils as bu
+from DataStructures.List import array_list as lt
+from DataStructures.Map import map_linear_probing as m
+
+
+def scan_stop_route(stop_info, route_id, service_id, direction):
+    """
+    Registro de una ruta en una parada del cargador anterior: recorre la
+    lista de rutas de la parada. Misma firma que logic.add_stop_route
+    """
+    route_list = stop_info['routes']
+    i = 0
+    while i < lt.size(route_list):
+        route = lt.get_element(route_list, i)
+        if route is not None and route['id'] == route_id:
+            return False
+        i += 1
+    lt.add_last(route_list, {'id': route_id, 'service': service_id,
+                             'direction': direction})
+    return True
+
+
+def hub_rows(num_routes, visits_per_route=4, seed=11):
+    """
+    Filas (ruta, servicio, dirección) que pasan por una misma parada
+    """
+    rnd = random.Random(seed)
+    rows = [(f"{r}-{d}", str(r), str(d))
+            for r in range(num_routes) for d in (1, 2)] * visits_per_route
+    rnd.shuffle(rows)
+    return rows
+
+
+def register(add_route, rows):
+    stop_info = {'routes': lt.new_list(), 'route_index': None}
+    for route_id, service_id, direction in rows:
+        add_route(stop_info, route_id, service_id, direction)
+    return [route['id'] for route in stop_info['routes']['elements']]
+
+
+def load(path, add_route):
+    """
+    Carga el archivo con logic.load_services usando add_route para
+    registrar las rutas de cada parada
+    """
+    original = logic.add_stop_route
+    logic.add_stop_route = add_route
+    try:
+        return bu.load_analyzer(path)
+    finally:
+        logic.add_stop_route = original
+
+
+def route_lists(analyzer):
+    return {stop['code']: [route['id'] for route in stop['routes']['elements']]
+            for stop in m.value_set(analyzer['stops'])['elements']}
+
+
+def timed_load(path, add_route):
+    """
+    Retorna (ms, listas de rutas) de una carga. El analizador se descarta
+    antes de la siguiente, para que no haga más lento al recolector de
+    basura de la carga que se mide después
+    """
+    gc.collect()
+    start = time.perf_counter()
+    analyzer = load(path, add_route)
+    return (time.perf_counter() - start) * 1000, route_lists(analyzer)
+
+
+def compare_loads(path, name, rows, repeat=5):
+    """
+    Mejor tiempo de repeat cargas con cada registro de rutas, alternadas
+    """
+    scan_ms = index_ms = math.inf
+    for _ in range(repeat):
+        ms, scanned = timed_load(path, scan_stop_route)
+        scan_ms = min(scan_ms, ms)
+        ms, indexed = timed_load(path, logic.add_stop_route)
+        index_ms = min(index_ms, ms)
+        assert scanned == indexed
+    busiest = max(len(routes) for routes in indexed.values())
+    return (name, rows, busiest, f"{scan_ms:.0f}", f"{index_ms:.0f}",
+            f"{scan_ms / index_ms:.2f}x")
+
+
+def main():
+    print("Registro de rutas en una parada intercambiadora")
+    table = []
+    for num_routes in (5, 25, 50, 100, 200, 400):
+        rows = hub_rows(num_routes)
+        scan_ms, scanned = bu.best_time(register, scan_stop_route, rows)
+        index_ms, indexed = bu.best_time(register, logic.add_stop_route, rows)
+        assert scanned == indexed
+        table.append((num_routes * 2, len(rows), f"{scan_ms:.2f}", f"{index_ms:.2f}",
+                      f"{scan_ms / index_ms:.1f}x"))
+    bu.print_table(("rutas", "filas", "lineal ms", "actual ms", "speedup"), table)
+
+    print("\nCargador completo (load_services)")
+    table = []
+    path, temporary = bu.services_file()
+    try:
+        with open(path, encoding="utf-8") as services:
+            rows = sum(1 for _ in services) - 1
+        table.append(compare_loads(path, "realista" if temporary else "archivo", rows))
+    finally:
+        if temporary:
+            os.remove(path)
+    for num_hubs, hub_ratio in ((40, 0.15), (10, 0.3), (5, 0.5)):
+        path, rows = bu.synthetic_feed(num_services=600, num_stops=2000, num_hubs=num_hubs,
+                                       hub_ratio=hub_ratio)
+        try:
+            table.append(compare_loads(path, f"{num_hubs} hubs, {hub_ratio}", rows))
+        finally:
+            os.remove(path)
+    bu.print_table(("archivo", "filas", "máx. rutas", "lineal ms", "actual ms", "speedup"),
+                   table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Utilidades comunes para los benchmarks del laboratorio.
+
+Los benchmarks usan el archivo oficial Data/bus_routes_14000.csv cuando
+existe. Si no está disponible generan un archivo sintético con el mismo
+formato (mismas columnas, rutas por dirección y distancia acumulada).
+"""
+import contextlib
+import csv
+import io
+import os
+import random
+import tempfile
+import time
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'Data')
+SERVICES_FILE = os.path.join(DATA_DIR, 'bus_routes_14000.csv')
+
+HEADER = ['ServiceNo', 'Operator', 'Direction', 'StopSequence', 'BusStopCode',
+          'Distance', 'WD_FirstBus', 'WD_LastBus', 'SAT_FirstBus', 'SAT_LastBus',
+          'SUN_FirstBus', 'SUN_LastBus']
+
+
+def synthetic_feed(num_services=300, num_stops=3000, num_hubs=40,
+                   hub_ratio=0.15, min_len=15, max_len=45, seed=7):
+    """
+    Escribe un archivo de servicios sintético en un directorio temporal.
+
+    Cada servicio tiene dos direcciones (ida y vuelta por las mismas
+    paradas). Una fracción hub_ratio de las paradas de cada servicio se
+    toma de num_hubs intercambiadores, que concentran muchas rutas.
+
+    Returns:
+        (ruta del archivo, número de filas)
+    """
+    rnd = random.Random(seed)
+    stops = [f"{10000 + i:05d}" for i in range(num_stops)]
+    hubs = stops[:num_hubs]
+    fd, path = tempfile.mkstemp(prefix='bus_routes_', suffix='.csv')
+    rows = 0
+    with os.fdopen(fd, 'w', newline='', encoding='utf-8') as output:
+        writer = csv.writer(output)
+        writer.writerow(HEADER)
+        for service in range(1, num_services + 1):
+            sequence = [rnd.choice(hubs) if rnd.random() < hub_ratio else rnd.choice(stops)
+                        for _ in range(rnd.randint(min_len, max_len))]
+            for direction in (1, 2):
+                ordered = sequence if direction == 1 else sequence[::-1]
+                distance = 0.0
+                for position, code in enumerate(ordered, 1):
+                    writer.writerow([service, 'SBST', direction, position, code,
+                                     f"{distance:.1f}", '0500', '2300', '0500',
+                                     '2300', '0500', '2300'])
+                    distance += round(rnd.uniform(0.2, 1.5), 1)
+                    rows += 1
+    return path, rows
+
+
+def services_file(**synthetic_args):
+    """
+    Retorna (ruta, es_temporal) del archivo de servicios a usar
+    """
+    if os.path.exists(SERVICES_FILE):
+        return SERVICES_FILE, False
+    path, _ = synthetic_feed(**synthetic_args)
+    return path, True
+
+
+def load_analyzer(path, **load_args):
+    """
+    Carga un analizador desde path sin imprimir el progreso del cargador
+    y sin leer ni escribir instantáneas
+    """
+    from App import logic
+    load_args.setdefault('use_snapshot', False)
+    with contextlib.redirect_stdout(io.StringIO()):
+        return logic.load_services(logic.init(), path, **load_args)
+
+
+def best_time(function, *args, repeat=3):
+    """
+    Ejecuta function(*args) repeat veces y retorna
+    (mejor tiempo en ms, resultado de la última ejecución)
+    """
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function(*args)
+        elapsed = (time.perf_counter() - start) * 1000
+        if best is None or elapsed < best:
+            best = elapsed
+    return best, result
+
+
+def print_table(headers, rows):
+    """
+    Imprime una tabla alineada con los resultados de un benchmark
+    """
+    widths = [max(len(str(value)) for value in column) for column in zip(headers, *rows)]
+    line = "  ".join(f"{{:>{w}}}" for w in widths)
+    print(line.format(*headers))
+    print(line.format(*("-" * w for w in widths)))
+    for row in rows:
+        print(line.format(*row))
@@ -0,0 +1,124 @@
+"""
+Benchmark de los k caminos más cortos sin ciclos (Yen).
+
+Compara yen.k_shortest_paths (árbol hacia el destino reutilizado,
+búsquedas spur con A*, raíces en caché y modificación de Lawler) con una
+versión básica de Yen que hace un Dijkstra completo por cada vértice
+spur. Verifica que ambas den las mismas distancias y reporta, para cada
+k, la latencia y el número de búsquedas spur.
+
+Uso:
+    python -m Benchmarks.bench_yen [número de parejas]
+"""
+import heapq
+import math
+import os
+import statistics
+import sys
+import time
+
+from Benchmarks import bench_utils as bu
+from Benchmarks.bench_bidirectional import stop_pairs
+from DataStructures.Graph import yen
+
+K_VALUES = (3, 5, 10, 20)
+
+
+def restricted_dijkstra(graph, source, target, banned_vertices, banned_next):
+    dist = {source: 0.0}
+    parent = {}
+    heap = [(0.0, source)]
+    while heap:
+        base, vertex = heapq.heappop(heap)
+        if base > dist[vertex]:
+            continue
+        if vertex == target:
+            path = [vertex]
+            while vertex != source:
+                vertex = parent[vertex]
+                path.append(vertex)
+            return path[::-1], base
+        for adjacent, weight in graph.iter_adjacent_edges(vertex):
+            if adjacent in banned_vertices or (vertex == source and adjacent in banned_next):
+                continue
+            if base + weight < dist.get(adjacent, math.inf):
+                dist[adjacent] = base + weight
+                parent[adjacent] = vertex
+                heapq.heappush(heap, (base + weight, adjacent))
+    return None
+
+
+def basic_yen(graph, source, target, k):
+    """
+    Yen sin optimizaciones. Retorna (distancias, búsquedas spur)
+    """
+    first = restricted_dijkstra(graph, source, target, set(), set())
+    if first is None:
+        return [], 1
+    accepted = [first]
+    candidates = []
+    searches = 1
+    while len(accepted) < k:
+        path = accepted[-1][0]
+        for i in range(len(path) - 1):
+            root = path[:i + 1]
+            banned_next = {other[i + 1] for other, _ in accepted if other[:i + 1] == root}
+            searches += 1
+            spur = restricted_dijkstra(graph, path[i], target, set(root[:-1]), banned_next)
+            if spur is None:
+                continue
+            root_cost = sum(graph.get_edge_weight(a, b) for a, b in zip(root, root[1:]))
+            candidate = (root_cost + spur[1], root[:-1] + spur[0])
+            if candidate not in candidates and all(candidate[1] != other for other, _ in accepted):
+                candidates.append(candidate)
+        if not candidates:
+            break
+        candidates.sort()
+        cost, best = candidates.pop(0)
+        accepted.append((best, cost))
+    return [cost for _, cost in accepted], searches
+
+
+def main(num_pairs=10, seed=6):
+    path, temporary = bu.services_file()
+    try:
+        analyzer = bu.load_analyzer(path)
+        pairs = [(source, target) for source, target in stop_pairs(path, analyzer, num_pairs, seed)
+                 if source != target]
+    finally:
+        if temporary:
+            os.remove(path)
+    graph = analyzer['connections']
+    print(f"Grafo: {graph.num_vertices} vértices, {graph.num_edges} arcos; {len(pairs)} parejas")
+
+    rows = []
+    for k in K_VALUES:
+        fast_ms, basic_ms, searches, reuses, basic_searches = [], [], [], [], []
+        for source, target in pairs:
+            start = time.perf_counter()
+            result = yen.k_shortest_paths(graph, source, target, k)
+            fast_ms.append((time.perf_counter() - start) * 1000)
+            searches.append(result['spur_searches'])
+            reuses.append(result['tree_reuses'])
+
+            start = time.perf_counter()
+            expected, count = basic_yen(graph, source, target, k)
+            basic_ms.append((time.perf_counter() - start) * 1000)
+            basic_searches.append(count)
+
+            distances = [entry['distance'] for entry in result['paths']['elements']]
+            assert len(distances) == len(expected)
+            for distance, cost in zip(distances, expected):
+                assert math.isclose(distance, cost), (distances, expected)
+
+        rows.append((k, f"{statistics.mean(basic_ms):.1f}", f"{statistics.mean(basic_searches):.0f}",
+                     f"{statistics.mean(fast_ms):.1f}", f"{statistics.mean(searches):.0f}",
+                     f"{statistics.mean(reuses):.0f}",
+                     f"{statistics.mean(basic_ms) / statistics.mean(fast_ms):.1f}x"))
+
+    bu.print_table(("k", "básico ms", "búsquedas", "optimizado ms", "búsquedas A*",
+                    "del árbol", "speedup"), rows)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
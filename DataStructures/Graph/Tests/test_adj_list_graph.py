@@ -0,0 +1,167 @@
+import pytest
+
+from DataStructures.Graph import adj_list_graph as gr
+
+
+def setup_tests():
+    empty_graph = gr.adj_list_graph(directed=True)
+
+    some_graph = gr.adj_list_graph(directed=True)
+    for vertex in range(5):
+        some_graph.insert_vertex(vertex)
+    some_graph.add_edge(0, 1, 1.5)
+    some_graph.add_edge(0, 2, 2.0)
+    some_graph.add_edge(1, 2, 0.5)
+    some_graph.add_edge(2, 3, 4.0)
+    some_graph.add_edge(3, 0, 1.0)
+
+    return empty_graph, some_graph
+
+
+def test_add_edge():
+    empty_graph, some_graph = setup_tests()
+
+    assert empty_graph.add_edge("A", "B", 3) == True
+    assert empty_graph.num_vertices == 2
+    assert empty_graph.num_edges == 1
+
+    assert some_graph.add_edge(0, 1, 7.0) == False
+    assert some_graph.num_edges == 5
+    assert some_graph.get_edge_weight(0, 1) == 7.0
+    assert some_graph.indegree_of(2) == 2
+
+
+def test_freeze():
+    _, some_graph = setup_tests()
+    frozen = some_graph.freeze()
+
+    assert frozen.num_vertices == some_graph.num_vertices
+    assert frozen.num_edges == some_graph.num_edges
+    for vertex in some_graph.all_vertices():
+        assert frozen.get_adjacent_vertices(vertex) == some_graph.get_adjacent_vertices(vertex)
+        assert frozen.degree(vertex) == some_graph.degree(vertex)
+        assert frozen.indegree_of(vertex) == some_graph.indegree_of(vertex)
+        for adjacent in some_graph.get_adjacent_vertices(vertex):
+            assert frozen.get_edge_weight(vertex, adjacent) == some_graph.get_edge_weight(vertex, adjacent)
+
+    assert frozen.get_edge_weight(4, 0) is None
+    assert frozen.get_adjacent_vertices(99) == []
+    assert frozen.degree(99) == 0
+
+
+def test_freeze_non_dense_ids():
+    empty_graph, _ = setup_tests()
+    empty_graph.add_edge("A", "B", 3)
+    empty_graph.add_edge("B", "C", 1)
+    frozen = empty_graph.freeze()
+
+    assert frozen.get_adjacent_vertices("A") == ["B"]
+    assert frozen.get_edge_weight("B", "C") == 1
+    assert frozen.indegree_of("C") == 1
+
+
+def test_frozen_is_immutable():
+    _, some_graph = setup_tests()
+    frozen = some_graph.freeze()
+
+    with pytest.raises(TypeError):
+        frozen.add_edge(0, 4, 1.0)
+    with pytest.raises(TypeError):
+        frozen.insert_vertex(5)
+
+
+def test_adjacency_order_and_lookup():
+    empty_graph, _ = setup_tests()
+    for destination in range(1, 200):
+        empty_graph.add_edge(0, destination, destination / 2)
+
+    assert empty_graph.get_adjacent_vertices(0) == list(range(1, 200))
+    assert empty_graph.get_edge_weight(0, 150) == 75.0
+    assert empty_graph.get_edge_weight(0, 500) is None
+
+    assert empty_graph.add_edge(0, 150, 1.0) == False
+    assert empty_graph.get_edge_weight(0, 150) == 1.0
+    assert empty_graph.degree(0) == 199
+    assert empty_graph.get_adjacent_vertices(0) == list(range(1, 200))
+
+
+def test_iter_adjacent():
+    empty_graph, some_graph = setup_tests()
+    frozen = some_graph.freeze()
+
+    for graph in (some_graph, frozen):
+        assert list(graph.iter_adjacent(0)) == [1, 2]
+        assert list(graph.iter_adjacent_edges(0)) == [(1, 1.5), (2, 2.0)]
+        assert list(graph.iter_adjacent(4)) == []
+        assert list(graph.iter_adjacent(99)) == []
+
+    empty_graph.add_edge("A", "B", 3)
+    assert list(empty_graph.freeze().iter_adjacent_edges("A")) == [("B", 3)]
+
+
+def test_predecessors():
+    _, some_graph = setup_tests()
+    indexed_graph = gr.adj_list_graph(directed=True, reverse_index=True)
+    for vertex in range(5):
+        indexed_graph.insert_vertex(vertex)
+    for source in some_graph.all_vertices():
+        for destination, weight in some_graph.iter_adjacent_edges(source):
+            indexed_graph.add_edge(source, destination, weight)
+    indexed_graph.add_edge(1, 2, 9.0)
+
+    for graph in (some_graph, indexed_graph, indexed_graph.freeze()):
+        assert sorted(graph.get_predecessors(2)) == [0, 1]
+        assert graph.get_predecessors(4) == []
+    assert sorted(some_graph.iter_predecessor_edges(2)) == [(0, 2.0), (1, 0.5)]
+    assert sorted(indexed_graph.iter_predecessor_edges(2)) == [(0, 2.0), (1, 9.0)]
+    assert sorted(indexed_graph.freeze().iter_predecessor_edges(2)) == [(0, 2.0), (1, 9.0)]
+
+    undirected_graph = gr.adj_list_graph()
+    undirected_graph.add_edge("A", "B", 1)
+    assert undirected_graph.get_predecessors("A") == ["B"]
+
+
+def test_epoch():
+    empty_graph, some_graph = setup_tests()
+    assert empty_graph.epoch == 0
+
+    epoch = some_graph.epoch
+    some_graph.insert_vertex(0)
+    some_graph.add_edge(0, 1, 1.5)
+    assert some_graph.epoch == epoch
+    some_graph.add_edge(0, 1, 2.5)
+    assert some_graph.epoch == epoch + 1
+    some_graph.add_edge(4, 0, 1.0)
+    some_graph.insert_vertex(5)
+    assert some_graph.epoch == epoch + 3
+    assert some_graph.freeze().epoch == some_graph.epoch
+
+
+def test_insert_vertices():
+    empty_graph, some_graph = setup_tests()
+
+    assert empty_graph.insert_vertices(iter(range(4))) == 4
+    assert empty_graph.num_vertices == 4
+    assert list(empty_graph.all_vertices()) == [0, 1, 2, 3]
+
+    assert some_graph.insert_vertices([3, 4, 5, 5, 6]) == 2
+    assert some_graph.num_vertices == 7
+    assert some_graph.indegree_of(6) == 0
+    assert some_graph.get_adjacent_vertices(3) == [0]
+
+
+def test_add_edges():
+    _, some_graph = setup_tests()
+    indexed_graph = gr.adj_list_graph(directed=True, reverse_index=True)
+
+    edges = [(0, 1, 9.0), (1, 4, 2.0), (4, 0, 3.0), (1, 4, 2.5)]
+    assert some_graph.add_edges(edges) == 2
+    assert some_graph.num_edges == 7
+    assert some_graph.get_edge_weight(0, 1) == 9.0
+    assert some_graph.get_edge_weight(1, 4) == 2.5
+    assert some_graph.indegree_of(0) == 2
+
+    assert indexed_graph.add_edges(edges) == 3
+    assert indexed_graph.num_vertices == 3
+    assert sorted(indexed_graph.iter_predecessor_edges(4)) == [(1, 2.5)]
+    assert indexed_graph.add_edges([]) == 0
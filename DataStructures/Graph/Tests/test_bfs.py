@@ -0,0 +1,86 @@
+from collections import deque
+
+from DataStructures.Graph import adj_list_graph as gr
+from DataStructures.Graph import bfs
+from DataStructures.Graph.Tests.test_dijkstra import random_graph
+
+
+def setup_tests():
+    # 0 -> 1 -> 2 -> 3 -> 4, 5 -> 3
+    graph = gr.adj_list_graph(directed=True)
+    for vertex in range(6):
+        graph.insert_vertex(vertex)
+    for source, destination in ((0, 1), (1, 2), (2, 3), (3, 4), (5, 3)):
+        graph.add_edge(source, destination, 7.0)
+    return graph
+
+
+def plain_hops(graph, sources):
+    hops = {source: 0 for source in sources}
+    queue = deque(sources)
+    while queue:
+        vertex = queue.popleft()
+        for adjacent in graph.iter_adjacent(vertex):
+            if adjacent not in hops:
+                hops[adjacent] = hops[vertex] + 1
+                queue.append(adjacent)
+    return hops
+
+
+def test_search():
+    graph = setup_tests()
+    engine = bfs.new_bfs(6)
+    bfs.search(engine, graph, [0])
+    assert [bfs.hops_to(engine, v) for v in range(6)] == [0, 1, 2, 3, 4, -1]
+    assert bfs.path_to(engine, 4)["elements"] == [0, 1, 2, 3, 4]
+    assert bfs.path_to(engine, 5) is None
+    assert engine["reached"] == 5
+
+
+def test_multi_source():
+    graph = setup_tests()
+    engine = bfs.new_bfs(6)
+    bfs.search(engine, graph, [0, 5])
+    assert bfs.hops_to(engine, 4) == 2
+    assert bfs.path_to(engine, 4)["elements"] == [5, 3, 4]
+
+    graph = random_graph(num_vertices=60, num_edges=120)
+    for sources in ([0], [1, 2, 3], list(range(0, 60, 10))):
+        bfs.search(engine, graph, sources)
+        expected = plain_hops(graph, sources)
+        for vertex in range(60):
+            assert bfs.hops_to(engine, vertex) == expected.get(vertex, -1)
+
+
+def test_max_depth():
+    graph = setup_tests()
+    engine = bfs.new_bfs()
+    bfs.search(engine, graph, [0], max_depth=2)
+    assert [bfs.hops_to(engine, v) for v in range(6)] == [0, 1, 2, -1, -1, -1]
+    assert engine["reached"] == 3
+
+
+def test_targets():
+    graph = setup_tests()
+    engine = bfs.new_bfs(6)
+    bfs.search(engine, graph, [0], targets=[2])
+    assert bfs.hops_to(engine, 2) == 2
+    assert bfs.hops_to(engine, 4) == -1
+    assert engine["targets_left"] == 0
+
+    bfs.search(engine, graph, [0], targets=[2, 5])
+    assert bfs.hops_to(engine, 4) == 4
+    assert engine["targets_left"] == 1
+
+
+def test_reuse():
+    graph = setup_tests()
+    engine = bfs.new_bfs(6)
+    bfs.search(engine, graph, [0])
+    bfs.search(engine, graph, [4])
+    assert [bfs.hops_to(engine, v) for v in range(6)] == [-1, -1, -1, -1, 0, -1]
+
+    graph.insert_vertex(6)
+    graph.add_edge(4, 6, 1.0)
+    bfs.search(engine, graph, [3])
+    assert bfs.hops_to(engine, 6) == 2
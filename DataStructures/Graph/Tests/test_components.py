@@ -0,0 +1,69 @@
+from DataStructures.Graph import adj_list_graph as gr
+from DataStructures.Graph import components as cc
+from DataStructures.Graph.Tests.test_dijkstra import random_graph
+
+
+def reachable(graph, source):
+    seen = {source}
+    stack = [source]
+    while stack:
+        vertex = stack.pop()
+        for adjacent in graph.iter_adjacent(vertex):
+            if adjacent not in seen:
+                seen.add(adjacent)
+                stack.append(adjacent)
+    return seen
+
+
+def setup_tests():
+    # 0 -> 1 -> 2 -> 0 es un ciclo, 2 -> 3 -> 4 -> 3; 5 está aislado
+    graph = gr.adj_list_graph(directed=True)
+    for vertex in range(6):
+        graph.insert_vertex(vertex)
+    for source, destination in ((0, 1), (1, 2), (2, 0), (2, 3), (3, 4), (4, 3)):
+        graph.add_edge(source, destination, 1.0)
+    return graph
+
+
+def test_strongly_connected():
+    graph = setup_tests()
+    components = cc.strongly_connected(graph)
+    assert cc.count(components) == 3
+    assert cc.same_component(components, 0, 2)
+    assert cc.same_component(components, 3, 4)
+    assert not cc.same_component(components, 2, 3)
+    assert not cc.same_component(components, 4, 5)
+
+
+def test_weakly_connected():
+    graph = setup_tests()
+    components = cc.weakly_connected(graph)
+    assert cc.count(components) == 2
+    assert cc.same_component(components, 0, 4)
+    assert not cc.same_component(components, 0, 5)
+    assert cc.component_of(components, 0) == 0
+    assert cc.component_of(components, 5) == 1
+
+
+def test_strongly_connected_random():
+    graph = random_graph(num_vertices=60, num_edges=90)
+    components = cc.strongly_connected(graph)
+    reach = [reachable(graph, vertex) for vertex in range(60)]
+    for vertex1 in range(60):
+        for vertex2 in range(60):
+            mutual = vertex2 in reach[vertex1] and vertex1 in reach[vertex2]
+            assert cc.same_component(components, vertex1, vertex2) == mutual
+    assert cc.count(components) == len(set(components["id"]))
+
+
+def test_long_path():
+    # Un camino de 20000 vértices no debe agotar la pila de recursión
+    graph = gr.adj_list_graph(directed=True)
+    for vertex in range(20000):
+        graph.insert_vertex(vertex)
+    for vertex in range(1, 20000):
+        graph.add_edge(vertex - 1, vertex, 1.0)
+    assert cc.count(cc.strongly_connected(graph)) == 20000
+    graph.add_edge(19999, 0, 1.0)
+    assert cc.count(cc.strongly_connected(graph)) == 1
+    assert cc.count(cc.weakly_connected(graph)) == 1
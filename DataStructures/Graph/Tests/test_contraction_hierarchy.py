@@ -0,0 +1,51 @@
+import math
+
+from DataStructures.Graph import contraction_hierarchy as ch
+from DataStructures.Graph import dijkstra as dk
+from DataStructures.Graph.Tests.test_dijkstra import random_graph, setup_tests
+
+
+def path_length(graph, path):
+    total = 0.0
+    for tail, head in zip(path, path[1:]):
+        total += graph.get_edge_weight(tail, head)
+    return total
+
+
+def test_build():
+    graph = random_graph()
+    hierarchy = ch.build(graph)
+
+    assert sorted(hierarchy["rank"]) == list(range(60))
+    for vertex in range(60):
+        for adjacent, _ in hierarchy["up"][vertex]:
+            assert hierarchy["rank"][adjacent] > hierarchy["rank"][vertex]
+        for adjacent, _ in hierarchy["down"][vertex]:
+            assert hierarchy["rank"][adjacent] > hierarchy["rank"][vertex]
+    assert hierarchy["shortcuts"] == len(hierarchy["middle"])
+    for (source, target), via in hierarchy["middle"].items():
+        assert hierarchy["rank"][via] < min(hierarchy["rank"][source], hierarchy["rank"][target])
+
+
+def test_query():
+    graph = setup_tests()
+    hierarchy = ch.build(graph)
+    result = ch.query(hierarchy, 0, 4)
+    assert result["distance"] == 20
+    assert result["path"]["elements"] == [0, 2, 5, 4]
+    assert ch.query(hierarchy, 4, 0)["path"] is None
+    assert ch.distance(hierarchy, 4, 0) == math.inf
+
+
+def test_query_random():
+    graph = random_graph()
+    hierarchy = ch.build(graph)
+    for source in range(0, 60, 3):
+        exact = dk.dijkstra(graph, source)["dist_to"]
+        for target in range(60):
+            result = ch.query(hierarchy, source, target)
+            assert math.isclose(result["distance"], exact[target]) or result["distance"] == exact[target]
+            if result["path"] is not None:
+                path = result["path"]["elements"]
+                assert path[0] == source and path[-1] == target
+                assert math.isclose(path_length(graph, path), exact[target], abs_tol=1e-9)
@@ -0,0 +1,42 @@
+from DataStructures.Graph import adj_list_graph as gr
+from DataStructures.Graph import components as cc
+from DataStructures.Graph import derived as dr
+from DataStructures.Map import map_linear_probing as m
+
+
+def test_ensure_rebuilds_on_mutation():
+    graph = gr.adj_list_graph(directed=True, reverse_index=True)
+    graph.add_edge(0, 1, 1.0)
+    graph.add_edge(2, 3, 1.0)
+    registry = dr.new_registry()
+    built = {}
+
+    def build():
+        built['components'] = cc.weakly_connected(graph)
+
+    assert dr.ensure(registry, 'components', graph.epoch, build)
+    assert not dr.ensure(registry, 'components', graph.epoch, build)
+    assert cc.count(built['components']) == 2
+
+    graph.add_edge(1, 2, 1.0)
+    graph.add_edge(3, 0, 1.0)
+    assert not dr.is_current(registry, 'components', graph.epoch)
+    assert dr.ensure(registry, 'components', graph.epoch, build)
+    assert cc.count(built['components']) == 1
+    assert (registry['builds'], registry['hits']) == (2, 1)
+
+    dr.forget(registry, 'components')
+    assert not dr.contains(registry, 'components')
+
+
+def test_map_epoch():
+    my_map = m.new_map(2, 0.5)
+    assert m.epoch(my_map) == 0
+    for key in range(10):
+        my_map = m.put(my_map, key, key)
+    assert m.epoch(my_map) == 10
+    my_map = m.remove(my_map, 42)
+    assert m.epoch(my_map) == 10
+    my_map = m.remove(my_map, 3)
+    my_map = m.put_all(my_map, [(key, key) for key in range(10, 100)])
+    assert m.epoch(my_map) == 101
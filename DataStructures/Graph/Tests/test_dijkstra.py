@@ -0,0 +1,112 @@
+import math
+import random
+
+from DataStructures.Graph import adj_list_graph as gr
+from DataStructures.Graph import dijkstra as dk
+
+
+def setup_tests():
+    graph = gr.adj_list_graph(directed=True, reverse_index=True)
+    for vertex in range(6):
+        graph.insert_vertex(vertex)
+    graph.add_edge(0, 1, 7)
+    graph.add_edge(0, 2, 9)
+    graph.add_edge(0, 5, 14)
+    graph.add_edge(1, 2, 10)
+    graph.add_edge(1, 3, 15)
+    graph.add_edge(2, 3, 11)
+    graph.add_edge(2, 5, 2)
+    graph.add_edge(5, 4, 9)
+    graph.add_edge(3, 4, 6)
+    return graph
+
+
+def random_graph(num_vertices=60, num_edges=300, seed=3):
+    rnd = random.Random(seed)
+    graph = gr.adj_list_graph(directed=True, reverse_index=True)
+    for vertex in range(num_vertices):
+        graph.insert_vertex(vertex)
+    for _ in range(num_edges):
+        graph.add_edge(rnd.randrange(num_vertices), rnd.randrange(num_vertices),
+                       round(rnd.uniform(0.1, 5.0), 1))
+    return graph
+
+
+def bellman_ford(graph, source):
+    dist = [math.inf] * graph.num_vertices
+    dist[source] = 0.0
+    for _ in range(graph.num_vertices):
+        for vertex in graph.all_vertices():
+            for adjacent, weight in graph.iter_adjacent_edges(vertex):
+                if dist[vertex] + weight < dist[adjacent]:
+                    dist[adjacent] = dist[vertex] + weight
+    return dist
+
+
+def test_dijkstra():
+    graph = setup_tests()
+    search = dk.dijkstra(graph, 0)
+
+    assert dk.dist_to(search, 4) == 20
+    assert dk.path_to(search, 4)["elements"] == [0, 2, 5, 4]
+    assert dk.path_to(search, 0)["elements"] == [0]
+    assert dk.has_path_to(search, 3)
+
+    search = dk.dijkstra(graph, 4)
+    assert not dk.has_path_to(search, 0)
+    assert dk.path_to(search, 0) is None
+
+
+def test_dijkstra_random():
+    graph = random_graph()
+    for source in (0, 17, 42):
+        search = dk.dijkstra(graph, source)
+        expected = bellman_ford(graph, source)
+        for vertex in graph.all_vertices():
+            assert math.isclose(dk.dist_to(search, vertex), expected[vertex]) or \
+                dk.dist_to(search, vertex) == expected[vertex]
+            path = dk.path_to(search, vertex)
+            if path is not None:
+                elements = path["elements"]
+                length = sum(graph.get_edge_weight(a, b) for a, b in zip(elements, elements[1:]))
+                assert math.isclose(length, dk.dist_to(search, vertex), abs_tol=1e-9)
+
+
+def test_bidirectional_dijkstra():
+    graph = setup_tests()
+
+    result = dk.bidirectional_dijkstra(graph, 0, 4)
+    assert result["distance"] == 20
+    assert result["path"]["elements"] == [0, 2, 5, 4]
+
+    result = dk.bidirectional_dijkstra(graph, 3, 3)
+    assert result["distance"] == 0
+    assert result["path"]["elements"] == [3]
+
+    result = dk.bidirectional_dijkstra(graph, 4, 0)
+    assert result["distance"] == math.inf
+    assert result["path"] is None
+
+
+def test_bidirectional_dijkstra_random():
+    graph = random_graph()
+    rnd = random.Random(8)
+    for _ in range(40):
+        source, target = rnd.randrange(60), rnd.randrange(60)
+        expected = dk.dijkstra(graph, source)
+        result = dk.bidirectional_dijkstra(graph, source, target)
+        assert math.isclose(result["distance"], dk.dist_to(expected, target)) or \
+            result["distance"] == dk.dist_to(expected, target)
+        if result["path"] is not None:
+            elements = result["path"]["elements"]
+            assert elements[0] == source and elements[-1] == target
+            length = sum(graph.get_edge_weight(a, b) for a, b in zip(elements, elements[1:]))
+            assert math.isclose(length, result["distance"], abs_tol=1e-9)
+
+
+def test_dijkstra_target():
+    graph = setup_tests()
+    search = dk.dijkstra(graph, 0, target=2)
+    assert dk.dist_to(search, 2) == 9
+    assert dk.path_to(search, 2)["elements"] == [0, 2]
+    assert search["settled"] < graph.num_vertices
@@ -0,0 +1,45 @@
+import math
+import random
+
+from DataStructures.Graph import dijkstra as dk
+from DataStructures.Graph import landmarks as alt
+from DataStructures.Graph.Tests.test_dijkstra import random_graph, setup_tests
+
+
+def test_preprocess():
+    graph = random_graph()
+    lm = alt.preprocess(graph, num_landmarks=4)
+
+    assert len(lm["landmarks"]) == 4
+    assert len(set(lm["landmarks"])) == 4
+    for landmark, forward, backward in zip(lm["landmarks"], lm["forward"], lm["backward"]):
+        assert forward[landmark] == 0
+        assert backward[landmark] == 0
+        assert forward == dk.dijkstra(graph, landmark)["dist_to"]
+
+
+def test_lower_bound():
+    graph = random_graph()
+    lm = alt.preprocess(graph, num_landmarks=4)
+    for source in range(0, 60, 7):
+        exact = dk.dijkstra(graph, source)["dist_to"]
+        for target in range(60):
+            assert alt.lower_bound(lm, source, target) <= exact[target] + 1e-9
+
+
+def test_alt_search():
+    graph = setup_tests()
+    lm = alt.preprocess(graph, num_landmarks=2)
+    result = alt.alt_search(graph, lm, 0, 4)
+    assert result["distance"] == 20
+    assert result["path"]["elements"] == [0, 2, 5, 4]
+    assert alt.alt_search(graph, lm, 4, 0)["path"] is None
+
+    graph = random_graph()
+    lm = alt.preprocess(graph, num_landmarks=4)
+    rnd = random.Random(4)
+    for _ in range(40):
+        source, target = rnd.randrange(60), rnd.randrange(60)
+        expected = dk.dist_to(dk.dijkstra(graph, source), target)
+        result = alt.alt_search(graph, lm, source, target)
+        assert result["distance"] == expected or math.isclose(result["distance"], expected)
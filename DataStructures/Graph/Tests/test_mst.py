@@ -0,0 +1,77 @@
+import math
+
+from DataStructures.Graph import adj_list_graph as gr
+from DataStructures.Graph import mst
+from DataStructures.Graph import union_find as uf
+from DataStructures.Graph.Tests.test_dijkstra import random_graph
+from DataStructures.Priority_queue import priority_queue as pq
+
+
+def compare_distances(connection1, connection2):
+    if connection1["distance"] == connection2["distance"]:
+        return 0
+    elif connection1["distance"] > connection2["distance"]:
+        return 1
+    return -1
+
+
+def setup_tests():
+    # Ejemplo tinyEWG de Sedgewick, peso total 1.81
+    graph = gr.adj_list_graph(directed=True, reverse_index=True)
+    for vertex in range(8):
+        graph.insert_vertex(vertex)
+    for source, destination, weight in (
+            (4, 5, 0.35), (4, 7, 0.37), (5, 7, 0.28), (0, 7, 0.16), (1, 5, 0.32),
+            (0, 4, 0.38), (2, 3, 0.17), (1, 7, 0.19), (0, 2, 0.26), (1, 2, 0.36),
+            (1, 3, 0.29), (2, 7, 0.34), (6, 2, 0.40), (3, 6, 0.52), (6, 0, 0.58),
+            (6, 4, 0.93)):
+        graph.add_edge(source, destination, weight)
+    return graph
+
+
+def is_spanning_forest(graph, edges):
+    sets = uf.new_union_find(graph.num_vertices)
+    for source, destination, _ in edges:
+        assert uf.union(sets, source, destination)
+    for vertex in range(graph.num_vertices):
+        for adjacent in graph.iter_adjacent(vertex):
+            assert uf.connected(sets, vertex, adjacent)
+    return True
+
+
+def test_kruskal():
+    graph = setup_tests()
+    heap = mst.edge_heap(graph, compare_distances)
+    result = mst.kruskal(graph.num_vertices, heap)
+    assert math.isclose(result["weight"], 1.81)
+    assert result["edges"]["size"] == 7
+    assert is_spanning_forest(graph, result["edges"]["elements"])
+
+
+def test_kruskal_copy():
+    graph = setup_tests()
+    heap = mst.edge_heap(graph, compare_distances)
+    size = pq.size(heap)
+    result = mst.kruskal(graph.num_vertices, pq.copy(heap))
+    assert pq.size(heap) == size
+    assert result["examined"] < size
+
+
+def test_prim():
+    graph = setup_tests()
+    result = mst.prim(graph)
+    assert math.isclose(result["weight"], 1.81)
+    assert is_spanning_forest(graph, result["edges"]["elements"])
+
+
+def test_forest():
+    graph = random_graph(num_vertices=60, num_edges=50)
+    sets = uf.new_union_find(60)
+    for vertex in range(60):
+        for adjacent in graph.iter_adjacent(vertex):
+            uf.union(sets, vertex, adjacent)
+    kruskal = mst.kruskal(60, mst.edge_heap(graph, compare_distances), uf.count(sets))
+    prim = mst.prim(graph)
+    assert kruskal["edges"]["size"] == prim["edges"]["size"] == 60 - uf.count(sets)
+    assert math.isclose(kruskal["weight"], prim["weight"])
+    assert is_spanning_forest(graph, prim["edges"]["elements"])
@@ -0,0 +1,75 @@
+from DataStructures.Graph import adj_list_graph as gr
+from DataStructures.Graph import dijkstra as dk
+from DataStructures.Graph import path_cache as spc
+
+
+def setup_tests():
+    graph = gr.adj_list_graph(directed=True, reverse_index=True)
+    for vertex in range(6):
+        graph.insert_vertex(vertex)
+    graph.add_edge(0, 1, 7)
+    graph.add_edge(0, 2, 9)
+    graph.add_edge(0, 5, 14)
+    graph.add_edge(1, 2, 10)
+    graph.add_edge(1, 3, 15)
+    graph.add_edge(2, 3, 11)
+    graph.add_edge(2, 5, 2)
+    graph.add_edge(5, 4, 9)
+    graph.add_edge(3, 4, 6)
+    return graph
+
+
+def test_hits_and_misses():
+    graph = setup_tests()
+    cache = spc.new_path_cache()
+    tree = spc.shortest_path_tree(cache, graph, 0)
+    assert dk.dist_to(tree, 4) == 20
+    assert dk.path_to(tree, 4)["elements"] == [0, 2, 5, 4]
+    assert spc.shortest_path_tree(cache, graph, 0) is tree
+    spc.shortest_path_tree(cache, graph, 1)
+    stats = spc.stats(cache)
+    assert (stats["hits"], stats["misses"], stats["trees"]) == (1, 2, 2)
+    assert spc.most_recent(cache, graph)["source"] == 1
+
+
+def test_lru_eviction():
+    graph = setup_tests()
+    probe = spc.new_path_cache()
+    size = spc.tree_bytes(spc.shortest_path_tree(probe, graph, 0))
+    cache = spc.new_path_cache(max_bytes=2 * size)
+    spc.shortest_path_tree(cache, graph, 0)
+    spc.shortest_path_tree(cache, graph, 1)
+    spc.shortest_path_tree(cache, graph, 0)
+    spc.shortest_path_tree(cache, graph, 2)
+    assert spc.contains(cache, 0) and spc.contains(cache, 2)
+    assert not spc.contains(cache, 1)
+    assert spc.stats(cache)["evictions"] == 1
+    assert cache["bytes"] <= cache["max_bytes"]
+
+
+def test_invalidated_by_mutation():
+    graph = setup_tests()
+    cache = spc.new_path_cache()
+    assert dk.dist_to(spc.shortest_path_tree(cache, graph, 0), 4) == 20
+    graph.add_edge(0, 4, 1)
+    assert dk.dist_to(spc.shortest_path_tree(cache, graph, 0), 4) == 1
+    graph.add_edge(0, 4, 1)
+    spc.shortest_path_tree(cache, graph, 0)
+    stats = spc.stats(cache)
+    assert (stats["hits"], stats["misses"], stats["invalidations"]) == (1, 2, 1)
+
+
+def test_most_recent_invalidated_by_mutation():
+    graph = setup_tests()
+    cache = spc.new_path_cache()
+    assert spc.most_recent(cache, graph) is None
+    spc.shortest_path_tree(cache, graph, 0)
+    assert spc.most_recent(cache, graph)["source"] == 0
+
+    graph.insert_vertex(6)
+    graph.add_edge(4, 6, 3)
+    assert spc.most_recent(cache, graph) is None
+    assert spc.stats(cache)["invalidations"] == 1
+    tree = spc.shortest_path_tree(cache, graph, 0)
+    assert dk.dist_to(tree, 6) == 23
+    assert spc.most_recent(cache, graph) is tree
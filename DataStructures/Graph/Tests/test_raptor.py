@@ -0,0 +1,88 @@
+import math
+import random
+
+from DataStructures.Graph import raptor
+
+
+def setup_tests():
+    # Ruta A: 0 -> 1 -> 2 -> 3 (larga), ruta B: 0 -> 4 -> 5 (corta),
+    # ruta C: 5 -> 3, ruta D: 4 -> 6 -> 3 (corta, requiere dos transbordos
+    # desde B)
+    network = raptor.new_network(7)
+    raptor.add_route(network, "A", [0, 1, 2, 3], [math.inf, 5.0, 5.0, 5.0])
+    raptor.add_route(network, "B", [0, 4, 5], [math.inf, 1.0, 1.0])
+    raptor.add_route(network, "C", [5, 3], [math.inf, 6.0])
+    raptor.add_route(network, "D", [4, 6, 3], [math.inf, 1.0, 1.0])
+    return network
+
+
+def random_network(num_stops=40, num_routes=25, seed=5):
+    rnd = random.Random(seed)
+    network = raptor.new_network(num_stops)
+    for route in range(num_routes):
+        stops = rnd.sample(range(num_stops), rnd.randint(3, 9))
+        weights = [math.inf] + [float(rnd.randint(1, 9)) for _ in stops[1:]]
+        raptor.add_route(network, route, stops, weights)
+    return network
+
+
+def brute_force(network, source, target, max_trips):
+    """Menor distancia con a lo más k tramos, para k = 1..max_trips"""
+    n = network["num_stops"]
+    best = [math.inf] * n
+    best[source] = 0.0
+    by_trips = []
+    for _ in range(max_trips):
+        following = list(best)
+        for stops, weights in zip(network["stops"], network["weights"]):
+            for i in range(len(stops)):
+                total = best[stops[i]]
+                for j in range(i + 1, len(stops)):
+                    total += weights[j]
+                    following[stops[j]] = min(following[stops[j]], total)
+        best = following
+        by_trips.append(best[target])
+    return by_trips
+
+
+def test_journeys():
+    network = setup_tests()
+    result = raptor.journeys(network, 0, 3)
+    front = [(journey["transfers"], journey["distance"]) for journey in result["elements"]]
+    assert front == [(0, 15.0), (1, 3.0)]
+    legs = result["elements"][1]["legs"]["elements"]
+    assert [(leg["route"], leg["board"], leg["alight"]) for leg in legs] == [("B", 0, 4), ("D", 4, 3)]
+    assert [leg["distance"] for leg in legs] == [1.0, 2.0]
+
+    assert raptor.journeys(network, 3, 0)["size"] == 0
+    assert raptor.journeys(network, 2, 2)["elements"][0]["distance"] == 0.0
+
+
+def test_max_transfers():
+    network = setup_tests()
+    result = raptor.journeys(network, 0, 3, max_transfers=0)
+    assert [journey["distance"] for journey in result["elements"]] == [15.0]
+
+
+def test_journeys_random():
+    network = random_network()
+    for source in range(0, 40, 3):
+        for target in range(40):
+            if source == target:
+                continue
+            by_trips = brute_force(network, source, target, 5)
+            expected = []
+            previous = math.inf
+            for trips, distance in enumerate(by_trips, 1):
+                if distance < previous:
+                    expected.append((trips - 1, distance))
+                    previous = distance
+            result = raptor.journeys(network, source, target, max_transfers=4)
+            front = [(journey["transfers"], journey["distance"]) for journey in result["elements"]]
+            assert front == expected
+            for journey in result["elements"]:
+                legs = journey["legs"]["elements"]
+                assert legs[0]["board"] == source and legs[-1]["alight"] == target
+                assert sum(leg["distance"] for leg in legs) == journey["distance"]
+                for leg, following in zip(legs, legs[1:]):
+                    assert leg["alight"] == following["board"]
@@ -0,0 +1,44 @@
+from DataStructures.Graph import union_find as uf
+
+
+def test_new_union_find():
+    sets = uf.new_union_find(5)
+    assert uf.size(sets) == 5
+    assert uf.count(sets) == 5
+    for element in range(5):
+        assert uf.find(sets, element) == element
+
+
+def test_union():
+    sets = uf.new_union_find(6)
+    assert uf.union(sets, 0, 1)
+    assert uf.union(sets, 2, 3)
+    assert uf.union(sets, 1, 3)
+    assert not uf.union(sets, 0, 2)
+    assert uf.count(sets) == 3
+    assert uf.connected(sets, 0, 3)
+    assert not uf.connected(sets, 0, 4)
+    assert list(uf.labels(sets)) == [0, 0, 0, 0, 1, 2]
+
+
+def test_add():
+    sets = uf.new_union_find()
+    assert uf.count(sets) == 0
+    assert uf.add(sets) == 0
+    assert uf.add(sets) == 1
+    uf.grow(sets, 4)
+    assert uf.size(sets) == 4
+    assert uf.count(sets) == 4
+    uf.union(sets, 3, 0)
+    assert uf.connected(sets, 0, 3)
+    assert uf.count(sets) == 3
+
+
+def test_path_compression():
+    sets = uf.new_union_find(1000)
+    for element in range(1, 1000):
+        uf.union(sets, element - 1, element)
+    root = uf.find(sets, 999)
+    for element in range(1000):
+        uf.find(sets, element)
+        assert sets["parent"][element] == root
@@ -0,0 +1,48 @@
+import math
+
+from DataStructures.Graph import yen
+from DataStructures.Graph.Tests.test_dijkstra import random_graph, setup_tests
+
+
+def simple_path_costs(graph, source, target):
+    costs = []
+    stack = [(source, [source], 0.0)]
+    while stack:
+        vertex, path, cost = stack.pop()
+        if vertex == target:
+            costs.append(cost)
+            continue
+        for adjacent, weight in graph.iter_adjacent_edges(vertex):
+            if adjacent not in path:
+                stack.append((adjacent, path + [adjacent], cost + weight))
+    return sorted(costs)
+
+
+def path_cost(graph, path):
+    return sum(graph.get_edge_weight(tail, head) for tail, head in zip(path, path[1:]))
+
+
+def test_k_shortest_paths():
+    graph = setup_tests()
+    result = yen.k_shortest_paths(graph, 0, 4, 3)
+    paths = result["paths"]["elements"]
+    assert paths[0]["distance"] == 20
+    assert paths[0]["path"]["elements"] == [0, 2, 5, 4]
+    assert [p["distance"] for p in paths] == simple_path_costs(graph, 0, 4)[:3]
+    assert yen.k_shortest_paths(graph, 4, 0, 3)["paths"]["size"] == 0
+
+
+def test_k_shortest_paths_random():
+    graph = random_graph(num_vertices=12, num_edges=30, seed=8)
+    for source, target in ((0, 11), (3, 7), (5, 2), (9, 1)):
+        expected = simple_path_costs(graph, source, target)
+        result = yen.k_shortest_paths(graph, source, target, 15)
+        paths = result["paths"]["elements"]
+        assert len(paths) == min(15, len(expected))
+        for entry, cost in zip(paths, expected):
+            vertices = entry["path"]["elements"]
+            assert math.isclose(entry["distance"], cost)
+            assert math.isclose(path_cost(graph, vertices), cost)
+            assert len(set(vertices)) == len(vertices)
+            assert vertices[0] == source and vertices[-1] == target
+        assert len({tuple(entry["path"]["elements"]) for entry in paths}) == len(paths)
@@ -22,25 +22,33 @@ class ListNode:
 
 class EdgeList:
     """
-    Lista encadenada para representar las adyacencias de un vértice
+    Lista encadenada para representar las adyacencias de un vértice.
+    Las aristas se recorren en orden de inserción y un diccionario
+    destino -> nodo permite encontrar una arista en tiempo constante
     """
     def __init__(self):
         """
         Constructor de la lista de adyacencia
         """
         self.head = None
+        self.tail = None
+        self.nodes = {}
         self.size = 0
 
     def add_edge(self, vertex_id, edge_weight=0):
         """
-        Agrega una arista a la lista de adyacencia
+        Agrega una arista al final de la lista de adyacencia
         Args:
             vertex_id: identificador del vértice destino
             edge_weight: peso de la arista
         """
         new_node = ListNode(vertex_id, edge_weight)
-        new_node.next = self.head
-        self.head = new_node
+        if self.tail is None:
+            self.head = new_node
+        else:
+            self.tail.next = new_node
+        self.tail = new_node
+        self.nodes[vertex_id] = new_node
         self.size += 1
     
     def get_edge(self, vertex_id):
@@ -51,29 +59,82 @@ class EdgeList:
         Returns:
             El nodo con la arista si existe, None si no existe
         """
-        current = self.head
-        while current:
-            if current.vertex_id == vertex_id:
-                return current
-            current = current.next
-        return None
+        return self.nodes.get(vertex_id)
+
+def _nodes(edges):
+    """
+    Recorre los nodos de una lista de adyacencia en orden
+    """
+    current = edges.head
+    while current:
+        yield current
+        current = current.next
+
+def _flatten(adjacency):
+    """
+    Convierte listas de adyacencia en listas planas (vértice, peso)
+    """
+    return {
+        vertex_id: [(node.vertex_id, node.edge_weight) for node in _nodes(edges)]
+        for vertex_id, edges in adjacency.items()
+    }
+
+def _unflatten(adjacency):
+    """
+    Reconstruye listas de adyacencia a partir de listas planas (vértice, peso)
+    """
+    result = {}
+    for vertex_id, adjacent in adjacency.items():
+        edges = EdgeList()
+        for destination, weight in adjacent:
+            edges.add_edge(destination, weight)
+        result[vertex_id] = edges
+    return result
 
 class Graph:
     """
     Implementación de grafo con listas de adyacencia
     """
-    def __init__(self, directed=False):
+    def __init__(self, directed=False, reverse_index=False):
         """
         Constructor del grafo
         Args:
             directed: indica si el grafo es dirigido (True) o no (False)
+            reverse_index: en un grafo dirigido, mantiene además la lista de
+                arcos que llegan a cada vértice (predecesores)
         """
         self.vertices = {}
         self.num_vertices = 0
         self.num_edges = 0
         self.directed = directed
         self.indegree = {}  # Diccionario para almacenar el grado de entrada de cada vértice
-    
+        # Listas de adyacencia inversas (origen, peso) de cada vértice, o None
+        self.in_edges = {} if directed and reverse_index else None
+        # Época de mutación: aumenta con cada vértice o arco nuevo y con cada
+        # cambio de peso, para invalidar resultados derivados del grafo
+        self.epoch = 0
+
+    def __getstate__(self):
+        """
+        Estado serializable del grafo. Las listas de adyacencia se guardan
+        como listas planas (destino, peso) para no serializar recursivamente
+        la cadena de nodos
+        """
+        state = self.__dict__.copy()
+        state['vertices'] = _flatten(self.vertices)
+        if self.in_edges is not None:
+            state['in_edges'] = _flatten(self.in_edges)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Reconstruye el grafo a partir del estado producido por __getstate__
+        """
+        self.__dict__.update(state)
+        self.vertices = _unflatten(state['vertices'])
+        if self.in_edges is not None:
+            self.in_edges = _unflatten(state['in_edges'])
+
     def insert_vertex(self, vertex_id):
         """
         Inserta un vértice en el grafo
@@ -87,7 +148,10 @@ class Graph:
         
         self.vertices[vertex_id] = EdgeList()
         self.num_vertices += 1
+        self.epoch += 1
         self.indegree[vertex_id] = 0
+        if self.in_edges is not None:
+            self.in_edges[vertex_id] = EdgeList()
         return self.vertices[vertex_id]
     
     def add_edge(self, source, destination, weight=0):
@@ -110,13 +174,20 @@ class Graph:
         edge = self.vertices[source].get_edge(destination)
         if edge:
             # Actualizar el peso si la arista ya existe
+            if edge.edge_weight != weight:
+                self.epoch += 1
             edge.edge_weight = weight
+            if self.in_edges is not None:
+                self.in_edges[destination].get_edge(source).edge_weight = weight
             return False
         
         # Agregar la arista
         self.vertices[source].add_edge(destination, weight)
         self.num_edges += 1
+        self.epoch += 1
         self.indegree[destination] += 1
+        if self.in_edges is not None:
+            self.in_edges[destination].add_edge(source, weight)
         
         # Si el grafo no es dirigido, agregar también la arista en sentido contrario
         if not self.directed:
@@ -125,7 +196,74 @@ class Graph:
             # No incrementamos num_edges aquí para no contar las aristas dos veces
         
         return True
-    
+
+    def insert_vertices(self, vertex_ids):
+        """
+        Inserta en bloque una secuencia de vértices
+        Args:
+            vertex_ids: identificadores de los vértices, en orden de inserción
+        Returns:
+            Número de vértices nuevos
+        """
+        before = self.num_vertices
+        insert_vertex = self.insert_vertex
+        for vertex_id in vertex_ids:
+            insert_vertex(vertex_id)
+        return self.num_vertices - before
+
+    def add_edges(self, edges):
+        """
+        Agrega en bloque una secuencia de aristas
+        Args:
+            edges: tuplas (origen, destino, peso), en orden de inserción
+        Returns:
+            Número de aristas nuevas
+        """
+        if not self.directed:
+            added = 0
+            add_edge = self.add_edge
+            for source, destination, weight in edges:
+                if add_edge(source, destination, weight):
+                    added += 1
+            return added
+
+        # Mismo efecto que add_edge por cada arista, con los nodos enlazados
+        # aquí para no pagar dos llamadas por arista en las cargas en bloque
+        vertices = self.vertices
+        indegree = self.indegree
+        in_edges = self.in_edges
+        added = 0
+        changed = 0
+        for source, destination, weight in edges:
+            if source not in vertices:
+                self.insert_vertex(source)
+            if destination not in vertices:
+                self.insert_vertex(destination)
+            out_list = vertices[source]
+            node = out_list.nodes.get(destination)
+            if node is not None:
+                if node.edge_weight != weight:
+                    changed += 1
+                node.edge_weight = weight
+                if in_edges is not None:
+                    in_edges[destination].nodes[source].edge_weight = weight
+                continue
+            node = ListNode(destination, weight)
+            if out_list.tail is None:
+                out_list.head = node
+            else:
+                out_list.tail.next = node
+            out_list.tail = node
+            out_list.nodes[destination] = node
+            out_list.size += 1
+            if in_edges is not None:
+                in_edges[destination].add_edge(source, weight)
+            indegree[destination] += 1
+            added += 1
+        self.num_edges += added
+        self.epoch += added + changed
+        return added
+
     def get_adjacent_vertices(self, vertex_id):
         """
         Retorna los vértices adyacentes a un vértice dado
@@ -145,6 +283,93 @@ class Graph:
         
         return adjacent
     
+    def iter_adjacent(self, vertex_id):
+        """
+        Recorre los vértices adyacentes a un vértice sin construir una lista.
+        Itera sobre el índice destino -> nodo de la lista de adyacencia, que
+        conserva el orden de inserción; no se deben agregar aristas al
+        vértice mientras se recorre
+        Args:
+            vertex_id: identificador del vértice
+        Returns:
+            Iterador de los vértices adyacentes
+        """
+        edges = self.vertices.get(vertex_id)
+        if edges is None:
+            return iter(())
+        return iter(edges.nodes)
+
+    def iter_adjacent_edges(self, vertex_id):
+        """
+        Recorre las aristas que salen de un vértice sin construir una lista
+        Args:
+            vertex_id: identificador del vértice
+        Returns:
+            Generador de parejas (vértice adyacente, peso)
+        """
+        edges = self.vertices.get(vertex_id)
+        if edges is None:
+            return
+        current = edges.head
+        while current:
+            yield current.vertex_id, current.edge_weight
+            current = current.next
+
+    def get_predecessors(self, vertex_id):
+        """
+        Retorna los vértices desde los que sale un arco hacia vertex_id.
+        Con el índice inverso el costo es O(grado de entrada); sin él, en
+        un grafo dirigido se recorre todo el grafo
+        Args:
+            vertex_id: identificador del vértice
+        Returns:
+            Lista de vértices predecesores
+        """
+        return list(self.iter_predecessors(vertex_id))
+
+    def iter_predecessors(self, vertex_id):
+        """
+        Recorre los predecesores de un vértice sin construir una lista
+        Args:
+            vertex_id: identificador del vértice
+        Returns:
+            Iterador de los vértices predecesores
+        """
+        if not self.directed:
+            return self.iter_adjacent(vertex_id)
+        if self.in_edges is None:
+            return (source for source, _ in self._scan_in_edges(vertex_id))
+        edges = self.in_edges.get(vertex_id)
+        if edges is None:
+            return iter(())
+        return iter(edges.nodes)
+
+    def iter_predecessor_edges(self, vertex_id):
+        """
+        Recorre los arcos que llegan a un vértice sin construir una lista
+        Args:
+            vertex_id: identificador del vértice
+        Returns:
+            Iterador de parejas (vértice predecesor, peso)
+        """
+        if not self.directed:
+            return self.iter_adjacent_edges(vertex_id)
+        if self.in_edges is None:
+            return self._scan_in_edges(vertex_id)
+        edges = self.in_edges.get(vertex_id)
+        if edges is None:
+            return iter(())
+        return ((node.vertex_id, node.edge_weight) for node in _nodes(edges))
+
+    def _scan_in_edges(self, vertex_id):
+        """
+        Busca los arcos que llegan a un vértice recorriendo todo el grafo
+        """
+        for source, edges in self.vertices.items():
+            edge = edges.get_edge(vertex_id)
+            if edge:
+                yield source, edge.edge_weight
+
     def get_edge_weight(self, source, destination):
         """
         Retorna el peso de una arista
@@ -204,13 +429,257 @@ class Graph:
         """
         return self.degree(vertex_id)
 
+    def freeze(self):
+        """
+        Retorna una vista inmutable del grafo en formato CSR
+        (compressed sparse row)
+        Returns:
+            Un FrozenGraph con la adyacencia actual del grafo
+        """
+        return FrozenGraph(self)
+
+class FrozenGraph:
+    """
+    Vista inmutable de un Graph en formato CSR (compressed sparse row).
+
+    La vista se construye con listas planas: la adyacencia del vértice en
+    la posición i ocupa las posiciones offsets[i] .. offsets[i+1]-1 de
+    targets (vértice destino) y weights (peso de la arista), en el mismo
+    orden que las listas de adyacencia del grafo original, y los arcos que
+    llegan a cada vértice (la transpuesta, ordenados por origen) se
+    obtienen de ellas con un ordenamiento por conteo.
+
+    Cada tramo offsets[i] .. offsets[i+1]-1 se guarda como una tupla:
+    targets[i], weights[i], in_sources[i] e in_weights[i]. Recorrer una
+    tupla no crea objetos (los enteros y flotantes ya existen) y no hay
+    que cortar la lista plana en cada consulta, así que los recorridos
+    (iter_adjacent, iter_adjacent_edges y los de predecesores, que son
+    los que usan Dijkstra, BFS, Tarjan y los demás algoritmos) cuestan
+    menos que en las listas encadenadas del Graph original. Las tuplas
+    guardan los identificadores de los vértices, de modo que no hay que
+    traducir posiciones al recorrerlas.
+    """
+    def __init__(self, graph):
+        """
+        Constructor de la vista
+        Args:
+            graph: el Graph a congelar
+        """
+        self.directed = graph.directed
+        self.num_vertices = graph.num_vertices
+        self.num_edges = graph.num_edges
+        self.epoch = graph.epoch
+        self.keys = list(graph.vertices.keys())
+        self.index = {vertex_id: i for i, vertex_id in enumerate(self.keys)}
+
+        offsets = [0]
+        targets = []
+        weights = []
+        for vertex_id in self.keys:
+            nodes = list(_nodes(graph.vertices[vertex_id]))
+            targets.extend([self.index[node.vertex_id] for node in nodes])
+            weights.extend([node.edge_weight for node in nodes])
+            offsets.append(len(targets))
+        in_offsets, in_sources, in_weights = _transpose(offsets, targets, weights)
+
+        self.targets = _segments(offsets, targets, self.keys)
+        self.weights = _segments(offsets, weights)
+        self.in_sources = _segments(in_offsets, in_sources, self.keys)
+        self.in_weights = _segments(in_offsets, in_weights)
+        self.indegree = [graph.indegree_of(vertex_id) for vertex_id in self.keys]
+
+    def insert_vertex(self, vertex_id):
+        raise TypeError("FrozenGraph es inmutable: use el Graph original")
+
+    def add_edge(self, source, destination, weight=0):
+        raise TypeError("FrozenGraph es inmutable: use el Graph original")
+
+    def freeze(self):
+        """
+        Una vista congelada ya es inmutable; se retorna a sí misma
+        """
+        return self
+
+    def get_adjacent_vertices(self, vertex_id):
+        """
+        Retorna los vértices adyacentes a un vértice dado
+        Args:
+            vertex_id: identificador del vértice
+        Returns:
+            Lista de vértices adyacentes
+        """
+        i = self.index.get(vertex_id)
+        if i is None:
+            return []
+        return list(self.targets[i])
+
+    def iter_adjacent(self, vertex_id):
+        """
+        Recorre los vértices adyacentes a un vértice sobre su tramo de
+        targets
+        Args:
+            vertex_id: identificador del vértice
+        Returns:
+            Iterador de los vértices adyacentes
+        """
+        i = self.index.get(vertex_id)
+        if i is None:
+            return iter(())
+        return iter(self.targets[i])
+
+    def iter_adjacent_edges(self, vertex_id):
+        """
+        Recorre las aristas que salen de un vértice sobre sus tramos de
+        targets y weights
+        Args:
+            vertex_id: identificador del vértice
+        Returns:
+            Iterador de parejas (vértice adyacente, peso)
+        """
+        i = self.index.get(vertex_id)
+        if i is None:
+            return iter(())
+        return zip(self.targets[i], self.weights[i])
+
+    def get_edge_weight(self, source, destination):
+        """
+        Retorna el peso de una arista
+        Args:
+            source: vértice origen
+            destination: vértice destino
+        Returns:
+            Peso de la arista o None si no existe
+        """
+        i = self.index.get(source)
+        if i is None or destination not in self.targets[i]:
+            return None
+        return self.weights[i][self.targets[i].index(destination)]
+
+    def get_predecessors(self, vertex_id):
+        """
+        Retorna los vértices desde los que sale un arco hacia vertex_id
+        Args:
+            vertex_id: identificador del vértice
+        Returns:
+            Lista de vértices predecesores
+        """
+        return list(self.iter_predecessors(vertex_id))
+
+    def iter_predecessors(self, vertex_id):
+        """
+        Recorre los predecesores de un vértice sobre su tramo de in_sources
+        Args:
+            vertex_id: identificador del vértice
+        Returns:
+            Iterador de los vértices predecesores
+        """
+        i = self.index.get(vertex_id)
+        if i is None:
+            return iter(())
+        return iter(self.in_sources[i])
+
+    def iter_predecessor_edges(self, vertex_id):
+        """
+        Recorre los arcos que llegan a un vértice sobre sus tramos de
+        in_sources e in_weights
+        Args:
+            vertex_id: identificador del vértice
+        Returns:
+            Iterador de parejas (vértice predecesor, peso)
+        """
+        i = self.index.get(vertex_id)
+        if i is None:
+            return iter(())
+        return zip(self.in_sources[i], self.in_weights[i])
+
+    def all_vertices(self):
+        """
+        Retorna todos los vértices del grafo
+        Returns:
+            Lista de vértices
+        """
+        return list(self.keys)
+
+    def degree(self, vertex_id):
+        """
+        Retorna el grado de un vértice
+        Args:
+            vertex_id: identificador del vértice
+        Returns:
+            Grado del vértice
+        """
+        i = self.index.get(vertex_id)
+        if i is None:
+            return 0
+        return len(self.targets[i])
+
+    def indegree_of(self, vertex_id):
+        """
+        Retorna el grado de entrada de un vértice
+        Args:
+            vertex_id: identificador del vértice
+        Returns:
+            Grado de entrada del vértice
+        """
+        i = self.index.get(vertex_id)
+        if i is None:
+            return 0
+        return self.indegree[i]
+
+    def outdegree_of(self, vertex_id):
+        """
+        Retorna el grado de salida de un vértice
+        Args:
+            vertex_id: identificador del vértice
+        Returns:
+            Grado de salida del vértice
+        """
+        return self.degree(vertex_id)
+
+def _transpose(offsets, targets, weights):
+    """
+    Construye las listas CSR de los arcos de entrada con un ordenamiento
+    por conteo sobre la posición del vértice destino
+    Returns:
+        (in_offsets, in_sources, in_weights), con las posiciones de los
+        vértices de origen
+    """
+    n = len(offsets) - 1
+    counts = [0] * (n + 1)
+    for target in targets:
+        counts[target + 1] += 1
+    for i in range(n):
+        counts[i + 1] += counts[i]
+    in_offsets = counts[:]
+    in_sources = [0] * len(targets)
+    in_weights = [0.0] * len(targets)
+    for source in range(n):
+        for k in range(offsets[source], offsets[source + 1]):
+            target = targets[k]
+            slot = counts[target]
+            in_sources[slot] = source
+            in_weights[slot] = weights[k]
+            counts[target] = slot + 1
+    return in_offsets, in_sources, in_weights
+
+def _segments(offsets, flat, keys=None):
+    """
+    Corta una lista CSR plana en una tupla por vértice. Si se indica keys,
+    las posiciones de los vértices se traducen a sus identificadores
+    """
+    if keys is not None and keys != list(range(len(keys))):
+        flat = [keys[position] for position in flat]
+    return [tuple(flat[offsets[i]:offsets[i + 1]]) for i in range(len(offsets) - 1)]
+
 # Funciones para crear un nuevo grafo
-def adj_list_graph(directed=False):
+def adj_list_graph(directed=False, reverse_index=False):
     """
     Crea un nuevo grafo con listas de adyacencia
     Args:
         directed: indica si el grafo es dirigido (True) o no (False)
+        reverse_index: en un grafo dirigido, mantiene también los
+            predecesores de cada vértice
     Returns:
         Un nuevo grafo
     """
-    return Graph(directed)
\ No newline at end of file
+    return Graph(directed, reverse_index)
\ No newline at end of file
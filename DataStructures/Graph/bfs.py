@@ -0,0 +1,150 @@
+"""
+Búsqueda en anchura (BFS) desde varias fuentes, para contar saltos
+(número de arcos) sin tener en cuenta los pesos.
+
+El motor guarda el estado de la búsqueda en arreglos planos (array)
+indexados por vértice: saltos desde la fuente más cercana, padre en el
+árbol BFS y una marca de época. Un vértice está visitado en la búsqueda
+actual si su marca es igual a la época del motor; cada búsqueda nueva
+solo incrementa la época, así que los arreglos se reutilizan entre
+consultas sin limpiarlos ni crear diccionarios.
+
+Trabaja sobre grafos con vértices 0..n-1.
+"""
+from array import array
+
+from DataStructures.Graph import dijkstra as dk
+
+
+def new_bfs(num_vertices=0):
+    """
+    Crea un motor BFS para grafos de hasta num_vertices vértices (crece
+    automáticamente si el grafo crece)
+
+    Returns:
+        El motor, un diccionario con los campos:
+            - epoch: época de la búsqueda actual
+            - stamp: época en la que se visitó cada vértice
+            - hops: saltos desde la fuente más cercana
+            - parent: vértice anterior en el árbol BFS (-1 en las fuentes)
+            - reached: número de vértices visitados en la búsqueda actual
+            - targets_left: destinos aún no alcanzados (0 si no se
+              indicaron destinos o se alcanzaron todos)
+    """
+    return {
+        'epoch': 0,
+        'stamp': array('q', [0]) * num_vertices,
+        'hops': array('q', [0]) * num_vertices,
+        'parent': array('q', [-1]) * num_vertices,
+        'reached': 0,
+        'targets_left': 0
+    }
+
+
+def search(engine, graph, sources, max_depth=None, targets=None):
+    """
+    Ejecuta una BFS desde todas las fuentes a la vez
+
+    Args:
+        engine: El motor retornado por new_bfs
+        graph: El grafo, con vértices 0..n-1
+        sources: Vértices fuente (saltos 0)
+        max_depth: Si se indica, no se visitan vértices a más de
+            max_depth saltos
+        targets: Si se indica, la búsqueda termina en cuanto todos los
+            destinos han sido visitados
+    Returns:
+        El motor, con el resultado de la búsqueda (válido hasta la
+        siguiente llamada a search)
+    """
+    _ensure_capacity(engine, graph.num_vertices)
+    engine['epoch'] += 1
+    epoch = engine['epoch']
+    stamp, hops, parent = engine['stamp'], engine['hops'], engine['parent']
+
+    pending = set()
+    if targets is not None:
+        pending.update(targets)
+
+    frontier = []
+    for source in sources:
+        if stamp[source] != epoch:
+            stamp[source] = epoch
+            hops[source] = 0
+            parent[source] = -1
+            frontier.append(source)
+            pending.discard(source)
+    reached = len(frontier)
+
+    depth = 0
+    while frontier and (targets is None or pending) \
+            and (max_depth is None or depth < max_depth):
+        depth += 1
+        following = []
+        for vertex in frontier:
+            for adjacent in graph.iter_adjacent(vertex):
+                if stamp[adjacent] != epoch:
+                    stamp[adjacent] = epoch
+                    hops[adjacent] = depth
+                    parent[adjacent] = vertex
+                    following.append(adjacent)
+                    if adjacent in pending:
+                        pending.discard(adjacent)
+                        if not pending:
+                            break
+            if targets is not None and not pending:
+                break
+        reached += len(following)
+        frontier = following
+
+    engine['reached'] = reached
+    engine['targets_left'] = len(pending)
+    return engine
+
+
+def visited(engine, vertex):
+    """
+    Indica si vertex fue alcanzado en la búsqueda actual
+    """
+    if engine['epoch'] == 0 or vertex >= len(engine['stamp']):
+        return False
+    return engine['stamp'][vertex] == engine['epoch']
+
+
+def hops_to(engine, vertex):
+    """
+    Retorna el número de saltos desde la fuente más cercana hasta vertex,
+    o -1 si no fue alcanzado
+    """
+    if not visited(engine, vertex):
+        return -1
+    return engine['hops'][vertex]
+
+
+def path_to(engine, vertex):
+    """
+    Retorna el camino con menos saltos desde alguna fuente hasta vertex
+
+    Returns:
+        Una lista (array_list) con los vértices del camino, o None si
+        vertex no fue alcanzado
+    """
+    if not visited(engine, vertex):
+        return None
+    return dk.build_path(engine['parent'], vertex)
+
+
+#  ---------------------------------------------------------
+#   Funciones Helper
+#  ---------------------------------------------------------
+
+
+def _ensure_capacity(engine, num_vertices):
+    """
+    Extiende los arreglos del motor si el grafo tiene más vértices
+    """
+    missing = num_vertices - len(engine['stamp'])
+    if missing > 0:
+        engine['stamp'].extend(array('q', [0]) * missing)
+        engine['hops'].extend(array('q', [0]) * missing)
+        engine['parent'].extend(array('q', [-1]) * missing)
@@ -0,0 +1,109 @@
+"""
+Componentes fuertemente y débilmente conectados de un grafo dirigido.
+
+Ambos algoritmos recorren el grafo una sola vez, en tiempo O(V + E), y
+producen un arreglo plano (array) con la etiqueta de componente de cada
+vértice, de modo que "¿están u y v en la misma componente?" cuesta O(1).
+
+- Fuertes: algoritmo de Tarjan, con una pila explícita en lugar de
+  recursión (la red puede tener caminos de miles de paradas).
+- Débiles: union-find sobre todos los arcos, ignorando su dirección.
+
+Trabaja sobre grafos con vértices 0..n-1.
+"""
+from array import array
+
+from DataStructures.Graph import union_find as uf
+
+
+def strongly_connected(graph):
+    """
+    Calcula los componentes fuertemente conectados con Tarjan iterativo
+
+    Args:
+        graph: El grafo, con vértices 0..n-1
+    Returns:
+        Un diccionario con los campos:
+            - id: arreglo con la etiqueta (0..count-1) de cada vértice
+            - count: número de componentes
+    """
+    n = graph.num_vertices
+    index = array('q', [-1]) * n
+    low = array('q', [0]) * n
+    label = array('q', [-1]) * n
+    stack = []
+    count = 0
+    counter = 0
+    for root in range(n):
+        if index[root] != -1:
+            continue
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        work = [(root, graph.iter_adjacent(root))]
+        while work:
+            vertex, neighbors = work[-1]
+            descended = False
+            for adjacent in neighbors:
+                if index[adjacent] == -1:
+                    index[adjacent] = low[adjacent] = counter
+                    counter += 1
+                    stack.append(adjacent)
+                    work.append((adjacent, graph.iter_adjacent(adjacent)))
+                    descended = True
+                    break
+                # Visitado y sin etiqueta: sigue en la pila de Tarjan
+                if label[adjacent] == -1 and index[adjacent] < low[vertex]:
+                    low[vertex] = index[adjacent]
+            if descended:
+                continue
+            work.pop()
+            if work and low[vertex] < low[work[-1][0]]:
+                low[work[-1][0]] = low[vertex]
+            if low[vertex] == index[vertex]:
+                member = -1
+                while member != vertex:
+                    member = stack.pop()
+                    label[member] = count
+                count += 1
+    return {'id': label, 'count': count}
+
+
+def weakly_connected(graph):
+    """
+    Calcula los componentes débilmente conectados (conectados si se
+    ignora la dirección de los arcos) con union-find
+
+    Args:
+        graph: El grafo, con vértices 0..n-1
+    Returns:
+        Un diccionario con los campos:
+            - id: arreglo con la etiqueta (0..count-1) de cada vértice
+            - count: número de componentes
+    """
+    sets = uf.new_union_find(graph.num_vertices)
+    for vertex in range(graph.num_vertices):
+        for adjacent in graph.iter_adjacent(vertex):
+            uf.union(sets, vertex, adjacent)
+    return {'id': uf.labels(sets), 'count': uf.count(sets)}
+
+
+def count(components):
+    """
+    Retorna el número de componentes
+    """
+    return components['count']
+
+
+def component_of(components, vertex):
+    """
+    Retorna la etiqueta de la componente de vertex
+    """
+    return components['id'][vertex]
+
+
+def same_component(components, vertex1, vertex2):
+    """
+    Indica si vertex1 y vertex2 están en la misma componente
+    """
+    return components['id'][vertex1] == components['id'][vertex2]
@@ -0,0 +1,276 @@
+"""
+Jerarquías de contracción (contraction hierarchies) para consultas
+rápidas de distancia entre dos vértices.
+
+Preprocesamiento: los vértices se contraen uno a uno en orden de
+importancia. Al contraer v, para cada pareja de arcos u -> v -> w entre
+vértices aún no contraídos se agrega el atajo u -> w (con v como vértice
+intermedio) salvo que una búsqueda local ("witness search") encuentre
+un camino igual o más corto que no pase por v. La importancia de un
+vértice es su diferencia de aristas (atajos que requeriría menos arcos
+que elimina) más el número de vecinos ya contraídos, y se recalcula de
+forma perezosa al sacarlo de la cola.
+
+Consulta: búsqueda bidireccional que desde el origen solo sube (arcos
+hacia vértices de mayor rango) y desde el destino solo sube por arcos de
+entrada. El camino se reconstruye expandiendo recursivamente los atajos.
+
+Trabaja sobre grafos con vértices 0..n-1 y pesos no negativos.
+"""
+import heapq
+import math
+import time
+
+from DataStructures.List import array_list as lt
+from DataStructures.Priority_queue import indexminpq as iminpq
+
+
+def build(graph, witness_settle_limit=300, estimate_settle_limit=30):
+    """
+    Construye la jerarquía de contracción de un grafo
+
+    Args:
+        graph: El grafo dirigido, con vértices 0..n-1
+        witness_settle_limit: Máximo de vértices que extrae cada búsqueda
+            de testigos al contraer un vértice. Un límite menor acelera el
+            preprocesamiento a cambio de agregar atajos innecesarios (nunca
+            incorrectos)
+        estimate_settle_limit: El mismo límite, para las búsquedas que solo
+            estiman la importancia de un vértice
+    Returns:
+        La jerarquía, un diccionario con los campos:
+            - rank: posición de cada vértice en el orden de contracción
+            - up: por vértice, arcos (w, peso) hacia vértices de mayor rango
+            - down: por vértice, arcos de entrada (u, peso) desde vértices
+              de mayor rango
+            - middle: vértice intermedio de cada atajo (u, w)
+            - shortcuts: número de arcos que son atajos
+            - preprocess_ms: tiempo de construcción en milisegundos
+    """
+    start = time.perf_counter()
+    n = graph.num_vertices
+    out_arcs = [dict() for _ in range(n)]
+    in_arcs = [dict() for _ in range(n)]
+    for vertex in range(n):
+        for adjacent, weight in graph.iter_adjacent_edges(vertex):
+            if adjacent != vertex:
+                out_arcs[vertex][adjacent] = weight
+                in_arcs[adjacent][vertex] = weight
+
+    hierarchy = {
+        'rank': [0] * n,
+        'up': [[] for _ in range(n)],
+        'down': [[] for _ in range(n)],
+        'middle': {},
+        'shortcuts': 0,
+        'preprocess_ms': 0.0
+    }
+    contracted_neighbors = [0] * n
+
+    def importance(vertex):
+        shortcuts = _shortcuts(out_arcs, in_arcs, vertex, estimate_settle_limit)
+        removed = len(out_arcs[vertex]) + len(in_arcs[vertex])
+        return len(shortcuts) - removed + contracted_neighbors[vertex]
+
+    order = iminpq.new_index_minpq(size=n)
+    for vertex in range(n):
+        iminpq.insert(order, vertex, importance(vertex))
+
+    next_rank = 0
+    while not iminpq.is_empty(order):
+        vertex = iminpq.min(order)
+        # Actualización perezosa: si la prioridad recalculada ya no es la
+        # menor, se reubica el vértice y se vuelve a intentar
+        priority = importance(vertex)
+        if priority > iminpq.min_priority(order):
+            iminpq.increase_key(order, vertex, priority)
+            if iminpq.min(order) != vertex:
+                continue
+        iminpq.del_min(order)
+        _contract(hierarchy, out_arcs, in_arcs, vertex, witness_settle_limit)
+        hierarchy['rank'][vertex] = next_rank
+        next_rank += 1
+        for neighbor in set(out_arcs[vertex]) | set(in_arcs[vertex]):
+            contracted_neighbors[neighbor] += 1
+        _detach(out_arcs, in_arcs, vertex)
+
+    hierarchy['shortcuts'] = len(hierarchy['middle'])
+    hierarchy['preprocess_ms'] = (time.perf_counter() - start) * 1000
+    return hierarchy
+
+
+def query(hierarchy, source, target):
+    """
+    Calcula el camino más corto de source a target sobre la jerarquía
+
+    Args:
+        hierarchy: La jerarquía retornada por build
+        source: El vértice origen
+        target: El vértice destino
+    Returns:
+        Un diccionario con los campos:
+            - distance: longitud del camino (math.inf si no existe)
+            - path: lista (array_list) con los vértices del camino original
+              (atajos expandidos), o None si no existe
+            - settled: número de vértices extraídos entre ambas búsquedas
+    """
+    distance, meeting, parents, settled = _search(hierarchy, source, target)
+    result = {'distance': distance, 'path': None, 'settled': settled}
+    if meeting is None:
+        return result
+
+    forward_parent, backward_parent = parents
+    upward = [meeting]
+    while upward[-1] != source:
+        upward.append(forward_parent[upward[-1]])
+    upward.reverse()
+    vertex = meeting
+    while vertex != target:
+        vertex = backward_parent[vertex]
+        upward.append(vertex)
+
+    path = lt.new_list()
+    lt.add_last(path, source)
+    for tail, head in zip(upward, upward[1:]):
+        _unpack(hierarchy['middle'], tail, head, path)
+    result['path'] = path
+    return result
+
+
+def distance(hierarchy, source, target):
+    """
+    Retorna solo la distancia más corta de source a target
+    """
+    return _search(hierarchy, source, target)[0]
+
+
+#  ---------------------------------------------------------
+#   Funciones Helper
+#  ---------------------------------------------------------
+
+
+def _witness_search(out_arcs, source, excluded, limit, settle_limit):
+    """
+    Dijkstra local desde source que no pasa por excluded y se detiene al
+    superar la distancia limit o al extraer settle_limit vértices. Los
+    vértices más lejanos que limit no se encolan
+    """
+    dist = {source: 0.0}
+    heap = [(0.0, source)]
+    settled = 0
+    while heap and settled < settle_limit:
+        base, vertex = heapq.heappop(heap)
+        if base > dist[vertex]:
+            continue
+        settled += 1
+        for adjacent, weight in out_arcs[vertex].items():
+            candidate = base + weight
+            if candidate <= limit and adjacent != excluded \
+                    and candidate < dist.get(adjacent, math.inf):
+                dist[adjacent] = candidate
+                heapq.heappush(heap, (candidate, adjacent))
+    return dist
+
+
+def _shortcuts(out_arcs, in_arcs, vertex, settle_limit):
+    """
+    Retorna los atajos (u, w, peso) que requiere contraer vertex
+    """
+    shortcuts = []
+    outgoing = out_arcs[vertex]
+    if not outgoing:
+        return shortcuts
+    max_out = max(outgoing.values())
+    for source, in_weight in in_arcs[vertex].items():
+        witness = _witness_search(out_arcs, source, vertex, in_weight + max_out,
+                                  settle_limit)
+        for target, out_weight in outgoing.items():
+            if target == source:
+                continue
+            through = in_weight + out_weight
+            if witness.get(target, math.inf) > through:
+                shortcuts.append((source, target, through))
+    return shortcuts
+
+
+def _contract(hierarchy, out_arcs, in_arcs, vertex, settle_limit):
+    """
+    Guarda los arcos de vertex hacia vértices de mayor rango y agrega
+    los atajos necesarios entre sus vecinos
+    """
+    hierarchy['up'][vertex] = list(out_arcs[vertex].items())
+    hierarchy['down'][vertex] = list(in_arcs[vertex].items())
+    for source, target, weight in _shortcuts(out_arcs, in_arcs, vertex, settle_limit):
+        if weight < out_arcs[source].get(target, math.inf):
+            out_arcs[source][target] = weight
+            in_arcs[target][source] = weight
+            hierarchy['middle'][(source, target)] = vertex
+
+
+def _detach(out_arcs, in_arcs, vertex):
+    """
+    Elimina vertex del grafo de trabajo
+    """
+    for target in out_arcs[vertex]:
+        del in_arcs[target][vertex]
+    for source in in_arcs[vertex]:
+        del out_arcs[source][vertex]
+    out_arcs[vertex] = {}
+    in_arcs[vertex] = {}
+
+
+def _search(hierarchy, source, target):
+    """
+    Búsqueda bidireccional hacia arriba. Cada dirección se detiene cuando
+    su mínimo supera la mejor distancia encontrada
+    Returns:
+        (distancia, vértice de encuentro, padres, extraídos)
+    """
+    if source == target:
+        return 0.0, source, ({}, {}), 0
+    dist = ({source: 0.0}, {target: 0.0})
+    parents = ({}, {})
+    arcs = (hierarchy['up'], hierarchy['down'])
+    heaps = ([(0.0, source)], [(0.0, target)])
+    best = math.inf
+    meeting = None
+    settled = 0
+    side = 0
+    while heaps[0] or heaps[1]:
+        if not heaps[side]:
+            side = 1 - side
+        heap = heaps[side]
+        base, vertex = heapq.heappop(heap)
+        own, other = dist[side], dist[1 - side]
+        if base >= best:
+            # Esta dirección ya no puede mejorar el resultado
+            heap.clear()
+        elif base <= own[vertex]:
+            settled += 1
+            if vertex in other and base + other[vertex] < best:
+                best = base + other[vertex]
+                meeting = vertex
+            for adjacent, weight in arcs[side][vertex]:
+                candidate = base + weight
+                if candidate < own.get(adjacent, math.inf):
+                    own[adjacent] = candidate
+                    parents[side][adjacent] = vertex
+                    heapq.heappush(heap, (candidate, adjacent))
+        side = 1 - side
+    return best, meeting, parents, settled
+
+
+def _unpack(middle, tail, head, path):
+    """
+    Agrega a path los vértices del arco tail -> head (sin tail),
+    expandiendo recursivamente los atajos
+    """
+    stack = [(tail, head)]
+    while stack:
+        tail, head = stack.pop()
+        via = middle.get((tail, head))
+        if via is None:
+            lt.add_last(path, head)
+        else:
+            stack.append((via, head))
+            stack.append((tail, via))
@@ -0,0 +1,82 @@
+"""
+Registro de estructuras derivadas (componentes, landmarks, jerarquías,
+redes del planificador...) y de la versión de sus fuentes con la que se
+construyó cada una.
+
+La versión es una tupla con las épocas de mutación de las fuentes
+(Graph.epoch, map_linear_probing.epoch). Una estructura está al día si
+la versión registrada es igual a la actual; si no, se reconstruye en el
+siguiente acceso (ensure) y no antes, así que varias mutaciones seguidas
+cuestan una sola reconstrucción.
+
+El registro solo guarda nombres, versiones y contadores (nunca las
+funciones de construcción), de modo que se puede serializar junto con
+el analizador.
+"""
+
+
+def new_registry():
+    """
+    Crea un registro vacío
+
+    Returns:
+        Un diccionario con los campos:
+            - versions: versión de las fuentes de cada estructura registrada
+            - hits: accesos que encontraron la estructura al día
+            - builds: construcciones hechas por ensure
+    """
+    return {
+        'versions': {},
+        'hits': 0,
+        'builds': 0
+    }
+
+
+def record(registry, name, version):
+    """
+    Registra que la estructura name se construyó con la versión version
+    de sus fuentes
+    """
+    registry['versions'][name] = version
+
+
+def forget(registry, name):
+    """
+    Elimina la estructura name del registro (queda desactualizada)
+    """
+    registry['versions'].pop(name, None)
+
+
+def contains(registry, name):
+    """
+    Indica si la estructura name está registrada, al día o no
+    """
+    return name in registry['versions']
+
+
+def is_current(registry, name, version):
+    """
+    Indica si la estructura name está registrada con la versión version
+    """
+    return registry['versions'].get(name) == version
+
+
+def ensure(registry, name, version, build):
+    """
+    Reconstruye la estructura name si no está al día
+
+    Args:
+        registry: El registro
+        name: El nombre de la estructura
+        version: La versión actual de sus fuentes
+        build: Función sin argumentos que construye la estructura
+    Returns:
+        True si se reconstruyó, False si estaba al día
+    """
+    if is_current(registry, name, version):
+        registry['hits'] += 1
+        return False
+    build()
+    record(registry, name, version)
+    registry['builds'] += 1
+    return True
@@ -0,0 +1,184 @@
+"""
+Algoritmo de Dijkstra para caminos más cortos desde una fuente.
+
+Trabaja sobre un Graph (o su vista FrozenGraph) cuyos vértices son ids
+enteros densos 0..n-1, como el grafo de conexiones del analizador, y con
+pesos no negativos. Las distancias y el arco por el que se llega a cada
+vértice se guardan en arreglos planos indexados por id, de modo que la
+reconstrucción de un camino cuesta O(longitud del camino).
+
+Este código está basado en la implementación propuesta por R. Sedgewick
+y Kevin Wayne en su libro Algorithms, 4th Edition.
+"""
+import math
+
+from DataStructures.List import array_list as lt
+from DataStructures.Priority_queue import indexminpq as iminpq
+
+
+def dijkstra(graph, source, target=None):
+    """
+    Calcula los caminos más cortos desde source a todos los vértices
+
+    Args:
+        graph: El grafo, con vértices 0..n-1
+        source: El vértice fuente
+        target: Si se indica, la búsqueda termina en cuanto se extrae
+            target de la cola; las distancias de los demás vértices pueden
+            quedar incompletas
+    Returns:
+        La estructura de búsqueda con los campos:
+            - source: el vértice fuente
+            - dist_to: distancia mínima desde source a cada vértice
+            - edge_to: vértice anterior en el camino mínimo (-1 si no hay)
+            - settled: número de vértices extraídos de la cola
+    """
+    n = graph.num_vertices
+    search = {
+        'source': source,
+        'dist_to': [math.inf] * n,
+        'edge_to': [-1] * n,
+        'settled': 0
+    }
+    dist_to = search['dist_to']
+    edge_to = search['edge_to']
+    dist_to[source] = 0.0
+
+    pq = iminpq.new_index_minpq(size=n)
+    iminpq.insert(pq, source, 0.0)
+    while not iminpq.is_empty(pq):
+        vertex = iminpq.del_min(pq)
+        search['settled'] += 1
+        if vertex == target:
+            break
+        base = dist_to[vertex]
+        for adjacent, weight in graph.iter_adjacent_edges(vertex):
+            distance = base + weight
+            if distance < dist_to[adjacent]:
+                dist_to[adjacent] = distance
+                edge_to[adjacent] = vertex
+                if iminpq.contains(pq, adjacent):
+                    iminpq.decrease_key(pq, adjacent, distance)
+                else:
+                    iminpq.insert(pq, adjacent, distance)
+    return search
+
+
+def dist_to(search, vertex):
+    """
+    Retorna la distancia mínima desde la fuente hasta vertex
+    (math.inf si no es alcanzable)
+    """
+    return search['dist_to'][vertex]
+
+
+def has_path_to(search, vertex):
+    """
+    Indica si existe un camino desde la fuente hasta vertex
+    """
+    return search['dist_to'][vertex] < math.inf
+
+
+def path_to(search, vertex):
+    """
+    Retorna el camino mínimo desde la fuente hasta vertex
+
+    Args:
+        search: La estructura de búsqueda retornada por dijkstra
+        vertex: El vértice destino
+    Returns:
+        Una lista (array_list) con los vértices del camino, desde la fuente
+        hasta vertex, o None si vertex no es alcanzable
+    """
+    if not has_path_to(search, vertex):
+        return None
+    return build_path(search['edge_to'], vertex)
+
+
+def build_path(edge_to, vertex):
+    """
+    Reconstruye un camino siguiendo el arreglo de padres edge_to hasta
+    un vértice sin padre (-1)
+
+    Returns:
+        Una lista (array_list) con los vértices del camino en orden
+    """
+    reversed_path = []
+    while vertex != -1:
+        reversed_path.append(vertex)
+        vertex = edge_to[vertex]
+    path = lt.new_list()
+    for vertex in reversed(reversed_path):
+        lt.add_last(path, vertex)
+    return path
+
+
+def bidirectional_dijkstra(graph, source, target):
+    """
+    Calcula el camino más corto entre source y target buscando al mismo
+    tiempo hacia adelante desde source (arcos de salida) y hacia atrás
+    desde target (arcos de entrada, ver Graph.iter_predecessor_edges).
+
+    En cada paso avanza el lado cuya cola tiene la menor distancia. mu es
+    la longitud del mejor camino encontrado que une ambas búsquedas; la
+    búsqueda termina cuando la suma de los mínimos de las dos colas es
+    mayor o igual que mu, porque ningún camino sin explorar puede ser más
+    corto.
+
+    Args:
+        graph: El grafo dirigido, con vértices 0..n-1
+        source: El vértice origen
+        target: El vértice destino
+    Returns:
+        Un diccionario con los campos:
+            - distance: longitud del camino (math.inf si no existe)
+            - path: lista (array_list) con los vértices del camino, o None
+            - settled: número de vértices extraídos entre ambas colas
+    """
+    n = graph.num_vertices
+    dist = ([math.inf] * n, [math.inf] * n)
+    parent = ([-1] * n, [-1] * n)
+    adjacency = (graph.iter_adjacent_edges, graph.iter_predecessor_edges)
+    queues = (iminpq.new_index_minpq(size=n), iminpq.new_index_minpq(size=n))
+    dist[0][source] = 0.0
+    dist[1][target] = 0.0
+    iminpq.insert(queues[0], source, 0.0)
+    iminpq.insert(queues[1], target, 0.0)
+
+    mu = 0.0 if source == target else math.inf
+    meeting = source if source == target else -1
+    settled = 0
+    while not iminpq.is_empty(queues[0]) and not iminpq.is_empty(queues[1]):
+        top_forward = dist[0][iminpq.min(queues[0])]
+        top_backward = dist[1][iminpq.min(queues[1])]
+        if top_forward + top_backward >= mu:
+            break
+        side = 0 if top_forward <= top_backward else 1
+        own_dist, other_dist = dist[side], dist[1 - side]
+        own_parent, pq = parent[side], queues[side]
+
+        vertex = iminpq.del_min(pq)
+        settled += 1
+        base = own_dist[vertex]
+        for adjacent, weight in adjacency[side](vertex):
+            distance = base + weight
+            if distance < own_dist[adjacent]:
+                own_dist[adjacent] = distance
+                own_parent[adjacent] = vertex
+                if iminpq.contains(pq, adjacent):
+                    iminpq.decrease_key(pq, adjacent, distance)
+                else:
+                    iminpq.insert(pq, adjacent, distance)
+            if own_dist[adjacent] + other_dist[adjacent] < mu:
+                mu = own_dist[adjacent] + other_dist[adjacent]
+                meeting = adjacent
+
+    result = {'distance': mu, 'path': None, 'settled': settled}
+    if meeting != -1:
+        path = build_path(parent[0], meeting)
+        vertex = parent[1][meeting]
+        while vertex != -1:
+            lt.add_last(path, vertex)
+            vertex = parent[1][vertex]
+        result['path'] = path
+    return result
@@ -0,0 +1,191 @@
+"""
+Búsqueda A* con landmarks (ALT: A*, Landmarks, Triangle inequality).
+
+El archivo de servicios no trae coordenadas, así que la cota inferior de
+A* se obtiene de distancias precalculadas a unos pocos vértices
+"landmark". Para un landmark L, por la desigualdad triangular:
+
+    d(v, t) >= d(L, t) - d(L, v)      (distancias desde L)
+    d(v, t) >= d(v, L) - d(t, L)      (distancias hacia L)
+
+La cota de un vértice es el máximo sobre todos los landmarks. Los
+landmarks se eligen "farthest-first": cada nuevo landmark es el vértice
+más lejano (en saltos de la red no dirigida) de los ya escogidos.
+
+Trabaja sobre grafos con vértices 0..n-1 y con índice inverso (ver
+Graph.iter_predecessor_edges) para las distancias hacia cada landmark.
+"""
+import math
+import random
+
+from DataStructures.Graph import dijkstra as dk
+from DataStructures.Priority_queue import indexminpq as iminpq
+
+
+def preprocess(graph, num_landmarks=8, seed=0):
+    """
+    Escoge los landmarks y calcula sus distancias
+
+    Args:
+        graph: El grafo dirigido, con vértices 0..n-1
+        num_landmarks: Número de landmarks k
+        seed: Semilla para escoger el primer vértice de partida
+    Returns:
+        Un diccionario con los campos:
+            - landmarks: lista con los k vértices escogidos
+            - forward: por landmark, distancias desde el landmark a cada vértice
+            - backward: por landmark, distancias desde cada vértice al landmark
+    """
+    n = graph.num_vertices
+    landmarks = []
+    if n == 0:
+        return {'landmarks': landmarks, 'forward': [], 'backward': []}
+
+    # Saltos (no dirigidos) al landmark más cercano ya escogido
+    nearest = [math.inf] * n
+    start = random.Random(seed).randrange(n)
+    candidate = _farthest(graph, [start], nearest=[math.inf] * n)
+    while len(landmarks) < min(num_landmarks, n):
+        landmarks.append(candidate)
+        candidate = _farthest(graph, [candidate], nearest)
+        if nearest[candidate] == 0:
+            break
+
+    forward = [_distances(graph, landmark, graph.iter_adjacent_edges) for landmark in landmarks]
+    backward = [_distances(graph, landmark, graph.iter_predecessor_edges) for landmark in landmarks]
+    return {'landmarks': landmarks, 'forward': forward, 'backward': backward}
+
+
+def lower_bound(lm, vertex, target):
+    """
+    Retorna la cota inferior de la distancia de vertex a target.
+    Retorna math.inf cuando los landmarks prueban que target no es
+    alcanzable desde vertex (target llega a un landmark y vertex no)
+    """
+    bound = 0.0
+    for forward, backward in zip(lm['forward'], lm['backward']):
+        if forward[target] < math.inf and forward[vertex] < math.inf:
+            estimate = forward[target] - forward[vertex]
+            if estimate > bound:
+                bound = estimate
+        if backward[target] < math.inf:
+            if backward[vertex] == math.inf:
+                return math.inf
+            estimate = backward[vertex] - backward[target]
+            if estimate > bound:
+                bound = estimate
+    return bound
+
+
+def alt_search(graph, lm, source, target):
+    """
+    Calcula el camino más corto de source a target con A* usando las
+    cotas de los landmarks
+
+    Args:
+        graph: El grafo, con vértices 0..n-1
+        lm: El resultado de preprocess sobre el mismo grafo
+        source: El vértice origen
+        target: El vértice destino
+    Returns:
+        Un diccionario con los campos:
+            - distance: longitud del camino (math.inf si no existe)
+            - path: lista (array_list) con los vértices del camino, o None
+            - settled: número de vértices extraídos de la cola
+    """
+    n = graph.num_vertices
+    dist_to = [math.inf] * n
+    edge_to = [-1] * n
+    potential = {}
+    dist_to[source] = 0.0
+
+    def heuristic(vertex):
+        value = potential.get(vertex)
+        if value is None:
+            value = lower_bound(lm, vertex, target)
+            potential[vertex] = value
+        return value
+
+    pq = iminpq.new_index_minpq(size=n)
+    if heuristic(source) < math.inf:
+        iminpq.insert(pq, source, heuristic(source))
+    settled = 0
+    while not iminpq.is_empty(pq):
+        vertex = iminpq.del_min(pq)
+        settled += 1
+        if vertex == target:
+            break
+        base = dist_to[vertex]
+        for adjacent, weight in graph.iter_adjacent_edges(vertex):
+            distance = base + weight
+            if distance < dist_to[adjacent]:
+                priority = distance + heuristic(adjacent)
+                if priority == math.inf:
+                    continue
+                dist_to[adjacent] = distance
+                edge_to[adjacent] = vertex
+                if iminpq.contains(pq, adjacent):
+                    iminpq.decrease_key(pq, adjacent, priority)
+                else:
+                    iminpq.insert(pq, adjacent, priority)
+
+    result = {'distance': dist_to[target], 'path': None, 'settled': settled}
+    if dist_to[target] < math.inf:
+        result['path'] = dk.build_path(edge_to, target)
+    return result
+
+
+#  ---------------------------------------------------------
+#   Funciones Helper
+#  ---------------------------------------------------------
+
+
+def _distances(graph, source, adjacency):
+    """
+    Distancias de Dijkstra desde source siguiendo la función de
+    adyacencia dada (arcos de salida o de entrada)
+    """
+    n = graph.num_vertices
+    dist_to = [math.inf] * n
+    dist_to[source] = 0.0
+    pq = iminpq.new_index_minpq(size=n)
+    iminpq.insert(pq, source, 0.0)
+    while not iminpq.is_empty(pq):
+        vertex = iminpq.del_min(pq)
+        base = dist_to[vertex]
+        for adjacent, weight in adjacency(vertex):
+            distance = base + weight
+            if distance < dist_to[adjacent]:
+                dist_to[adjacent] = distance
+                if iminpq.contains(pq, adjacent):
+                    iminpq.decrease_key(pq, adjacent, distance)
+                else:
+                    iminpq.insert(pq, adjacent, distance)
+    return dist_to
+
+
+def _farthest(graph, sources, nearest):
+    """
+    Actualiza nearest con los saltos (red no dirigida) desde sources y
+    retorna el vértice con mayor valor en nearest. Los vértices no
+    alcanzables se prefieren, para cubrir también otras componentes
+    """
+    frontier = list(sources)
+    for vertex in frontier:
+        nearest[vertex] = 0
+    hops = 0
+    while frontier:
+        hops += 1
+        following = []
+        for vertex in frontier:
+            for adjacent in _neighbors(graph, vertex):
+                if nearest[adjacent] > hops:
+                    nearest[adjacent] = hops
+                    following.append(adjacent)
+        frontier = following
+    return max(range(graph.num_vertices), key=nearest.__getitem__)
+
+
+def _neighbors(graph, vertex):
+    yield from graph.iter_adjacent(vertex)
+    yield from graph.iter_predecessors(vertex)
@@ -0,0 +1,134 @@
+"""
+Árbol (bosque) de expansión mínima sobre la vista no dirigida de un grafo.
+
+- Kruskal: consume una cola de prioridad de conexiones ordenadas por
+  distancia y acepta cada una que une dos componentes distintos, usando
+  union-find. Termina en cuanto el bosque tiene n - c arcos (c es el
+  número de componentes).
+- Prim (versión "eager"): hace crecer un árbol desde cada vértice no
+  visitado, guardando en una cola de prioridad indexada la arista más
+  barata que conecta cada vértice con el árbol.
+
+En la vista no dirigida los arcos u -> v y v -> u son la misma arista,
+con el menor de sus pesos. Trabaja sobre vértices 0..n-1.
+
+Este código está basado en la implementación propuesta por R. Sedgewick
+y Kevin Wayne en su libro Algorithms, 4th Edition.
+"""
+import math
+
+from DataStructures.Graph import union_find as uf
+from DataStructures.List import array_list as lt
+from DataStructures.Priority_queue import indexminpq as iminpq
+from DataStructures.Priority_queue import priority_queue as pq
+
+
+def kruskal(num_vertices, heap, num_components=1):
+    """
+    Calcula el bosque de expansión mínima con el algoritmo de Kruskal
+
+    Args:
+        num_vertices: Número de vértices
+        heap: Cola de prioridad (priority_queue) ordenada por distancia,
+            cuyos valores son conexiones con los campos from, to y
+            distance. Se consume; para conservarla pase pq.copy(heap)
+        num_components: Número de componentes conectados esperado; la
+            búsqueda termina al aceptar num_vertices - num_components
+            aristas
+    Returns:
+        Un diccionario con los campos:
+            - weight: peso total del bosque
+            - edges: lista (array_list) de aristas (origen, destino, peso)
+            - examined: número de conexiones extraídas de la cola
+    """
+    sets = uf.new_union_find(num_vertices)
+    result = {'weight': 0.0, 'edges': lt.new_list(), 'examined': 0}
+    goal = num_vertices - num_components
+    while lt.size(result['edges']) < goal and not pq.is_empty(heap):
+        connection = pq.remove_value(heap)
+        result['examined'] += 1
+        if uf.union(sets, connection['from'], connection['to']):
+            lt.add_last(result['edges'],
+                        (connection['from'], connection['to'], connection['distance']))
+            result['weight'] += connection['distance']
+    return result
+
+
+def edge_heap(graph, cmp_function):
+    """
+    Retorna una cola de prioridad con todos los arcos del grafo como
+    conexiones (from, to, distance), para usar con kruskal
+
+    Args:
+        graph: El grafo, con vértices 0..n-1
+        cmp_function: Función de comparación de las llaves {'distance': d}
+    """
+    entries = []
+    for vertex in range(graph.num_vertices):
+        for adjacent, weight in graph.iter_adjacent_edges(vertex):
+            entries.append(({'distance': weight},
+                            {'from': vertex, 'to': adjacent, 'distance': weight}))
+    return pq.build_heap(entries, cmp_function)
+
+
+def prim(graph):
+    """
+    Calcula el bosque de expansión mínima con la versión eager del
+    algoritmo de Prim
+
+    Args:
+        graph: El grafo, con vértices 0..n-1. Si es dirigido debe tener
+            índice inverso (ver Graph.iter_predecessor_edges)
+    Returns:
+        Un diccionario con los campos:
+            - weight: peso total del bosque
+            - edges: lista (array_list) de aristas (origen, destino, peso)
+    """
+    n = graph.num_vertices
+    dist_to = [math.inf] * n
+    edge_to = [-1] * n
+    marked = [False] * n
+    result = {'weight': 0.0, 'edges': lt.new_list()}
+    neighbors = _undirected_neighbors(graph)
+
+    # La cola queda vacía al terminar cada árbol y se reutiliza
+    pq_tree = iminpq.new_index_minpq(size=n)
+    for root in range(n):
+        if marked[root]:
+            continue
+        dist_to[root] = 0.0
+        iminpq.insert(pq_tree, root, 0.0)
+        while not iminpq.is_empty(pq_tree):
+            vertex = iminpq.del_min(pq_tree)
+            marked[vertex] = True
+            if edge_to[vertex] != -1:
+                lt.add_last(result['edges'], (edge_to[vertex], vertex, dist_to[vertex]))
+                result['weight'] += dist_to[vertex]
+            for adjacent, weight in neighbors(vertex):
+                if marked[adjacent] or weight >= dist_to[adjacent]:
+                    continue
+                dist_to[adjacent] = weight
+                edge_to[adjacent] = vertex
+                if iminpq.contains(pq_tree, adjacent):
+                    iminpq.decrease_key(pq_tree, adjacent, weight)
+                else:
+                    iminpq.insert(pq_tree, adjacent, weight)
+    return result
+
+
+#  ---------------------------------------------------------
+#   Funciones Helper
+#  ---------------------------------------------------------
+
+
+def _undirected_neighbors(graph):
+    """
+    Retorna la función de vecinos (vértice, peso) de la vista no dirigida
+    """
+    if not graph.directed:
+        return graph.iter_adjacent_edges
+
+    def neighbors(vertex):
+        yield from graph.iter_adjacent_edges(vertex)
+        yield from graph.iter_predecessor_edges(vertex)
+    return neighbors
@@ -0,0 +1,177 @@
+"""
+Caché acotado de árboles de caminos más cortos (Dijkstra) por vértice
+fuente, con desalojo LRU (el usado hace más tiempo sale primero).
+
+Cada árbol se guarda compacto, en dos arreglos planos (array) indexados
+por vértice: distancia a la fuente ('d', 8 bytes) y vértice anterior en
+el camino ('q', 8 bytes). Así el tamaño de un árbol es ~16 bytes por
+vértice y el límite del caché se expresa en bytes. Las consultas desde
+una fuente en caché solo recorren el arreglo de padres, sin buscar.
+
+El orden LRU es el orden de inserción del diccionario de árboles: un
+acierto saca el árbol y lo vuelve a insertar al final, y el desalojo
+toma el primero. El caché recuerda la época de mutación del grafo
+(Graph.epoch) con la que se calcularon sus árboles; si el grafo cambió,
+se vacía antes de responder.
+
+Los árboles retornados tienen los campos de la estructura de búsqueda
+de dijkstra, así que sirven con dijkstra.dist_to, has_path_to y path_to.
+"""
+import sys
+from array import array
+
+from DataStructures.Graph import dijkstra as dk
+
+DEFAULT_MAX_BYTES = 8 * 1024 * 1024
+
+
+def new_path_cache(max_bytes=DEFAULT_MAX_BYTES):
+    """
+    Crea un caché vacío
+
+    Args:
+        max_bytes: Tamaño máximo de los árboles guardados, en bytes
+    Returns:
+        El caché, un diccionario con los campos:
+            - max_bytes: tamaño máximo
+            - bytes: tamaño actual de los árboles guardados
+            - trees: árboles por vértice fuente, del menos al más
+              recientemente usado
+            - epoch: época del grafo con la que se calcularon los árboles
+            - hits, misses, evictions, invalidations: contadores
+    """
+    return {
+        'max_bytes': max_bytes,
+        'bytes': 0,
+        'trees': {},
+        'epoch': None,
+        'hits': 0,
+        'misses': 0,
+        'evictions': 0,
+        'invalidations': 0
+    }
+
+
+def shortest_path_tree(cache, graph, source):
+    """
+    Retorna el árbol de caminos más cortos desde source, del caché si
+    está y si no calculándolo con Dijkstra y guardándolo
+
+    Args:
+        cache: El caché
+        graph: El grafo, con vértices 0..n-1
+        source: El vértice fuente
+    Returns:
+        El árbol, con los campos source, dist_to, edge_to y settled
+    """
+    _check_epoch(cache, graph)
+    trees = cache['trees']
+    tree = trees.pop(source, None)
+    if tree is not None:
+        cache['hits'] += 1
+        trees[source] = tree
+        return tree
+
+    cache['misses'] += 1
+    search = dk.dijkstra(graph, source)
+    tree = {
+        'source': source,
+        'dist_to': array('d', search['dist_to']),
+        'edge_to': array('q', search['edge_to']),
+        'settled': search['settled']
+    }
+    size = tree_bytes(tree)
+    if size > cache['max_bytes']:
+        # No cabe ni con el caché vacío: se retorna sin guardarlo
+        return tree
+    while cache['bytes'] + size > cache['max_bytes']:
+        _evict_oldest(cache)
+    trees[source] = tree
+    cache['bytes'] += size
+    return tree
+
+
+def contains(cache, source):
+    """
+    Indica si el árbol de source está en el caché (sin contar un acierto
+    ni cambiar el orden LRU)
+    """
+    return source in cache['trees']
+
+
+def most_recent(cache, graph):
+    """
+    Retorna el árbol usado más recientemente, o None si el caché está
+    vacío. Si el grafo cambió desde que se calcularon los árboles, el
+    caché se vacía y se retorna None
+    """
+    _check_epoch(cache, graph)
+    if not cache['trees']:
+        return None
+    return cache['trees'][next(reversed(cache['trees']))]
+
+
+def clear(cache):
+    """
+    Vacía el caché, conservando los contadores
+    """
+    cache['trees'].clear()
+    cache['bytes'] = 0
+    cache['epoch'] = None
+
+
+def size(cache):
+    """
+    Retorna el número de árboles en el caché
+    """
+    return len(cache['trees'])
+
+
+def stats(cache):
+    """
+    Retorna un diccionario con los contadores del caché: hits, misses,
+    evictions, invalidations, trees (árboles guardados), bytes y max_bytes
+    """
+    return {
+        'hits': cache['hits'],
+        'misses': cache['misses'],
+        'evictions': cache['evictions'],
+        'invalidations': cache['invalidations'],
+        'trees': len(cache['trees']),
+        'bytes': cache['bytes'],
+        'max_bytes': cache['max_bytes']
+    }
+
+
+def tree_bytes(tree):
+    """
+    Retorna el tamaño en bytes de los arreglos de un árbol
+    """
+    return sys.getsizeof(tree['dist_to']) + sys.getsizeof(tree['edge_to'])
+
+
+#  ---------------------------------------------------------
+#   Funciones Helper
+#  ---------------------------------------------------------
+
+
+def _check_epoch(cache, graph):
+    """
+    Vacía el caché si el grafo cambió desde que se calcularon sus árboles
+    """
+    epoch = graph.epoch
+    if cache['epoch'] != epoch:
+        if cache['trees']:
+            cache['invalidations'] += 1
+            clear(cache)
+        cache['epoch'] = epoch
+
+
+def _evict_oldest(cache):
+    """
+    Desaloja el árbol usado hace más tiempo
+    """
+    trees = cache['trees']
+    oldest = next(iter(trees))
+    cache['bytes'] -= tree_bytes(trees.pop(oldest))
+    cache['evictions'] += 1
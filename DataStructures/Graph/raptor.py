@@ -0,0 +1,169 @@
+"""
+Planificador de viajes por rondas al estilo RAPTOR (Round-bAsed Public
+Transit Optimized Router), sobre las secuencias de paradas de cada ruta.
+
+El archivo de servicios no trae horarios, así que el criterio de cada
+viaje es la distancia recorrida en lugar de la hora de llegada. La ronda
+k calcula, para cada parada, la menor distancia alcanzable con a lo más
+k tramos (k - 1 transbordos): recorre una sola vez cada ruta que pasa
+por una parada mejorada en la ronda anterior, "subiendo" al bus en la
+parada desde la que el recorrido acumulado es menor. Solo se marcan las
+paradas que mejoran la mejor distancia conocida (y que no superan la del
+destino), de modo que cada mejora del destino en una ronda es un punto
+del frente de Pareto sobre (transbordos, distancia).
+
+No usa la red de conexiones: cada ruta se recorre en su propio orden,
+con sus propios pesos, y los transbordos solo ocurren en la misma parada.
+Trabaja con paradas identificadas por ids 0..n-1.
+"""
+import math
+from array import array
+
+from DataStructures.List import array_list as lt
+
+
+def new_network(num_stops=0):
+    """
+    Crea una red vacía para el planificador
+
+    Returns:
+        La red, un diccionario con los campos:
+            - num_stops: número de paradas
+            - route_ids: identificador de cada ruta
+            - stops: por ruta, arreglo con las paradas en orden
+            - weights: por ruta, arreglo con el peso del tramo que llega a
+              cada posición (math.inf si no hay tramo)
+            - stop_routes: por parada, lista de (ruta, posición) donde
+              aparece
+    """
+    return {
+        'num_stops': num_stops,
+        'route_ids': [],
+        'stops': [],
+        'weights': [],
+        'stop_routes': [[] for _ in range(num_stops)]
+    }
+
+
+def add_route(network, route_id, stops, weights):
+    """
+    Agrega una ruta a la red
+
+    Args:
+        network: La red
+        route_id: El identificador de la ruta
+        stops: Las paradas de la ruta, en orden de recorrido
+        weights: weights[i] es la distancia de stops[i - 1] a stops[i]
+    Returns:
+        El índice de la ruta en la red
+    """
+    route = len(network['route_ids'])
+    network['route_ids'].append(route_id)
+    network['stops'].append(array('q', stops))
+    network['weights'].append(array('d', weights))
+    stop_routes = network['stop_routes']
+    for position, stop in enumerate(stops):
+        while stop >= len(stop_routes):
+            stop_routes.append([])
+        stop_routes[stop].append((route, position))
+    network['num_stops'] = len(stop_routes)
+    return route
+
+
+def journeys(network, source, target, max_transfers=4):
+    """
+    Calcula el frente de Pareto de los viajes de source a target sobre
+    (número de transbordos, distancia)
+
+    Args:
+        network: La red
+        source: La parada de origen
+        target: La parada de destino
+        max_transfers: Máximo número de transbordos a considerar
+    Returns:
+        Una lista (array_list) con los viajes no dominados, en orden
+        creciente de transbordos (y decreciente de distancia). Cada viaje
+        es un diccionario con los campos:
+            - transfers: número de transbordos
+            - distance: distancia total
+            - legs: lista (array_list) de tramos, cada uno con los campos
+              route, board, alight y distance
+    """
+    result = lt.new_list()
+    if source == target:
+        lt.add_last(result, {'transfers': 0, 'distance': 0.0, 'legs': lt.new_list()})
+        return result
+
+    best = array('d', [math.inf]) * network['num_stops']
+    best[source] = 0.0
+    marked = [source]
+    parents = []
+    stop_routes = network['stop_routes']
+    for round_num in range(1, max_transfers + 2):
+        # Rutas a recorrer y la primera posición marcada de cada una
+        queue = {}
+        for stop in marked:
+            for route, position in stop_routes[stop]:
+                if position < queue.get(route, math.inf):
+                    queue[route] = position
+
+        previous = array('d', best)
+        improved = {}
+        for route, start in queue.items():
+            stops = network['stops'][route]
+            weights = network['weights'][route]
+            carried = math.inf
+            board = -1
+            for position in range(start, len(stops)):
+                stop = stops[position]
+                if board >= 0:
+                    carried += weights[position]
+                    if carried < best[stop] and carried < best[target]:
+                        best[stop] = carried
+                        improved[stop] = (route, board, position)
+                if previous[stop] < carried:
+                    carried = previous[stop]
+                    board = position
+
+        parents.append(improved)
+        if target in improved:
+            lt.add_last(result, _journey(network, parents, source, target, best[target]))
+        marked = [stop for stop in improved if stop != target]
+        if not marked:
+            break
+    return result
+
+
+#  ---------------------------------------------------------
+#   Funciones Helper
+#  ---------------------------------------------------------
+
+
+def _journey(network, parents, source, target, distance):
+    """
+    Reconstruye el viaje que llega a target en la última ronda
+    """
+    legs = []
+    stop = target
+    round_num = len(parents)
+    while stop != source:
+        # La etiqueta de stop en la ronda round_num viene de la última
+        # ronda <= round_num en la que mejoró
+        while stop not in parents[round_num - 1]:
+            round_num -= 1
+        route, board, alight = parents[round_num - 1][stop]
+        stops = network['stops'][route]
+        weights = network['weights'][route]
+        legs.append({
+            'route': network['route_ids'][route],
+            'board': stops[board],
+            'alight': stops[alight],
+            'distance': sum(weights[board + 1:alight + 1])
+        })
+        stop = stops[board]
+        round_num -= 1
+
+    journey = {'transfers': len(legs) - 1, 'distance': distance, 'legs': lt.new_list()}
+    for leg in reversed(legs):
+        lt.add_last(journey['legs'], leg)
+    return journey
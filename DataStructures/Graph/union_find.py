@@ -0,0 +1,123 @@
+"""
+Estructura de conjuntos disjuntos (union-find) sobre los enteros 0..n-1,
+con compresión de caminos y unión por rango: cada operación cuesta
+tiempo amortizado casi constante (inversa de la función de Ackermann).
+
+El padre y el rango de cada elemento se guardan en arreglos planos
+(array) indexados por el elemento. La estructura puede crecer con add,
+de modo que se puede mantener mientras se cargan vértices nuevos.
+"""
+from array import array
+
+
+def new_union_find(num_elements=0):
+    """
+    Crea una estructura con num_elements elementos, cada uno en su
+    propio conjunto
+
+    Returns:
+        Un diccionario con los campos:
+            - parent: padre de cada elemento (la raíz es su propio padre)
+            - rank: cota superior de la altura del árbol de cada raíz
+            - count: número de conjuntos
+    """
+    return {
+        'parent': array('q', range(num_elements)),
+        'rank': array('b', [0]) * num_elements,
+        'count': num_elements
+    }
+
+
+def size(uf):
+    """
+    Retorna el número de elementos
+    """
+    return len(uf['parent'])
+
+
+def count(uf):
+    """
+    Retorna el número de conjuntos disjuntos
+    """
+    return uf['count']
+
+
+def add(uf):
+    """
+    Agrega un elemento nuevo en su propio conjunto
+
+    Returns:
+        El elemento agregado (el siguiente entero libre)
+    """
+    element = len(uf['parent'])
+    uf['parent'].append(element)
+    uf['rank'].append(0)
+    uf['count'] += 1
+    return element
+
+
+def grow(uf, num_elements):
+    """
+    Agrega elementos hasta que la estructura tenga num_elements
+    """
+    while len(uf['parent']) < num_elements:
+        add(uf)
+
+
+def find(uf, element):
+    """
+    Retorna la raíz del conjunto de element, comprimiendo el camino
+    recorrido (cada nodo del camino queda apuntando a la raíz)
+    """
+    parent = uf['parent']
+    root = element
+    while parent[root] != root:
+        root = parent[root]
+    while parent[element] != root:
+        parent[element], element = root, parent[element]
+    return root
+
+
+def union(uf, element1, element2):
+    """
+    Une los conjuntos de element1 y element2
+
+    Returns:
+        True si los conjuntos eran distintos, False si ya estaban unidos
+    """
+    root1 = find(uf, element1)
+    root2 = find(uf, element2)
+    if root1 == root2:
+        return False
+    rank = uf['rank']
+    if rank[root1] < rank[root2]:
+        root1, root2 = root2, root1
+    uf['parent'][root2] = root1
+    if rank[root1] == rank[root2]:
+        rank[root1] += 1
+    uf['count'] -= 1
+    return True
+
+
+def connected(uf, element1, element2):
+    """
+    Indica si element1 y element2 están en el mismo conjunto
+    """
+    return find(uf, element1) == find(uf, element2)
+
+
+def labels(uf):
+    """
+    Retorna un arreglo con la etiqueta de conjunto de cada elemento. Las
+    etiquetas son 0..count-1, numeradas en orden de primera aparición
+    """
+    label_of_root = {}
+    result = array('q', [0]) * size(uf)
+    for element in range(size(uf)):
+        root = find(uf, element)
+        label = label_of_root.get(root)
+        if label is None:
+            label = len(label_of_root)
+            label_of_root[root] = label
+        result[element] = label
+    return result
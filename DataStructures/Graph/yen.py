@@ -0,0 +1,199 @@
+"""
+Los k caminos más cortos sin ciclos entre dos vértices (algoritmo de Yen).
+
+Cada camino nuevo se obtiene desviándose de un camino ya aceptado: para
+cada vértice "spur" del camino, se fija la raíz (el prefijo hasta el
+spur), se prohíben los arcos que toman los caminos aceptados con esa
+misma raíz y los vértices de la raíz, y se busca el camino más corto del
+spur al destino. Los candidatos esperan en una cola de prioridad.
+
+Optimizaciones respecto a la versión básica:
+
+- Árbol de caminos más cortos hacia el destino, calculado una sola vez
+  sobre los arcos de entrada. Sus distancias son la heurística de la
+  búsqueda A* desde cada spur (prohibir arcos solo alarga las distancias,
+  así que son cotas inferiores), y la búsqueda termina en cuanto extrae
+  un vértice cuyo camino en el árbol no toca nada prohibido.
+- Las raíces se guardan en un diccionario prefijo -> siguientes vértices
+  prohibidos, que se actualiza al aceptar cada camino, en lugar de
+  comparar la raíz con todos los caminos aceptados.
+- Modificación de Lawler: un camino que se desvió de su padre en la
+  posición d solo genera spurs desde d en adelante; los anteriores
+  repetirían búsquedas ya hechas.
+
+Trabaja sobre grafos con vértices 0..n-1 y con índice inverso (ver
+Graph.iter_predecessor_edges).
+"""
+import heapq
+import itertools
+import math
+
+from DataStructures.List import array_list as lt
+from DataStructures.Priority_queue import priority_queue as pq
+
+
+def k_shortest_paths(graph, source, target, k):
+    """
+    Calcula los k caminos más cortos sin ciclos de source a target
+
+    Args:
+        graph: El grafo dirigido, con vértices 0..n-1
+        source: El vértice origen
+        target: El vértice destino
+        k: Número de caminos
+    Returns:
+        Un diccionario con los campos:
+            - paths: lista (array_list) de a lo más k caminos en orden de
+              distancia; cada uno con los campos distance y path (array_list
+              con los vértices)
+            - spur_searches: número de búsquedas A* realizadas
+            - tree_reuses: número de búsquedas que terminaron uniéndose
+              al árbol antes de llegar a target
+    """
+    result = {'paths': lt.new_list(), 'spur_searches': 0, 'tree_reuses': 0}
+    dist_to_target, next_hop = _reverse_tree(graph, target)
+    if k <= 0 or dist_to_target[source] == math.inf:
+        return result
+
+    accepted = []
+    blocked = {}
+    seen = set()
+    candidates = pq.new_heap()
+    tie_breaker = itertools.count()
+
+    first = _tree_path(next_hop, source, target)
+    seen.add(tuple(first))
+    pq.insert(candidates, (dist_to_target[source], next(tie_breaker), first, 0), None)
+
+    while len(accepted) < k and not pq.is_empty(candidates):
+        distance, _, path, deviation = pq.remove(candidates)
+        accepted.append(path)
+        _block(blocked, path)
+        entry = {'distance': distance, 'path': lt.new_list()}
+        for vertex in path:
+            lt.add_last(entry['path'], vertex)
+        lt.add_last(result['paths'], entry)
+        if len(accepted) == k:
+            break
+
+        root_cost = 0.0
+        for i in range(len(path) - 1):
+            if i >= deviation:
+                spur = _spur_path(graph, result, dist_to_target, next_hop, path[i], target,
+                                  set(path[:i]), blocked[tuple(path[:i + 1])])
+                if spur is not None:
+                    spur_path, spur_cost = spur
+                    candidate = path[:i] + spur_path
+                    key = tuple(candidate)
+                    if key not in seen:
+                        seen.add(key)
+                        pq.insert(candidates, (root_cost + spur_cost, next(tie_breaker),
+                                               candidate, i), None)
+            root_cost += graph.get_edge_weight(path[i], path[i + 1])
+    return result
+
+
+#  ---------------------------------------------------------
+#   Funciones Helper
+#  ---------------------------------------------------------
+
+
+def _reverse_tree(graph, target):
+    """
+    Dijkstra desde target sobre los arcos de entrada. Retorna la
+    distancia de cada vértice a target y el siguiente vértice del camino
+    """
+    n = graph.num_vertices
+    dist = [math.inf] * n
+    next_hop = [-1] * n
+    dist[target] = 0.0
+    heap = [(0.0, target)]
+    while heap:
+        base, vertex = heapq.heappop(heap)
+        if base > dist[vertex]:
+            continue
+        for predecessor, weight in graph.iter_predecessor_edges(vertex):
+            candidate = base + weight
+            if candidate < dist[predecessor]:
+                dist[predecessor] = candidate
+                next_hop[predecessor] = vertex
+                heapq.heappush(heap, (candidate, predecessor))
+    return dist, next_hop
+
+
+def _tree_path(next_hop, vertex, target):
+    """
+    Camino de vertex a target siguiendo el árbol
+    """
+    path = [vertex]
+    while vertex != target:
+        vertex = next_hop[vertex]
+        path.append(vertex)
+    return path
+
+
+def _block(blocked, path):
+    """
+    Registra, para cada prefijo de path, el vértice que lo sigue
+    """
+    for i in range(len(path) - 1):
+        blocked.setdefault(tuple(path[:i + 1]), set()).add(path[i + 1])
+
+
+def _spur_path(graph, result, dist_to_target, next_hop, spur, target,
+               banned_vertices, banned_next):
+    """
+    Camino más corto de spur a target sin pasar por banned_vertices ni
+    tomar desde spur los arcos hacia banned_next, con A*. La búsqueda
+    termina en el primer vértice extraído cuyo camino en el árbol hasta
+    target está libre: su costo es exactamente su prioridad, que es mínima.
+    Retorna (camino, costo) o None
+    """
+    if dist_to_target[spur] == math.inf:
+        return None
+    result['spur_searches'] += 1
+    dist = {spur: 0.0}
+    parent = {}
+    heap = [(dist_to_target[spur], 0.0, spur)]
+    while heap:
+        _, base, vertex = heapq.heappop(heap)
+        if base > dist[vertex]:
+            continue
+        suffix = _free_tree_path(next_hop, vertex, target, spur, banned_vertices, banned_next)
+        if suffix is not None:
+            if len(suffix) > 1:
+                result['tree_reuses'] += 1
+            path = []
+            while vertex != spur:
+                vertex = parent[vertex]
+                path.append(vertex)
+            path.reverse()
+            return path + suffix, base + dist_to_target[suffix[0]]
+        for adjacent, weight in graph.iter_adjacent_edges(vertex):
+            if adjacent in banned_vertices or dist_to_target[adjacent] == math.inf:
+                continue
+            if vertex == spur and adjacent in banned_next:
+                continue
+            candidate = base + weight
+            if candidate < dist.get(adjacent, math.inf):
+                dist[adjacent] = candidate
+                parent[adjacent] = vertex
+                heapq.heappush(heap, (candidate + dist_to_target[adjacent], candidate, adjacent))
+    return None
+
+
+def _free_tree_path(next_hop, vertex, target, spur, banned_vertices, banned_next):
+    """
+    Retorna el camino en el árbol de vertex a target si no pasa por
+    vértices prohibidos ni vuelve a spur (ni toma un arco prohibido si
+    vertex es spur); None en otro caso
+    """
+    if vertex == spur and next_hop[vertex] in banned_next:
+        return None
+    path = [vertex]
+    while vertex != target:
+        vertex = next_hop[vertex]
+        if vertex == spur or vertex in banned_vertices:
+            return None
+        path.append(vertex)
+    return path
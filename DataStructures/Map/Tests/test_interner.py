@@ -0,0 +1,46 @@
+from DataStructures.Map import interner as it
+
+
+def setup_tests():
+    empty_table = it.new_interner()
+
+    some_table = it.new_interner()
+    for code in ("83139", "83059", "83099"):
+        it.intern(some_table, code)
+
+    return empty_table, some_table
+
+
+def test_intern():
+    empty_table, some_table = setup_tests()
+
+    assert it.intern(empty_table, "A") == 0
+    assert it.intern(empty_table, "B") == 1
+    assert it.intern(empty_table, "A") == 0
+    assert it.size(empty_table) == 2
+
+    assert it.intern(some_table, "83099") == 2
+    assert it.intern(some_table, "01012") == 3
+    assert it.size(some_table) == 4
+
+
+def test_translation():
+    empty_table, some_table = setup_tests()
+
+    assert it.id_of(some_table, "83059") == 1
+    assert it.id_of(some_table, "00000") is None
+    assert it.id_of(empty_table, "83059") is None
+    assert it.code_of(some_table, 0) == "83139"
+    for code in ("83139", "83059", "83099"):
+        assert it.code_of(some_table, it.id_of(some_table, code)) == code
+
+    assert it.contains(some_table, "83099")
+    assert not it.contains(some_table, "00000")
+
+
+def test_ids_of():
+    empty_table, some_table = setup_tests()
+
+    assert it.ids_of(some_table, ["83099", "83139", "00000", None]) == [2, 0, None, None]
+    assert it.ids_of(some_table, iter(["83059"])) == [1]
+    assert it.ids_of(empty_table, []) == []
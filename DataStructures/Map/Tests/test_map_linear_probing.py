@@ -0,0 +1,65 @@
+from DataStructures.Map import map_linear_probing as m
+
+
+def setup_tests():
+    empty_map = m.new_map(4, 0.5)
+
+    some_map = m.new_map(4, 0.5)
+    for key in range(3):
+        some_map = m.put(some_map, key, f"value {key}")
+
+    return empty_map, some_map
+
+
+def test_put_all():
+    empty_map, some_map = setup_tests()
+
+    empty_map = m.put_all(empty_map, [(key, key * 10) for key in range(50)])
+    assert m.size(empty_map) == 50
+    assert m.get(empty_map, 49) == 490
+    assert empty_map['current_factor'] <= empty_map['limit_factor']
+
+    some_map = m.put_all(some_map, [(2, "new value"), (3, "value 3")])
+    assert m.size(some_map) == 4
+    assert m.get(some_map, 0) == "value 0"
+    assert m.get(some_map, 2) == "new value"
+    assert m.contains(some_map, 3)
+
+
+def test_put_all_epoch():
+    _, some_map = setup_tests()
+    epoch = m.epoch(some_map)
+    some_map = m.put_all(some_map, [(key, key) for key in range(3, 40)])
+    assert m.epoch(some_map) == epoch + 37
+    some_map = m.put_all(some_map, [])
+    assert m.epoch(some_map) == epoch + 37
+
+
+def test_put_all_geometric_growth():
+    empty_map, _ = setup_tests()
+    capacities = []
+    for chunk in range(100):
+        entries = [(chunk * 10 + key, key) for key in range(10)]
+        empty_map = m.put_all(empty_map, entries)
+        if not capacities or capacities[-1] != empty_map['capacity']:
+            capacities.append(empty_map['capacity'])
+
+    assert m.size(empty_map) == 1000
+    assert m.get(empty_map, 999) == 9
+    assert len(capacities) <= 10
+    for smaller, larger in zip(capacities, capacities[1:]):
+        assert larger >= 2 * smaller
+
+
+def test_entries_from_entries():
+    empty_map, some_map = setup_tests()
+    some_map = m.remove(some_map, 1)
+    assert sorted(m.entries(some_map)) == [(0, "value 0"), (2, "value 2")]
+    assert m.entries(empty_map) == []
+
+    restored = m.from_entries(m.entries(some_map), 0.5, m.epoch(some_map))
+    assert m.size(restored) == 2
+    assert m.get(restored, 2) == "value 2"
+    assert not m.contains(restored, 1)
+    assert m.epoch(restored) == m.epoch(some_map)
+    assert m.size(m.from_entries([], 0.5)) == 0
@@ -0,0 +1,104 @@
+"""
+  Tabla de internamiento: asigna a cada código (por ejemplo, el código de
+  una parada) un identificador entero denso 0, 1, 2, ... en orden de
+  aparición, y permite traducir en ambos sentidos.
+
+  Con identificadores densos las estructuras que indexan por vértice
+  pueden usar arreglos planos en lugar de diccionarios.
+"""
+
+
+def new_interner():
+    """ Crea una tabla de internamiento vacía
+
+        :return: La tabla, con el diccionario ``ids`` (código -> id) y la
+                 lista ``codes`` (id -> código)
+        :rtype: interner
+    """
+    return {'ids': {}, 'codes': []}
+
+
+def intern(table, code):
+    """ Retorna el id de un código, asignándole el siguiente id libre
+        si aún no lo tiene
+
+        :param table: La tabla de internamiento
+        :type table: interner
+        :param code: El código
+        :type code: any
+
+        :return: El id del código
+        :rtype: int
+    """
+    ids = table['ids']
+    code_id = ids.get(code)
+    if code_id is None:
+        code_id = len(table['codes'])
+        ids[code] = code_id
+        table['codes'].append(code)
+    return code_id
+
+
+def id_of(table, code):
+    """ Retorna el id de un código, o None si no ha sido internado
+
+        :param table: La tabla de internamiento
+        :type table: interner
+        :param code: El código
+        :type code: any
+
+        :rtype: int
+    """
+    return table['ids'].get(code)
+
+
+def ids_of(table, codes):
+    """ Retorna la lista de ids de una secuencia de códigos, con None en
+        lugar de los códigos que no han sido internados (y de los None)
+
+        :param table: La tabla de internamiento
+        :type table: interner
+        :param codes: Los códigos
+        :type codes: iterable
+
+        :rtype: list
+    """
+    ids = table['ids']
+    return [ids.get(code) for code in codes]
+
+
+def code_of(table, code_id):
+    """ Retorna el código asociado a un id
+
+        :param table: La tabla de internamiento
+        :type table: interner
+        :param code_id: El id
+        :type code_id: int
+
+        :rtype: any
+    """
+    return table['codes'][code_id]
+
+
+def contains(table, code):
+    """ Indica si un código ya fue internado
+
+        :param table: La tabla de internamiento
+        :type table: interner
+        :param code: El código
+        :type code: any
+
+        :rtype: bool
+    """
+    return code in table['ids']
+
+
+def size(table):
+    """ Retorna el número de códigos internados
+
+        :param table: La tabla de internamiento
+        :type table: interner
+
+        :rtype: int
+    """
+    return len(table['codes'])
@@ -18,7 +18,8 @@ def new_map(num_elements, load_factor, prime=109345121):
         'table': table,
         'current_factor': 0,
         'limit_factor': load_factor,
-        'size': 0
+        'size': 0,
+        'epoch': 0
     }
 
 def put(my_map, key, value):
@@ -34,12 +35,36 @@ def put(my_map, key, value):
         lt.change_info(my_map['table'], pos, new_entry)
         my_map['size'] += 1
         my_map['current_factor'] = my_map['size'] / my_map['capacity']
+    my_map['epoch'] += 1
 
     if my_map['current_factor'] > my_map['limit_factor']:
         my_map = rehash(my_map)
 
     return my_map
 
+def put_all(my_map, entries):
+    """ Inserta en bloque una secuencia de parejas llave-valor
+
+        La tabla se redimensiona una sola vez antes de insertar, de modo que
+        la carga masiva no dispara varios rehash intermedios. Como en rehash,
+        la capacidad al menos se duplica, para que una serie de cargas en
+        bloque no copie la tabla completa en cada una.
+
+        :param my_map: El mapa
+        :type my_map: map_linear_probing
+        :param entries: Parejas ``(key, value)`` a insertar
+        :type entries: list
+
+        :return: El mapa (puede ser una tabla nueva si hubo redimensionamiento)
+        :rtype: map_linear_probing
+    """
+    needed = my_map['size'] + len(entries)
+    if needed / my_map['capacity'] > my_map['limit_factor']:
+        my_map = resize(my_map, max(needed, 2 * my_map['capacity']))
+    for key, value in entries:
+        my_map = put(my_map, key, value)
+    return my_map
+
 def find_slot(my_map, key, hash_value):
     first_avail = None
     found = False
@@ -101,6 +126,7 @@ def remove(my_map, key):
         lt.change_info(my_map['table'], pos, __EMPTY__)
         my_map['size'] -= 1
         my_map['current_factor'] = my_map['size'] / my_map['capacity']
+        my_map['epoch'] += 1
     return my_map
 
 def get(my_map, key):
@@ -113,6 +139,22 @@ def get(my_map, key):
 def size(my_map):
     return my_map['size']
 
+def epoch(my_map):
+    """ Retorna la época de mutación del mapa
+
+        La época aumenta con cada put y con cada remove efectivo, y se
+        conserva al redimensionar la tabla, así que una estructura derivada
+        del mapa está al día si guarda la época con la que se construyó y
+        esta no ha cambiado.
+
+        :param my_map: El mapa
+        :type my_map: map_linear_probing
+
+        :return: La época actual
+        :rtype: int
+    """
+    return my_map['epoch']
+
 def is_empty(my_map):
     return my_map['size'] == 0
 
@@ -132,6 +174,53 @@ def value_set(my_map):
             lt.add_last(values, me.get_value(entry))
     return values
 
+def entries(my_map):
+    """ Retorna las parejas llave-valor del mapa, en el orden de la tabla
+
+        Las parejas no dependen de la posición de cada llave en la tabla
+        (que se calcula con ``hash`` y puede cambiar de un proceso a otro),
+        así que sirven para guardar el mapa y reconstruirlo con
+        ``from_entries``.
+
+        :param my_map: El mapa
+        :type my_map: map_linear_probing
+
+        :return: Lista de parejas ``(key, value)``
+        :rtype: list
+    """
+    pairs = []
+    for i in range(my_map['capacity']):
+        entry = lt.get_element(my_map['table'], i)
+        if me.get_key(entry) not in [None, "__EMPTY__"]:
+            pairs.append((me.get_key(entry), me.get_value(entry)))
+    return pairs
+
+def from_entries(pairs, load_factor, epoch=0):
+    """ Crea un mapa con las parejas llave-valor dadas
+
+        :param pairs: Parejas ``(key, value)``, por ejemplo las de ``entries``
+        :type pairs: list
+        :param load_factor: Factor de carga máximo del mapa
+        :type load_factor: float
+        :param epoch: Época de mutación con la que queda el mapa
+        :type epoch: int
+
+        :return: El mapa
+        :rtype: map_linear_probing
+    """
+    my_map = put_all(new_map(max(1, len(pairs)), load_factor), pairs)
+    my_map['epoch'] = epoch
+    return my_map
+
+def resize(my_map, num_elements):
+    new_table = new_map(num_elements, my_map['limit_factor'], my_map['prime'])
+    for i in range(my_map['capacity']):
+        entry = lt.get_element(my_map['table'], i)
+        if me.get_key(entry) not in [None, "__EMPTY__"]:
+            new_table = put(new_table, me.get_key(entry), me.get_value(entry))
+    new_table['epoch'] = my_map['epoch']
+    return new_table
+
 def rehash(my_map):
     new_capacity = mf.next_prime(2 * my_map['capacity'])
     new_table = new_map(new_capacity, my_map['limit_factor'], my_map['prime'])
@@ -139,4 +228,5 @@ def rehash(my_map):
         entry = lt.get_element(my_map['table'], i)
         if me.get_key(entry) not in [None, "__EMPTY__"]:
             new_table = put(new_table, me.get_key(entry), me.get_value(entry))
+    new_table['epoch'] = my_map['epoch']
     return new_table
@@ -0,0 +1,34 @@
+import random
+
+from DataStructures.Priority_queue import heap as h
+
+
+def compare(element1, element2):
+    if element1 > element2:
+        return 1
+    if element1 < element2:
+        return -1
+    return 0
+
+
+def test_insert_del_min():
+    heap = h.new_heap(compare)
+    assert h.is_empty(heap)
+    assert h.min(heap) is None
+    assert h.del_min(heap) is None
+    for element in (5, 3, 8, 1):
+        h.insert(heap, element)
+    assert h.size(heap) == 4
+    assert h.min(heap) == 1
+    assert [h.del_min(heap) for _ in range(4)] == [1, 3, 5, 8]
+    assert h.is_empty(heap)
+
+
+def test_arity():
+    rnd = random.Random(2)
+    for arity in (2, 3, 4, 8):
+        heap = h.new_heap(compare, arity)
+        elements = [rnd.randrange(1000) for _ in range(200)]
+        for element in elements:
+            h.insert(heap, element)
+        assert [h.del_min(heap) for _ in range(200)] == sorted(elements)
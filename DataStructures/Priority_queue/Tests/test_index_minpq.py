@@ -0,0 +1,90 @@
+import random
+
+import pytest
+
+from DataStructures.Priority_queue import indexminpq as iminpq
+
+
+def setup_tests():
+    empty_pq = iminpq.new_index_minpq()
+
+    some_pq = iminpq.new_index_minpq()
+    for key, priority in ((0, 5.0), (1, 3.0), (2, 8.0), (3, 1.0), (4, 6.0)):
+        iminpq.insert(some_pq, key, priority)
+
+    return empty_pq, some_pq
+
+
+def test_insert():
+    empty_pq, some_pq = setup_tests()
+
+    iminpq.insert(empty_pq, 7, 2.0)
+    assert iminpq.size(empty_pq) == 1
+    assert iminpq.contains(empty_pq, 7)
+    assert iminpq.min(empty_pq) == 7
+
+    iminpq.insert(some_pq, 3, 100.0)
+    assert iminpq.size(some_pq) == 5
+
+
+def test_is_empty():
+    empty_pq, some_pq = setup_tests()
+    assert iminpq.is_empty(empty_pq)
+    assert not iminpq.is_empty(some_pq)
+
+
+def test_del_min():
+    empty_pq, some_pq = setup_tests()
+
+    assert iminpq.del_min(empty_pq) is None
+    assert [iminpq.del_min(some_pq) for _ in range(5)] == [3, 1, 0, 4, 2]
+    assert iminpq.is_empty(some_pq)
+    assert not iminpq.contains(some_pq, 3)
+
+
+def test_decrease_increase_key():
+    _, some_pq = setup_tests()
+
+    iminpq.decrease_key(some_pq, 2, 0.5)
+    assert iminpq.min(some_pq) == 2
+    iminpq.increase_key(some_pq, 2, 9.0)
+    assert iminpq.min(some_pq) == 3
+    assert [iminpq.del_min(some_pq) for _ in range(5)] == [3, 1, 0, 4, 2]
+
+
+def test_random_operations():
+    rnd = random.Random(5)
+    pq = iminpq.new_index_minpq()
+    priorities = {}
+    for key in range(200):
+        priorities[key] = rnd.random()
+        iminpq.insert(pq, key, priorities[key])
+    for key in rnd.sample(range(200), 80):
+        priorities[key] /= 2
+        iminpq.decrease_key(pq, key, priorities[key])
+
+    order = [iminpq.del_min(pq) for _ in range(200)]
+    assert order == sorted(priorities, key=priorities.get)
+
+
+def test_priorities_and_capacity():
+    pq = iminpq.new_index_minpq(size=2)
+    iminpq.insert(pq, 50, 4.0)
+    iminpq.insert(pq, 7, 2.5)
+    assert iminpq.contains(pq, 50) and not iminpq.contains(pq, 49)
+    assert not iminpq.contains(pq, 1000)
+    assert iminpq.min_priority(pq) == 2.5
+    assert iminpq.priority_of(pq, 50) == 4.0
+    assert iminpq.priority_of(pq, 3) is None
+    with pytest.raises(KeyError):
+        iminpq.decrease_key(pq, 3, 1.0)
+
+
+def test_clear():
+    _, some_pq = setup_tests()
+    iminpq.clear(some_pq)
+    assert iminpq.is_empty(some_pq)
+    assert not iminpq.contains(some_pq, 3)
+    iminpq.insert(some_pq, 3, 2.0)
+    iminpq.insert(some_pq, 0, 1.0)
+    assert [iminpq.del_min(some_pq) for _ in range(2)] == [0, 3]
@@ -1,3 +1,7 @@
+import random
+
+import pytest
+
 from DataStructures.Priority_queue import priority_queue as pq
 from DataStructures.List import arraylist as lt
 from DataStructures.Utils.utils import handle_not_implemented
@@ -91,3 +95,111 @@ def test_remove():
     assert some_heap["size"] is not None
     assert some_heap["elements"] is not None
     assert some_heap["cmp_function"] is not None
+
+
+def test_remove_then_insert():
+    heap = pq.new_heap()
+    for key in (5, 3, 8):
+        pq.insert(heap, key, key)
+    assert pq.remove(heap) == 3
+    assert lt.size(heap["elements"]) == heap["size"]
+
+    pq.insert(heap, 1, 1)
+    pq.insert(heap, 6, 6)
+    assert [pq.remove(heap) for _ in range(4)] == [1, 5, 6, 8]
+    assert pq.is_empty(heap)
+
+
+def test_build_heap():
+    rnd = random.Random(3)
+    keys = [rnd.randrange(1000) for _ in range(300)]
+    heap = pq.build_heap((key, str(key)) for key in keys)
+    assert pq.size(heap) == 300
+    assert pq.remove_value(heap) == str(min(keys))
+    assert [pq.remove(heap) for _ in range(299)] == sorted(keys)[1:]
+
+    assert pq.is_empty(pq.build_heap([]))
+
+
+def test_insert_all_rebuild():
+    heap = pq.new_heap()
+    pq.insert_all(heap, [(key, key) for key in (9, 4, 7)])
+    pq.insert_all(heap, [(key, key) for key in (8, 1, 6, 2)])
+    pq.insert_all(heap, [(3, 3)])
+    assert [pq.remove(heap) for _ in range(8)] == [1, 2, 3, 4, 6, 7, 8, 9]
+
+
+def test_key_heap():
+    heap = pq.new_key_heap(lambda key: key["distance"])
+    for distance in (5.0, 1.5, 3.0, 1.5):
+        pq.insert(heap, {"distance": distance}, distance * 10)
+    assert pq.size(heap) == 4
+    assert pq.get_first_priority(heap) == {"distance": 1.5}
+
+    copy = pq.copy(heap)
+    assert [pq.remove_value(heap) for _ in range(4)] == [15.0, 15.0, 30.0, 50.0]
+    assert pq.remove(heap) is None
+    assert pq.remove(copy) == {"distance": 1.5}
+    assert pq.size(copy) == 3
+
+
+def test_key_heap_bulk():
+    rnd = random.Random(4)
+    keys = [rnd.randrange(1000) for _ in range(200)]
+    heap = pq.build_heap(((key, key) for key in keys[:150]), key_function=lambda key: -key)
+    pq.insert_all(heap, [(key, key) for key in keys[150:]])
+    pq.insert_all(heap, [(key, key) for key in range(1000, 1500)])
+    assert [pq.remove(heap) for _ in range(700)] == sorted(keys + list(range(1000, 1500)), reverse=True)
+
+    natural = pq.new_key_heap()
+    pq.insert_all(natural, [((2, "b"), None), ((1, "z"), None), ((2, "a"), None)])
+    assert [pq.remove(natural) for _ in range(3)] == [(1, "z"), (2, "a"), (2, "b")]
+
+
+def test_merge():
+    entries = [(key % 4, index) for index, key in enumerate(random.Random(6).sample(range(100), 40))]
+    expected = [value for _, value in sorted(entries, key=lambda entry: entry[0])]
+
+    parts = [pq.build_heap(entries[:15], key_function=abs),
+             pq.build_heap(entries[15:30], key_function=abs, first_sequence=15),
+             pq.build_heap(entries[30:], key_function=abs, first_sequence=30)]
+    heap = pq.new_key_heap(abs)
+    pq.merge(heap, parts)
+    assert pq.size(heap) == 40
+    assert [pq.remove_value(heap) for _ in range(40)] == expected
+
+    heap = pq.new_key_heap(abs)
+    pq.insert(heap, 2, "first")
+    pq.merge(heap, [pq.build_heap([(2, "second"), (1, "min")], key_function=abs)])
+    pq.insert(heap, 2, "third")
+    assert [pq.remove_value(heap) for _ in range(4)] == ["min", "first", "second", "third"]
+
+    heap = pq.build_heap([(5, 5), (1, 1)])
+    pq.merge(heap, [pq.build_heap([(3, 3), (0, 0)]), pq.new_heap()])
+    assert [pq.remove(heap) for _ in range(4)] == [0, 1, 3, 5]
+
+
+def test_arity():
+    rnd = random.Random(8)
+    for arity in (2, 3, 4, 8):
+        for heap in (pq.new_heap(arity=arity), pq.new_key_heap(arity=arity)):
+            expected = []
+            for _ in range(300):
+                if expected and rnd.random() < 0.3:
+                    expected.sort()
+                    assert pq.remove(heap) == expected.pop(0)
+                else:
+                    key = rnd.randrange(100)
+                    expected.append(key)
+                    pq.insert(heap, key, None)
+            copy = pq.copy(heap)
+            assert copy["arity"] == arity
+            assert [pq.remove(copy) for _ in range(pq.size(copy))] == sorted(expected)
+
+        keys = [rnd.randrange(100) for _ in range(50)]
+        for heap in (pq.build_heap(((key, key) for key in keys), arity=arity),
+                     pq.build_heap(((key, key) for key in keys), key_function=abs, arity=arity)):
+            assert [pq.remove(heap) for _ in range(50)] == sorted(keys)
+
+    with pytest.raises(ValueError):
+        pq.new_heap(arity=1)
@@ -25,12 +25,18 @@
  """
 
 import DataStructures.Utils.config as config
-from DataStructures.List import list as lt
+from DataStructures.List import array_list as lt
 from DataStructures.Utils import error as error
 assert config
 
 """
-Implementación de un heap basado en arreglo.
+Implementación de un heap d-ario basado en arreglo.
+
+Las posiciones del heap empiezan en 1: la posición 0 del arreglo no se
+usa. Con aridad d, los hijos de la posición p son d*(p-1)+2 .. d*p+1 y su
+padre es (p-2)//d + 1; con d = 2 son las posiciones 2p y 2p+1 de siempre.
+Un heap de mayor aridad es menos profundo: swim (inserción) compara con
+menos ancestros, y sink (extracción) compara más hijos por nivel.
 
 Este código está basados en la implementación
 propuesta por R.Sedgewick y Kevin Wayne en su libro
@@ -38,26 +44,30 @@ Algorithms, 4th Edition
 """
 
 
-def new_heap(cmpfunction):
+def new_heap(cmpfunction, arity=2):
     """
     Crea un nuevo heap basado en un arreglo, cuyo primer elemento
     es inicializado en None y no será utilizado
 
     Args:
         cmpfunction: La funcion de comparacion
-        size: El numero de elementos
+        arity: Número de hijos de cada nodo (2 o más)
     Returns:
        El heap
     Raises:
         Exception
     """
     try:
+        if arity < 2:
+            raise ValueError(f"La aridad debe ser al menos 2: {arity}")
         heap = {'elements': None,
                 'size': 0,
-                'cmpfunction': cmpfunction
+                'cmpfunction': cmpfunction,
+                'arity': arity
                 }
 
-        heap['elements'] = lt.new_list(datastructure='ARRAY_LIST', cmpfunction=cmpfunction)
+        heap['elements'] = lt.new_list(cmpfunction)
+        lt.add_last(heap['elements'], None)
 
         return heap
     except Exception as exp:
@@ -111,21 +121,31 @@ def min(heap):
     """
     try:
         if (heap['size'] > 0):
-            return lt.getElement(heap['elements'], 1)
+            return lt.get_element(heap['elements'], 1)
         return None
     except Exception as exp:
         error.reraise(exp, 'heap:min')
 
 
 def insert(heap, element):
-    if heap["elements"] is None:
-        heap["elements"] = lt.new_list(datastructure="ARRAY_LIST", cmpfunction=heap["cmpfunction"])
-    
-    heap['size'] += 1
-    lt.insert_element(heap['elements'], element, heap['size'])
-    swim(heap, heap['size'])
-    return heap
+    """
+    Agrega un elemento al heap
 
+    Args:
+        heap: El arreglo con la informacion
+        element: El elemento a agregar
+    Returns:
+        El heap
+    Raises:
+        Exception
+    """
+    try:
+        heap['size'] += 1
+        lt.add_last(heap['elements'], element)
+        swim(heap, heap['size'])
+        return heap
+    except Exception as exp:
+        error.reraise(exp, 'heap:insert')
 
 
 def del_min(heap):
@@ -143,12 +163,12 @@ def del_min(heap):
     """
     try:
         if (heap['size'] > 0):
-            min = lt.getElement(heap['elements'], 1)
-            last = lt.getElement(heap['elements'], heap['size'])
-            lt.changeInfo(heap['elements'], 1, last)
-            lt.changeInfo(heap['elements'], heap['size'], None)
+            min = lt.get_element(heap['elements'], 1)
+            last = lt.remove_last(heap['elements'])
             heap['size'] -= 1
-            sink(heap, 1)
+            if heap['size'] > 0:
+                lt.change_info(heap['elements'], 1, last)
+                sink(heap, 1)
             return min
         return None
     except Exception as exp:
@@ -175,12 +195,15 @@ def swim(heap, pos):
         Exception
     """
     try:
+        arity = heap['arity']
         while (pos > 1):
-            parent = lt.getElement(heap['elements'], int((pos/2)))
-            element = lt.getElement(heap['elements'], int(pos))
-            if greater(heap, parent, element):
-                exchange(heap, pos, int(pos/2))
-            pos = pos//2
+            parent_pos = (pos - 2) // arity + 1
+            parent = lt.get_element(heap['elements'], parent_pos)
+            element = lt.get_element(heap['elements'], pos)
+            if not greater(heap, parent, element):
+                break
+            exchange(heap, pos, parent_pos)
+            pos = parent_pos
     except Exception as exp:
         error.reraise(exp, 'heap:swim')
 
@@ -200,17 +223,37 @@ def sink(heap, pos):
     """
     try:
         size = heap['size']
-        while ((2*pos <= size)):
-            j = 2*pos
-            if (j < size):
-                if greater(heap, lt.getElement(heap['elements'], j),
-                           lt.getElement(heap['elements'], (j+1))):
-                    j += 1
-            if (not greater(heap, lt.getElement(heap['elements'], pos),
-                            lt.getElement(heap['elements'], j))):
+        arity = heap['arity']
+        if arity == 2:
+            while (2*pos <= size):
+                j = 2*pos
+                if (j < size):
+                    if greater(heap, lt.get_element(heap['elements'], j),
+                               lt.get_element(heap['elements'], (j+1))):
+                        j += 1
+                if (not greater(heap, lt.get_element(heap['elements'], pos),
+                                lt.get_element(heap['elements'], j))):
+                    break
+                exchange(heap, pos, j)
+                pos = j
+            return
+        first = arity * (pos - 1) + 2
+        while first <= size:
+            # Menor de los hijos first .. last
+            last = first + arity - 1
+            if last > size:
+                last = size
+            j = first
+            for child in range(first + 1, last + 1):
+                if greater(heap, lt.get_element(heap['elements'], j),
+                           lt.get_element(heap['elements'], child)):
+                    j = child
+            if (not greater(heap, lt.get_element(heap['elements'], pos),
+                            lt.get_element(heap['elements'], j))):
                 break
             exchange(heap, pos, j)
             pos = j
+            first = arity * (pos - 1) + 2
     except Exception as exp:
         error.reraise(exp, 'heap:sink')
 
@@ -235,4 +278,4 @@ def exchange(heap, posa, posb):
     try:
         lt.exchange(heap['elements'], posa, posb)
     except Exception as exp:
-        error.reraise(exp, 'heap:exchange')
\ No newline at end of file
+        error.reraise(exp, 'heap:exchange')
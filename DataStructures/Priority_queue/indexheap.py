@@ -20,68 +20,80 @@
  * along with this program.  If not, see <http://www.gnu.org/licenses/>.
  """
 
-from DISClib.ADT import map as map
-from DISClib.ADT import list as lt
-from DISClib.Utils import error as error
+import math
+from array import array
+
+from DataStructures.Utils import error as error
 
 """
 Estructura que contiene la información de una cola de prioridad indexada,
-orientada a menor
+orientada a menor, cuyas llaves son enteros densos 0..n-1 (por ejemplo
+ids de parada) y cuyas prioridades son números.
+
+Se guarda en tres arreglos planos (array) paralelos:
+
+- heap: las llaves en orden de heap. Las posiciones del heap empiezan
+  en 1: la posición 0 no se usa.
+- qp: para cada llave, su posición en heap (-1 si no está en la cola).
+- priority: para cada llave, su prioridad.
+
+Así contains cuesta O(1) y insert, del_min, decrease_key e increase_key
+O(log n), sin diccionarios ni tablas de hash. Los arreglos crecen solos
+si llega una llave mayor que la capacidad.
 """
 
 
-def newIndexHeap(cmpfunction):
+def new_index_heap(cmpfunction=None, size=10):
     """
     Crea un cola de prioridad indexada orientada a menor
 
     Args:
-        cmpfunction: La funcion de comparacion
-        size: El numero de elementos
+        cmpfunction: No se usa: las prioridades se comparan directamente.
+            Se conserva por compatibilidad
+        size: El número de llaves esperado (las llaves van de 0 a size-1)
     Returns:
        Una nueva cola de prioridad indexada
     Raises:
         Exception
     """
     try:
-        indexheap = {'elements': None,
-                     'qpMap': None,
-                     'size': 0,
-                     'cmpfunction': cmpfunction}
-        indexheap['elements'] = lt.newList(datastructure='ARRAY_LIST',
-                                           cmpfunction=cmpfunction)
-        indexheap['qpMap'] = map.newMap(
-                                        maptype='PROBING',
-                                        cmpfunction=cmpfunction
-                                        )
-        return indexheap
+        size = max(size, 1)
+        return {'heap': array('q', [0]) * (size + 1),
+                'qp': array('q', [-1]) * size,
+                'priority': array('d', [math.inf]) * size,
+                'size': 0,
+                'cmpfunction': cmpfunction}
     except Exception as exp:
-        error.reraise(exp, 'indexheap:newindexheap')
+        error.reraise(exp, 'indexheap:new_index_heap')
 
 
 def insert(iheap, key, index):
     """
-    Inserta la llave key con prioridad index
+    Inserta la llave key con prioridad index. Si la llave ya está en el
+    heap no se modifica
 
     Args:
         iheap: El heap indexado
+        key: La llave, un entero no negativo
+        index: La prioridad de la llave
     Returns:
        El iheap con la nueva paraja indexada
     Raises:
         Exception
     """
     try:
-        if not map.contains(iheap['qpMap'], key):
+        if key >= len(iheap['qp']):
+            _ensure_capacity(iheap, key + 1)
+        if iheap['qp'][key] == -1:
             iheap['size'] += 1
-            lt.insertElement(iheap['elements'], {'key': key, 'index': index},
-                             iheap['size'])
-            map.put(iheap['qpMap'], key, iheap['size'])
-            swim(iheap, iheap['size'])
+            iheap['priority'][key] = index
+            _swim(iheap, iheap['size'], key)
         return iheap
     except Exception as exp:
-        error.reraise(exp, 'indexheap:newindexheap')
+        error.reraise(exp, 'indexheap:insert')
 
 
-def isEmpty(iheap):
+def is_empty(iheap):
     """
     Informa si una cola de prioridad indexada es vacia
 
@@ -95,7 +107,7 @@ def isEmpty(iheap):
     try:
         return iheap['size'] == 0
     except Exception as exp:
-        error.reraise(exp, 'indexheap:isEmpty')
+        error.reraise(exp, 'indexheap:is_empty')
 
 
 def size(iheap):
@@ -122,192 +134,217 @@ def contains(iheap, key):
     Args:
         iheap: El heap a revisar
     Returns:
-       El numero de elementos
+       True si la llave está en el heap
     Raises:
         Exception
     """
     try:
-        return map.contains(iheap['qpMap'], key)
+        qp = iheap['qp']
+        return 0 <= key < len(qp) and qp[key] != -1
     except Exception as exp:
         error.reraise(exp, 'indexheap:contains')
 
 
 def min(iheap):
     """
-    Retorna el primer elemento del heap, es decir el menor elemento
+    Retorna la llave con menor indice, sin eliminarla
 
     Args:
         iheap: El heap a revisar
     Returns:
-       El numero de elementos
+       La llave con menor indice
     Raises:
         Exception
     """
     try:
-        if(iheap['size'] > 0):
-            minIdx = lt.getElement(iheap['elements'], 1)
-            return minIdx['key']
+        if iheap['size'] > 0:
+            return iheap['heap'][1]
         return None
     except Exception as exp:
         error.reraise(exp, 'indexheap:min')
 
 
-def delMin(iheap):
+def min_priority(iheap):
     """
-    Retorna el menor elemento del heap y lo elimina.
-    Se reemplaza con el último elemento y se hace sink.
+    Retorna la prioridad de la llave con menor indice
 
     Args:
         iheap: El heap a revisar
     Returns:
-       La llave asociada al mayor indice
+       La menor prioridad, o None si el heap está vacío
     Raises:
         Exception
     """
     try:
-        if (iheap['size'] > 0):
-            minIdx = lt.getElement(iheap['elements'], 1)
-            exchange(iheap, 1, iheap['size'])
-            iheap['size'] -= 1
-            sink(iheap, 1)
-            map.remove(iheap['qpMap'], minIdx['key'])
-            return minIdx['key']
+        if iheap['size'] > 0:
+            return iheap['priority'][iheap['heap'][1]]
         return None
     except Exception as exp:
-        error.reraise(exp, 'indexheap:delMin')
+        error.reraise(exp, 'indexheap:min_priority')
 
 
-def decreaseKey(iheap, key, newindex):
+def priority_of(iheap, key):
     """
-    Decrementa el indice de un llave
+    Retorna la prioridad de la llave key, o None si no está en el heap
+    """
+    try:
+        if not contains(iheap, key):
+            return None
+        return iheap['priority'][key]
+    except Exception as exp:
+        error.reraise(exp, 'indexheap:priority_of')
+
+
+def del_min(iheap):
+    """
+    Retorna la llave con menor indice y la elimina.
+    Se reemplaza con el último elemento y se hace sink.
 
     Args:
         iheap: El heap a revisar
-        key: la llave a decrementar
-        newindex: El nuevo indice de la llave
     Returns:
-       El numero de elementos
+       La llave asociada al menor indice
     Raises:
         Exception
     """
     try:
-        val = map.get(iheap['qpMap'], key)
-        elem = lt.getElement(iheap['elements'], val['value'])
-        elem['index'] = newindex
-        lt.changeInfo(iheap['elements'], val['value'], elem)
-        swim(iheap, val['value'])
-        return iheap
+        size = iheap['size']
+        if size > 0:
+            heap = iheap['heap']
+            min_key = heap[1]
+            last = heap[size]
+            iheap['size'] = size - 1
+            iheap['qp'][min_key] = -1
+            if size > 1:
+                _sink(iheap, 1, last)
+            return min_key
+        return None
     except Exception as exp:
-        error.reraise(exp, 'indexheap:decreaseKey')
+        error.reraise(exp, 'indexheap:del_min')
 
 
-def increaseKey(iheap, key, newindex):
+def decrease_key(iheap, key, newindex):
     """
-    Incrementa el indice de un llave
+    Decrementa el indice de un llave
 
     Args:
         iheap: El heap a revisar
-        key: la llave a incrementar
+        key: la llave a decrementar
         newindex: El nuevo indice de la llave
     Returns:
-       El numero de elementos
+       El heap
     Raises:
         Exception
     """
     try:
-        val = map.get(iheap['qpMap'], key)
-        elem = lt.getElement(iheap['elements'], val['value'])
-        elem['index'] = newindex
-        lt.changeInfo(iheap['elements'], val['value'], elem)
-        sink(iheap, val['value'])
+        if not contains(iheap, key):
+            raise KeyError(key)
+        iheap['priority'][key] = newindex
+        _swim(iheap, iheap['qp'][key], key)
         return iheap
     except Exception as exp:
-        error.reraise(exp, 'indexheap:increaseKey')
-
-
-#  ---------------------------------------------------------
-#   Funciones Helper
-#  ---------------------------------------------------------
+        error.reraise(exp, 'indexheap:decrease_key')
 
 
-def exchange(iheap, i, j):
+def increase_key(iheap, key, newindex):
     """
-    Intercambia los elementos en las posiciones i y j del heap
-    """
-    try:
-        element_i = lt.getElement(iheap['elements'], i)
-        element_j = lt.getElement(iheap['elements'], j)
-        lt.changeInfo(iheap['elements'], i, element_j)
-        map.put(iheap['qpMap'], element_i['key'], j)
-        lt.changeInfo(iheap['elements'], j, element_i)
-        map.put(iheap['qpMap'], element_j['key'], i)
-    except Exception as exp:
-        error.reraise(exp, 'indexheap:exchange')
-
+    Incrementa el indice de un llave
 
-def greater(iheap, parent, element):
-    """
-    Indica si el index de parent es mayor
-    que index de element
+    Args:
+        iheap: El heap a revisar
+        key: la llave a incrementar
+        newindex: El nuevo indice de la llave
+    Returns:
+       El heap
+    Raises:
+        Exception
     """
     try:
-        return parent['index'] > element['index']
+        if not contains(iheap, key):
+            raise KeyError(key)
+        iheap['priority'][key] = newindex
+        _sink(iheap, iheap['qp'][key], key)
+        return iheap
     except Exception as exp:
-        error.reraise(exp, 'indexheap:greater')
+        error.reraise(exp, 'indexheap:increase_key')
 
 
-def swim(iheap, pos):
+def clear(iheap):
     """
-    Deja en el lugar indicado un elemento adicionado
-    en la última posición
+    Vacía el heap en O(tamaño), conservando la capacidad
 
     Args:
-        heap: El arreglo con la informacion
-        pos: posicion en el arreglo a revisar
-
+        iheap: El heap a vaciar
     Returns:
-        El arreglo en forma de heap
-    Raises:
-        Exception
+       El heap
     """
     try:
-        while (pos > 1):
-            posparent = int((pos/2))
-            poselement = int(pos)
-            parent = lt.getElement(iheap['elements'], posparent)
-            element = lt.getElement(iheap['elements'], poselement)
-            if greater(iheap, parent, element):
-                exchange(iheap, posparent, poselement)
-            pos = (pos//2)
+        heap, qp = iheap['heap'], iheap['qp']
+        for pos in range(1, iheap['size'] + 1):
+            qp[heap[pos]] = -1
+        iheap['size'] = 0
+        return iheap
     except Exception as exp:
-        error.reraise(exp, 'indexheap:swim')
+        error.reraise(exp, 'indexheap:clear')
 
 
-def sink(iheap, pos):
-    """
-    Deja en la posición correcta un elemento ubicado en la raíz del heap
+#  ---------------------------------------------------------
+#   Funciones Helper
+#  ---------------------------------------------------------
 
-    Args:
-        heap: El arreglo con la informacion
-        pos: posicion en el arreglo a revisar
 
-    Returns:
-        El arreglo en forma de heap
-    Raises:
-        Exception
+def _swim(iheap, pos, key):
     """
-    try:
-        size = iheap['size']
-        while ((2*pos <= size)):
-            j = 2*pos
-            if (j < size):
-                if greater(iheap, lt.getElement(iheap['elements'], j),
-                           lt.getElement(iheap['elements'], (j+1))):
-                    j += 1
-            if (not greater(iheap, lt.getElement(iheap['elements'], pos),
-                            lt.getElement(iheap['elements'], j))):
-                break
-            exchange(iheap, pos, j)
-            pos = j
-    except Exception as exp:
-        error.reraise(exp, 'indexheap:sink')
+    Sube la llave key desde la posición pos hasta su lugar. En lugar de
+    intercambiar pares, corre los padres hacia abajo y escribe key una
+    sola vez en el hueco final
+    """
+    heap, qp, priority = iheap['heap'], iheap['qp'], iheap['priority']
+    value = priority[key]
+    while pos > 1:
+        parent_pos = pos >> 1
+        parent = heap[parent_pos]
+        if priority[parent] <= value:
+            break
+        heap[pos] = parent
+        qp[parent] = pos
+        pos = parent_pos
+    heap[pos] = key
+    qp[key] = pos
+
+
+def _sink(iheap, pos, key):
+    """
+    Baja la llave key desde la posición pos hasta su lugar, subiendo el
+    hijo menor en cada nivel y escribiendo key una sola vez al final
+    """
+    heap, qp, priority = iheap['heap'], iheap['qp'], iheap['priority']
+    size = iheap['size']
+    value = priority[key]
+    child_pos = pos << 1
+    while child_pos <= size:
+        child = heap[child_pos]
+        if child_pos < size:
+            right = heap[child_pos + 1]
+            if priority[right] < priority[child]:
+                child_pos += 1
+                child = right
+        if value <= priority[child]:
+            break
+        heap[pos] = child
+        qp[child] = pos
+        pos = child_pos
+        child_pos = pos << 1
+    heap[pos] = key
+    qp[key] = pos
+
+
+def _ensure_capacity(iheap, num_keys):
+    """
+    Extiende los arreglos (al menos al doble) para llaves 0..num_keys-1
+    """
+    capacity = len(iheap['qp'])
+    missing = max(num_keys, 2 * capacity) - capacity
+    iheap['heap'].extend(array('q', [0]) * missing)
+    iheap['qp'].extend(array('q', [-1]) * missing)
+    iheap['priority'].extend(array('d', [math.inf]) * missing)
@@ -24,9 +24,7 @@
  """
 
 
-import config
-from DISClib.DataStructures import indexheap as h
-assert config
+from DataStructures.Priority_queue import indexheap as h
 
 """
 Implementación de una cola de prioridad indexada orientada a menor
@@ -37,21 +35,22 @@ Algorithms, 4th Edition
 """
 
 
-def newIndexMinPQ(cmpfunction):
+def new_index_minpq(cmpfunction=None, size=10):
     """
     Crea un cola de prioridad indexada orientada a menor
 
     Args:
         cmpfunction: La funcion de comparacion
+        size: El numero de elementos esperado
     Returns:
        Una nueva cola de prioridad indexada
     Raises:
         Exception
     """
-    return h.newIndexHeap(cmpfunction)
+    return h.new_index_heap(cmpfunction, size)
 
 
-def isEmpty(iminpq):
+def is_empty(iminpq):
     """
     Informa si una cola de prioridad indexada es vacia
 
@@ -62,7 +61,7 @@ def isEmpty(iminpq):
     Raises:
         Exception
     """
-    return(h.isEmpty(iminpq))
+    return(h.is_empty(iminpq))
 
 
 def size(iminpq):
@@ -93,7 +92,7 @@ def insert(iminpq, key, index):
     return h.insert(iminpq, key, index)
 
 
-def delMin(iminpq):
+def del_min(iminpq):
     """
     Elimina el elemento de mayor prioridad
 
@@ -104,10 +103,10 @@ def delMin(iminpq):
     Raises:
         Exception
     """
-    return (h.delMin(iminpq))
+    return (h.del_min(iminpq))
 
 
-def decreaseKey(iminpq, key, newindex):
+def decrease_key(iminpq, key, newindex):
     """
     Decrementa el indice de un llave
 
@@ -120,10 +119,10 @@ def decreaseKey(iminpq, key, newindex):
     Raises:
         Exception
     """
-    return h.decreaseKey(iminpq, key, newindex)
+    return h.decrease_key(iminpq, key, newindex)
 
 
-def increaseKey(iminpq, key, newindex):
+def increase_key(iminpq, key, newindex):
     """
     Incrementa el indice de un llave
 
@@ -136,7 +135,7 @@ def increaseKey(iminpq, key, newindex):
     Raises:
         Exception
     """
-    return h.increaseKey(iminpq, key, newindex)
+    return h.increase_key(iminpq, key, newindex)
 
 
 def min(iminpq):
@@ -165,3 +164,35 @@ def contains(iminpq, element):
         Exception
     """
     return h.contains(iminpq, element)
+
+
+def min_priority(iminpq):
+    """
+    Retorna la prioridad de la llave de mayor prioridad (la menor)
+
+    Args:
+        iminpq: La cola de prioridad indexada a revisar
+    Returns:
+       La menor prioridad, o None si la cola está vacía
+    """
+    return h.min_priority(iminpq)
+
+
+def priority_of(iminpq, key):
+    """
+    Retorna la prioridad de la llave key, o None si no está en la cola
+    """
+    return h.priority_of(iminpq, key)
+
+
+def clear(iminpq):
+    """
+    Vacía la cola conservando su capacidad, para reutilizarla entre
+    búsquedas
+
+    Args:
+        iminpq: La cola de prioridad indexada
+    Returns:
+       La cola vacía
+    """
+    return h.clear(iminpq)
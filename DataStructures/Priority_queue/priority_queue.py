@@ -5,6 +5,7 @@ This module implements a priority queue that matches the test requirements.
 """
 
 # import python modules
+import heapq
 from typing import Any, Callable
 
 # import modules for data structures
@@ -31,25 +32,32 @@ def dflt_heap_elm_cmp(id1: Any, id2: Any) -> int:
     return 0
 
 
-def new_heap(cmp_function: Callable[[Any, Any], int] = None) -> dict:
+def new_heap(cmp_function: Callable[[Any, Any], int] = None, arity: int = 2) -> dict:
     """new_heap creates a new heap for the priority queue.
 
     Args:
         cmp_function (Callable[[Any, Any], int]): comparison function for elements in the heap.
                                                 By default, it is None, in which case the default
                                                 comparison function (dflt_heap_elm_cmp) is used.
+        arity (int): number of children of each node (2 or more). The children of index i
+                     are arity * i + 1 .. arity * i + arity. A wider heap is shallower, so
+                     inserts compare with fewer ancestors while removals compare more
+                     children per level.
 
     Returns:
         dict: dictionary representing the heap with the following fields:
             - elements: list of elements in the heap.
             - size: size of the heap.
             - cmp_function: comparison function for elements in the heap.
+            - arity: number of children of each node.
     """
+    _check_arity(arity)
     try:
         _heap = {
             "elements": None,
             "size": 0,
-            "cmp_function": cmp_function
+            "cmp_function": cmp_function,
+            "arity": arity
         }
         if cmp_function is None:
             _heap["cmp_function"] = dflt_heap_elm_cmp
@@ -61,6 +69,43 @@ def new_heap(cmp_function: Callable[[Any, Any], int] = None) -> dict:
         error.error_handler("minpq", "new_heap()", exp)
 
 
+def new_key_heap(key_function: Callable[[Any], Any] = None, arity: int = 2) -> dict:
+    """new_key_heap creates a new heap that orders its elements by key_function(key).
+
+    The priority key_function(key) is computed once per insert and stored next to the
+    entry as a (priority, sequence, entry) tuple, so the heap compares plain numbers or
+    tuples natively with heapq instead of calling a comparison function. The sequence
+    number breaks ties in insertion order. The rest of the API (insert, remove,
+    get_first_priority...) is the same as with new_heap.
+
+    Args:
+        key_function (Callable[[Any], Any]): function that maps a key to its priority,
+                                           for example operator.itemgetter('distance').
+                                           By default, the key itself is the priority.
+                                           It must be picklable if the heap is saved.
+        arity (int): number of children of each node, as in new_heap. Binary heaps
+                     use heapq; wider heaps use the module's own sift functions.
+
+    Returns:
+        dict: dictionary representing the heap, with the fields of new_heap plus:
+            - key_function: the priority function.
+            - sequence: next sequence number.
+    """
+    _check_arity(arity)
+    try:
+        _heap = {
+            "elements": arlt.new_list(),
+            "size": 0,
+            "cmp_function": None,
+            "arity": arity,
+            "key_function": key_function if key_function is not None else _identity,
+            "sequence": 0
+        }
+        return _heap
+    except Exception as exp:
+        error.error_handler("minpq", "new_key_heap()", exp)
+
+
 def size(heap: dict) -> int:
     """size returns the number of elements in the heap.
 
@@ -105,6 +150,9 @@ def insert(heap: dict, key: Any, value: Any) -> None:
             "key": key,
             "value": value
         }
+        if _is_key_heap(heap):
+            _push(heap, entry)
+            return
         # Add entry to the heap
         arlt.add_last(heap["elements"], entry)
         # Update size
@@ -115,6 +163,124 @@ def insert(heap: dict, key: Any, value: Any) -> None:
         error.error_handler("minpq", "insert()", exp)
 
 
+def insert_all(heap: dict, entries: list) -> None:
+    """insert_all inserts a batch of (key, value) pairs in the heap.
+
+    If the batch is at least as large as the heap, the entries are appended and the
+    whole heap is rebuilt bottom-up in O(n + k); otherwise each entry swims up in
+    O(log n).
+
+    Args:
+        heap (dict): dictionary representing the heap.
+        entries (list): (key, value) pairs to insert, in insertion order.
+    """
+    try:
+        elements = heap["elements"]
+        rebuild = len(entries) >= heap["size"]
+        if _is_key_heap(heap):
+            if rebuild:
+                _extend(heap, entries)
+                heap["size"] = elements["size"] = len(elements["elements"])
+                _heapify(heap)
+            else:
+                for key, value in entries:
+                    _push(heap, {"key": key, "value": value})
+            return
+        for key, value in entries:
+            arlt.add_last(elements, {"key": key, "value": value})
+            heap["size"] += 1
+            if not rebuild:
+                _swim(heap, heap["size"] - 1)
+        if rebuild:
+            _heapify(heap)
+    except Exception as exp:
+        error.error_handler("minpq", "insert_all()", exp)
+
+
+def build_heap(entries, cmp_function: Callable[[Any, Any], int] = None,
+               key_function: Callable[[Any], Any] = None, arity: int = 2,
+               first_sequence: int = 0) -> dict:
+    """build_heap creates a heap with all the (key, value) pairs of entries at once.
+
+    The entries are stored in the given order and the heap property is restored
+    bottom-up (Floyd's method): every internal node, from the last one to the root,
+    sinks into its subtree. This costs O(n) comparisons instead of the O(n log n)
+    of n separate inserts.
+
+    Args:
+        entries (Iterable): (key, value) pairs.
+        cmp_function (Callable[[Any, Any], int]): comparison function for the keys,
+                                                as in new_heap.
+        key_function (Callable[[Any], Any]): if given, the heap is created with
+                                           new_key_heap(key_function) instead, and
+                                           cmp_function is ignored.
+        arity (int): number of children of each node, as in new_heap.
+        first_sequence (int): with key_function, sequence number of the first entry.
+                              Heaps built from consecutive parts of a sequence of
+                              entries, each starting past the numbers used by the
+                              previous parts, can be joined with merge and still break
+                              ties in the order of the whole sequence.
+
+    Returns:
+        dict: the new heap.
+    """
+    try:
+        if key_function is not None:
+            heap = new_key_heap(key_function, arity)
+            heap["sequence"] = first_sequence
+            _extend(heap, entries)
+            heap["size"] = heap["elements"]["size"] = len(heap["elements"]["elements"])
+            _heapify(heap)
+            return heap
+        heap = new_heap(cmp_function, arity)
+        elements = heap["elements"]
+        for key, value in entries:
+            arlt.add_last(elements, {"key": key, "value": value})
+        heap["size"] = arlt.size(elements)
+        _heapify(heap)
+        return heap
+    except Exception as exp:
+        error.reraise(exp, 'minpq:build_heap')
+
+
+def merge(heap: dict, others: list) -> None:
+    """merge moves all the entries of the heaps in others into heap and rebuilds it
+    bottom-up in O(n), without computing the priorities again.
+
+    The heaps must be of the same kind as heap (new_heap with the same comparison
+    function, or new_key_heap with the same key function) and must not be used
+    afterwards. In key heaps, entries with equal priority keep breaking ties by their
+    sequence numbers, so heaps built with build_heap(first_sequence=...) from
+    consecutive parts of a sequence come out in the order of the whole sequence. If
+    heap is not empty, the entries of others are renumbered after its own, so they
+    come out after its entries with the same priority.
+
+    Args:
+        heap (dict): dictionary representing the heap that receives the entries.
+        others (list): heaps whose entries are moved.
+    """
+    try:
+        items = heap["elements"]["elements"]
+        if _is_key_heap(heap):
+            shift = heap["sequence"] if heap["size"] > 0 else 0
+            sequence = heap["sequence"]
+            for other in others:
+                other_items = other["elements"]["elements"][:other["size"]]
+                if shift:
+                    other_items = [(priority, shift + number, entry)
+                                   for priority, number, entry in other_items]
+                items.extend(other_items)
+                sequence = max(sequence, shift + other["sequence"])
+            heap["sequence"] = sequence
+        else:
+            for other in others:
+                items.extend(other["elements"]["elements"][:other["size"]])
+        heap["size"] = heap["elements"]["size"] = len(items)
+        _heapify(heap)
+    except Exception as exp:
+        error.reraise(exp, 'minpq:merge')
+
+
 def get_first_priority(heap: dict) -> Any:
     """get_first_priority returns the key of the first element in the heap (the minimum).
 
@@ -130,6 +296,8 @@ def get_first_priority(heap: dict) -> Any:
 
         # Get the first element (minimum)
         first_element = arlt.get_element(heap["elements"], 0)
+        if _is_key_heap(heap):
+            return first_element[2]["key"]
         return first_element["key"]
     except Exception as exp:
         error.reraise(exp, 'minpq:get_first_priority')
@@ -145,46 +313,186 @@ def remove(heap: dict) -> Any:
         Any: key of the first element in the heap.
     """
     try:
-        if heap["size"] == 0:
+        first_element = _remove_first(heap)
+        if first_element is None:
             return None
-
-        # Get the first element (minimum)
-        first_element = arlt.get_element(heap["elements"], 0)
-        # Get the last element
-        last_element = arlt.get_element(heap["elements"], heap["size"] - 1)
-        # Replace the first element with the last
-        arlt.update(heap["elements"], 0, last_element)
-        # Remove the last element
-        arlt.update(heap["elements"], heap["size"] - 1, None)
-        # Update size
-        heap["size"] -= 1
-        # Maintain heap property
-        _sink(heap, 0)
-        # Return the key of the removed element
         return first_element["key"]
     except Exception as exp:
         error.reraise(exp, 'minpq:remove')
 
 
+def remove_value(heap: dict) -> Any:
+    """remove_value removes the first element (minimum) in the heap and returns its value.
+
+    Args:
+        heap (dict): dictionary representing the heap.
+
+    Returns:
+        Any: value of the first element in the heap.
+    """
+    try:
+        first_element = _remove_first(heap)
+        if first_element is None:
+            return None
+        return first_element["value"]
+    except Exception as exp:
+        error.reraise(exp, 'minpq:remove_value')
+
+
+def copy(heap: dict) -> dict:
+    """copy returns a new heap with the same elements, in O(n) and without comparisons.
+    The entries are shared, so removing from either heap does not affect the other.
+
+    Args:
+        heap (dict): dictionary representing the heap.
+
+    Returns:
+        dict: the new heap.
+    """
+    try:
+        if _is_key_heap(heap):
+            _copy = new_key_heap(heap["key_function"], heap["arity"])
+            _copy["sequence"] = heap["sequence"]
+        else:
+            _copy = new_heap(heap["cmp_function"], heap["arity"])
+        elements = _copy["elements"]
+        for entry in heap["elements"]["elements"][:heap["size"]]:
+            arlt.add_last(elements, entry)
+        _copy["size"] = heap["size"]
+        return _copy
+    except Exception as exp:
+        error.reraise(exp, 'minpq:copy')
+
+
+def _remove_first(heap: dict) -> dict:
+    """_remove_first removes the first element (minimum) in the heap and returns its entry.
+
+    Args:
+        heap (dict): dictionary representing the heap.
+
+    Returns:
+        dict: entry of the first element, with its key and value, or None if the heap is empty.
+    """
+    if heap["size"] == 0:
+        return None
+    if _is_key_heap(heap):
+        heap["size"] -= 1
+        heap["elements"]["size"] -= 1
+        items = heap["elements"]["elements"]
+        if heap["arity"] == 2:
+            return heapq.heappop(items)[2]
+        first_item = items[0]
+        last_item = items.pop()
+        if items:
+            items[0] = last_item
+            _sink_items(items, 0, heap["arity"])
+        return first_item[2]
+
+    # Get the first element (minimum)
+    first_element = arlt.get_element(heap["elements"], 0)
+    # Get the last element
+    last_element = arlt.get_element(heap["elements"], heap["size"] - 1)
+    # Replace the first element with the last
+    arlt.update(heap["elements"], 0, last_element)
+    # Remove the last element
+    arlt.remove_last(heap["elements"])
+    # Update size
+    heap["size"] -= 1
+    # Maintain heap property
+    _sink(heap, 0)
+    return first_element
+
+
+def _identity(key: Any) -> Any:
+    """_identity is the default priority function of new_key_heap: the key itself.
+    """
+    return key
+
+
+def _is_key_heap(heap: dict) -> bool:
+    """_is_key_heap indicates if the heap was created with new_key_heap.
+    """
+    return heap.get("key_function") is not None
+
+
+def _push(heap: dict, entry: dict) -> None:
+    """_push adds an entry to a heap created with new_key_heap.
+    """
+    item = (heap["key_function"](entry["key"]), heap["sequence"], entry)
+    heap["sequence"] += 1
+    items = heap["elements"]["elements"]
+    if heap["arity"] == 2:
+        heapq.heappush(items, item)
+    else:
+        items.append(item)
+        _swim_items(items, len(items) - 1, heap["arity"])
+    heap["elements"]["size"] += 1
+    heap["size"] += 1
+
+
+def _extend(heap: dict, entries) -> None:
+    """_extend appends (key, value) pairs at the end of a heap created with
+    new_key_heap, without restoring the heap property.
+    """
+    items = heap["elements"]["elements"]
+    key_function = heap["key_function"]
+    sequence = heap["sequence"]
+    for key, value in entries:
+        items.append((key_function(key), sequence, {"key": key, "value": value}))
+        sequence += 1
+    heap["sequence"] = sequence
+
+
+def _check_arity(arity: int) -> None:
+    """_check_arity raises ValueError if arity is not a valid number of children.
+    """
+    if not isinstance(arity, int) or arity < 2:
+        raise ValueError(f"arity must be an integer >= 2, not {arity!r}")
+
+
+def _heapify(heap: dict) -> None:
+    """_heapify restores the heap property of the whole heap bottom-up, in O(n).
+
+    Args:
+        heap (dict): dictionary representing the heap.
+    """
+    last_parent = (heap["size"] - 2) // heap["arity"]
+    if _is_key_heap(heap):
+        items = heap["elements"]["elements"]
+        if heap["arity"] == 2:
+            heapq.heapify(items)
+            return
+        for idx in range(last_parent, -1, -1):
+            _sink_items(items, idx, heap["arity"])
+        return
+    for idx in range(last_parent, -1, -1):
+        _sink(heap, idx)
+
+
 def _swim(heap: dict, idx: int) -> None:
     """_swim makes the element at the specified index swim up the heap to maintain the heap property.
 
+    Parents greater than the element move down into the hole, and the element is written
+    once at its final index.
+
     Args:
         heap (dict): dictionary representing the heap.
         idx (int): index of the element to swim up.
     """
     try:
+        elements = heap["elements"]["elements"]
+        cmp_function = heap["cmp_function"]
+        arity = heap["arity"]
+        entry = elements[idx]
         while idx > 0:
-            parent_idx = (idx - 1) // 2
-            parent = arlt.get_element(heap["elements"], parent_idx)
-            element = arlt.get_element(heap["elements"], idx)
-            
-            # If parent is greater than element, swap them
-            if heap["cmp_function"](parent["key"], element["key"]) > 0:
-                arlt.exchange(heap["elements"], idx, parent_idx)
-                idx = parent_idx
-            else:
+            parent_idx = (idx - 1) // arity
+            parent = elements[parent_idx]
+            # If parent is greater than element, move it down
+            if cmp_function(parent["key"], entry["key"]) <= 0:
                 break
+            elements[idx] = parent
+            idx = parent_idx
+        elements[idx] = entry
     except Exception as exp:
         error.error_handler("minpq", "_swim()", exp)
 
@@ -192,34 +500,89 @@ def _swim(heap: dict, idx: int) -> None:
 def _sink(heap: dict, idx: int) -> None:
     """_sink makes the element at the specified index sink down the heap to maintain the heap property.
 
+    At each level the smallest of the (up to arity) children moves up into the hole if it
+    is smaller than the element, which is written once at its final index. Binary heaps
+    compare the two children directly instead of looping over them.
+
     Args:
         heap (dict): dictionary representing the heap.
         idx (int): index of the element to sink down.
     """
     try:
-        while True:
-            left_idx = 2 * idx + 1
-            right_idx = 2 * idx + 2
-            smallest = idx
-            
-            # Find the smallest among the node and its children
-            if left_idx < heap["size"]:
-                left = arlt.get_element(heap["elements"], left_idx)
-                current = arlt.get_element(heap["elements"], smallest)
-                if heap["cmp_function"](current["key"], left["key"]) > 0:
-                    smallest = left_idx
-                    
-            if right_idx < heap["size"]:
-                right = arlt.get_element(heap["elements"], right_idx)
-                current = arlt.get_element(heap["elements"], smallest)
-                if heap["cmp_function"](current["key"], right["key"]) > 0:
-                    smallest = right_idx
-                    
-            # If the smallest is not the current node, swap them
-            if smallest != idx:
-                arlt.exchange(heap["elements"], idx, smallest)
-                idx = smallest
-            else:
+        elements = heap["elements"]["elements"]
+        cmp_function = heap["cmp_function"]
+        arity = heap["arity"]
+        size = heap["size"]
+        if idx >= size:
+            return
+        entry = elements[idx]
+        if arity == 2:
+            key = entry["key"]
+            child_idx = 2 * idx + 1
+            while child_idx < size:
+                child = elements[child_idx]
+                right_idx = child_idx + 1
+                if right_idx < size and cmp_function(child["key"], elements[right_idx]["key"]) > 0:
+                    child_idx = right_idx
+                    child = elements[right_idx]
+                if cmp_function(key, child["key"]) <= 0:
+                    break
+                elements[idx] = child
+                idx = child_idx
+                child_idx = 2 * idx + 1
+            elements[idx] = entry
+            return
+        first = arity * idx + 1
+        while first < size:
+            # Find the smallest among the children
+            smallest = first
+            smallest_key = elements[first]["key"]
+            for child_idx in range(first + 1, min(first + arity, size)):
+                child_key = elements[child_idx]["key"]
+                if cmp_function(smallest_key, child_key) > 0:
+                    smallest, smallest_key = child_idx, child_key
+            # If the smallest child is not smaller than the element, stop
+            if cmp_function(entry["key"], smallest_key) <= 0:
                 break
+            elements[idx] = elements[smallest]
+            idx = smallest
+            first = arity * idx + 1
+        elements[idx] = entry
     except Exception as exp:
-        error.error_handler("minpq", "_sink()", exp)
\ No newline at end of file
+        error.error_handler("minpq", "_sink()", exp)
+
+
+def _swim_items(items: list, idx: int, arity: int) -> None:
+    """_swim_items is _swim for the (priority, sequence, entry) items of a heap created
+    with new_key_heap, comparing the items natively.
+    """
+    item = items[idx]
+    while idx > 0:
+        parent_idx = (idx - 1) // arity
+        parent = items[parent_idx]
+        if not item < parent:
+            break
+        items[idx] = parent
+        idx = parent_idx
+    items[idx] = item
+
+
+def _sink_items(items: list, idx: int, arity: int) -> None:
+    """_sink_items is _sink for the (priority, sequence, entry) items of a heap created
+    with new_key_heap, comparing the items natively.
+    """
+    size = len(items)
+    item = items[idx]
+    first = arity * idx + 1
+    while first < size:
+        smallest = first
+        smallest_item = items[first]
+        for child_idx in range(first + 1, min(first + arity, size)):
+            if items[child_idx] < smallest_item:
+                smallest, smallest_item = child_idx, items[child_idx]
+        if not smallest_item < item:
+            break
+        items[idx] = smallest_item
+        idx = smallest
+        first = arity * idx + 1
+    items[idx] = item